@@ -0,0 +1,343 @@
+"""Long-running local HTTP service that keeps the report pipeline warm between requests."""
+# ruff: noqa: E402
+
+from __future__ import annotations
+
+import argparse
+import ipaddress
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+REPO_ROOT = Path(__file__).resolve().parent
+for import_dir in (REPO_ROOT, REPO_ROOT / "src"):
+    if str(import_dir) not in sys.path:
+        sys.path.insert(0, str(import_dir))
+
+from pokecoach.llm_provider import load_runtime_config
+from pokecoach.report import ReportOptions, drain_shadow_audits, generate_post_game_report
+from run_report import (
+    _add_runtime_arguments,
+    _init_batch_worker,
+    _percentile,
+    _report_options,
+    _serialize_report,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BODY_BYTES = 8 * 1024 * 1024
+_LATENCY_WINDOW = 1024
+_CONTENT_TYPES = {"json": "application/json; charset=utf-8", "md": "text/markdown; charset=utf-8"}
+
+
+def _init_server_worker() -> None:
+    # Ctrl-C reaches the whole process group; only the server process decides when to stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_batch_worker()
+    # Read the environment (and `.env`) once per worker instead of on its first request.
+    load_runtime_config()
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _start_worker_pool(workers: int) -> ProcessPoolExecutor:
+    """Start a pool and every worker in it, so the first requests do not pay for imports."""
+    executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_server_worker)
+    for future in [executor.submit(_worker_ready) for _ in range(workers)]:
+        future.result()
+    return executor
+
+
+def _render_report(log_text: str, output_format: str, options: ReportOptions) -> str:
+    """Worker task: generate one report and serialize it like `run_report.py` does."""
+    return _serialize_report(generate_post_game_report(log_text, options), output_format)
+
+
+class ServerMetrics:
+    """Request counters and a window of recent report latencies, shared by the handler threads."""
+
+    def __init__(self, workers: int) -> None:
+        self.workers = workers
+        self.started_at = time.monotonic()
+        self.requests_total = 0
+        self.reports_ok = 0
+        self.reports_failed = 0
+        self.in_flight = 0
+        self.executor_restarts = 0
+        self._latencies_ms: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def report_started(self) -> None:
+        with self._lock:
+            self.requests_total += 1
+            self.in_flight += 1
+
+    def report_finished(self, *, ok: bool, latency_ms: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if ok:
+                self.reports_ok += 1
+            else:
+                self.reports_failed += 1
+            self._latencies_ms.append(latency_ms)
+
+    def executor_restarted(self) -> None:
+        with self._lock:
+            self.executor_restarts += 1
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            ordered = sorted(self._latencies_ms)
+            return {
+                "uptime_s": round(time.monotonic() - self.started_at, 3),
+                "workers": self.workers,
+                "requests_total": self.requests_total,
+                "reports_ok": self.reports_ok,
+                "reports_failed": self.reports_failed,
+                "in_flight": self.in_flight,
+                "executor_restarts": self.executor_restarts,
+                "latency_ms": {
+                    "window": len(ordered),
+                    "p50": _percentile(ordered, 0.50),
+                    "p90": _percentile(ordered, 0.90),
+                    "p99": _percentile(ordered, 0.99),
+                    "max": _percentile(ordered, 1.0),
+                },
+            }
+
+
+class ReportServer(ThreadingHTTPServer):
+    """HTTP front end: handler threads parse requests, the executor's warm workers build the reports.
+
+    A worker that dies (crash, OOM kill) breaks a process pool for good. With `executor_factory` the broken
+    executor is replaced by a fresh one; without it the server stays up but reports itself unhealthy.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        executor: Executor,
+        *,
+        workers: int,
+        options: ReportOptions,
+        max_body_bytes: int = DEFAULT_MAX_BODY_BYTES,
+        executor_factory: Callable[[], Executor] | None = None,
+    ) -> None:
+        super().__init__(address, ReportRequestHandler)
+        self.executor = executor
+        self.executor_broken = False
+        self.options = options
+        self.metrics = ServerMetrics(workers)
+        self.max_body_bytes = max_body_bytes
+        self._executor_factory = executor_factory
+        self._executor_lock = threading.Lock()
+
+    def replace_broken_executor(self, broken: Executor) -> bool:
+        """Swap `broken` for a fresh executor; return whether a working executor is in place afterwards."""
+        with self._executor_lock:
+            if self.executor is not broken:
+                # Another handler thread already replaced it.
+                return not self.executor_broken
+            if self._executor_factory is None:
+                self.executor_broken = True
+                return False
+            broken.shutdown(wait=False, cancel_futures=True)
+            try:
+                self.executor = self._executor_factory()
+            except Exception:  # noqa: BLE001
+                self.executor_broken = True
+                return False
+            self.executor_broken = False
+            self.metrics.executor_restarted()
+            return True
+
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """`POST /report?format=json|md` with the raw log as body; `GET /healthz` and `GET /metrics`."""
+
+    server: ReportServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/healthz":
+            if self.server.executor_broken:
+                self._send_json(HTTPStatus.SERVICE_UNAVAILABLE, {"status": "broken", "workers": 0})
+            else:
+                self._send_json(HTTPStatus.OK, {"status": "ok", "workers": self.server.metrics.workers})
+        elif path == "/metrics":
+            self._send_json(HTTPStatus.OK, self.server.metrics.snapshot())
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"unknown path: {path}")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/report":
+            self._send_error(HTTPStatus.NOT_FOUND, f"unknown path: {url.path}")
+            return
+        output_format = parse_qs(url.query).get("format", ["json"])[-1]
+        if output_format not in _CONTENT_TYPES:
+            self._send_error(HTTPStatus.BAD_REQUEST, f"unsupported format: {output_format} (use json or md)")
+            return
+        log_text = self._read_log_body()
+        if log_text is None:
+            return
+
+        self.server.metrics.report_started()
+        started = time.perf_counter()
+        executor = self.server.executor
+        try:
+            rendered = executor.submit(_render_report, log_text, output_format, self.server.options).result()
+        except BrokenExecutor as exc:
+            # Not retried: the log that was being rendered may be what killed the worker.
+            self.server.metrics.report_finished(ok=False, latency_ms=_elapsed_ms(started))
+            restarted = self.server.replace_broken_executor(executor)
+            detail = "workers restarted, retry the request" if restarted else "no workers available"
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, f"{type(exc).__name__}: {detail}")
+            return
+        except Exception as exc:  # noqa: BLE001
+            self.server.metrics.report_finished(ok=False, latency_ms=_elapsed_ms(started))
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(exc).__name__}: {exc}")
+            return
+        self.server.metrics.report_finished(ok=True, latency_ms=_elapsed_ms(started))
+        self._send(HTTPStatus.OK, rendered.encode("utf-8"), _CONTENT_TYPES[output_format])
+
+    def log_message(self, format: str, *args: object) -> None:
+        # Keep stderr for errors; per-request access logs would dominate it under load.
+        return
+
+    def _read_log_body(self) -> str | None:
+        length_header = self.headers.get("Content-Length")
+        if length_header is None:
+            self._send_error(HTTPStatus.LENGTH_REQUIRED, "Content-Length is required")
+            return None
+        try:
+            length = int(length_header)
+        except ValueError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+            return None
+        if length < 0:
+            self._send_error(HTTPStatus.BAD_REQUEST, "invalid Content-Length")
+            return None
+        if length > self.server.max_body_bytes:
+            self.close_connection = True
+            self._send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"log exceeds {self.server.max_body_bytes} bytes")
+            return None
+        try:
+            log_text = self.rfile.read(length).decode("utf-8")
+        except UnicodeDecodeError:
+            self._send_error(HTTPStatus.BAD_REQUEST, "log body must be UTF-8 text")
+            return None
+        if not log_text.strip():
+            self._send_error(HTTPStatus.BAD_REQUEST, "log body is empty")
+            return None
+        return log_text
+
+    def _send(self, status: HTTPStatus, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: HTTPStatus, payload: dict[str, object]) -> None:
+        self._send(status, (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8"), _CONTENT_TYPES["json"])
+
+    def _send_error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="report_server.py",
+        description="Serve PokeCoach post-game reports over local HTTP with a warm worker pool.",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST}, loopback only).")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Bind port (default: {DEFAULT_PORT}).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Report worker processes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--max-body-bytes",
+        type=int,
+        default=DEFAULT_MAX_BODY_BYTES,
+        help=f"Reject logs larger than this many bytes (default: {DEFAULT_MAX_BODY_BYTES}).",
+    )
+    _add_runtime_arguments(parser)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    if workers < 1:
+        parser.error("--workers must be >= 1")
+    if not _is_loopback(args.host):
+        print(f"warning: serving on non-loopback address {args.host}; reports are unauthenticated", file=sys.stderr)
+
+    options = _report_options(args)
+    executor = _start_worker_pool(workers)
+    try:
+        server = ReportServer(
+            (args.host, args.port),
+            executor,
+            workers=workers,
+            options=options,
+            max_body_bytes=args.max_body_bytes,
+            executor_factory=lambda: _start_worker_pool(workers),
+        )
+    except OSError as exc:
+        executor.shutdown()
+        print(f"error: cannot bind {args.host}:{args.port}: {exc}", file=sys.stderr)
+        return 2
+    host, port = server.server_address[:2]
+    print(f"serving reports on http://{host}:{port} with {workers} workers", file=sys.stderr, flush=True)
+    # serve_forever() blocks this thread, so shutdown() has to be called from another one.
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        # The server may have replaced the pool it started with.
+        server.executor.shutdown()
+    drain_shadow_audits()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
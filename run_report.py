@@ -4,11 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import glob
 import json
+import math
+import multiprocessing.util
 import os
 import sys
-from collections.abc import Sequence
-from contextlib import contextmanager
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent
@@ -16,16 +21,57 @@ SRC_DIR = REPO_ROOT / "src"
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
-from pokecoach.report import generate_post_game_report
+from pokecoach.archive import ARCHIVE_INDEX_SUFFIX, GameSlice, load_archive_index, read_game_text
+from pokecoach.report import ReportOptions, drain_shadow_audits, generate_post_game_report
 from pokecoach.schemas import PostGameReport
 
 
+def _add_runtime_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the LLM/runtime flags shared by the CLI and the report server."""
+    parser.add_argument(
+        "--deterministic-only",
+        action="store_true",
+        help="Bypass LLM guidance and keep deterministic fallback behavior only.",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Bypass the on-disk LLM response cache for this run.",
+    )
+    parser.add_argument(
+        "--report-store",
+        metavar="DIR",
+        help=(
+            "Reuse finished reports stored in DIR, keyed by log hash and pipeline version "
+            "(default: POKECOACH_REPORT_STORE_DIR, disabled when unset)."
+        ),
+    )
+    parser.add_argument(
+        "--agentic-telemetry",
+        action="store_true",
+        help="Enable Coach+Auditor telemetry and include it in JSON output.",
+    )
+    parser.add_argument(
+        "--shadow-audit",
+        action="store_true",
+        help=(
+            "Return the Agent A draft without waiting for Agent B; audits run in the background and are "
+            "appended to POKECOACH_SHADOW_AUDIT_LOG (default .pokecoach_cache/shadow_audits.jsonl)."
+        ),
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="run_report.py",
         description="Generate a PokeCoach post-game report from a battle log.",
     )
-    parser.add_argument("log_path", help="Path to the battle log file.")
+    parser.add_argument(
+        "log_paths",
+        nargs="+",
+        metavar="log_path",
+        help="Path to the battle log file. Several paths, directories or glob patterns run in batch mode.",
+    )
     parser.add_argument(
         "--format",
         dest="output_format",
@@ -37,47 +83,89 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         help="Optional output file path. If omitted, writes to stdout.",
     )
+    _add_runtime_arguments(parser)
     parser.add_argument(
-        "--deterministic-only",
-        action="store_true",
-        help="Bypass LLM guidance and keep deterministic fallback behavior only.",
+        "--workers",
+        type=int,
+        default=None,
+        help="Batch mode: worker processes (default: CPU count; 1 runs in-process).",
     )
     parser.add_argument(
-        "--agentic-telemetry",
+        "--output-dir",
+        help="Batch mode: write one report per log into this directory instead of an NDJSON stream.",
+    )
+    parser.add_argument(
+        "--split-games",
         action="store_true",
-        help="Enable Coach+Auditor telemetry and include it in JSON output.",
+        help=(
+            "Batch mode: report each game of a multi-game export separately; game offsets are cached "
+            f"next to the file as <file>{ARCHIVE_INDEX_SUFFIX}."
+        ),
     )
     return parser
 
 
-@contextmanager
-def _temporary_runtime_flags(*, deterministic_only: bool, agentic_telemetry: bool):
-    api_key = None
-    prev_agentic = os.environ.get("POKECOACH_AGENTIC_COACH_AUDITOR")
-    prev_include_telemetry = os.environ.get("POKECOACH_INCLUDE_AGENTIC_TELEMETRY")
+def _report_options(args: argparse.Namespace) -> ReportOptions:
+    """Environment defaults with the CLI flags applied; nothing is written back to `os.environ`."""
+    options = ReportOptions.from_env()
+    runtime = options.runtime
+    if args.no_llm_cache:
+        runtime = replace(runtime, cache_dir=None)
+    if args.report_store is not None:
+        runtime = replace(runtime, report_store_dir=args.report_store)
+    return replace(
+        options,
+        runtime=runtime,
+        deterministic_only=options.deterministic_only or args.deterministic_only,
+        agentic_coach_auditor=options.agentic_coach_auditor or args.agentic_telemetry or args.shadow_audit,
+        include_agentic_telemetry=options.include_agentic_telemetry or args.agentic_telemetry,
+        shadow_audit=options.shadow_audit or args.shadow_audit,
+    )
 
-    if deterministic_only:
-        api_key = os.environ.pop("OPENROUTER_API_KEY", None)
 
-    if agentic_telemetry:
-        os.environ["POKECOACH_AGENTIC_COACH_AUDITOR"] = "1"
-        os.environ["POKECOACH_INCLUDE_AGENTIC_TELEMETRY"] = "1"
+def _has_glob_magic(pattern: str) -> bool:
+    return any(char in pattern for char in "*?[")
+
+
+def _is_batch_request(args: argparse.Namespace) -> bool:
+    if len(args.log_paths) > 1 or args.output_dir is not None or args.workers is not None or args.split_games:
+        return True
+    log_path = args.log_paths[0]
+    return _has_glob_magic(log_path) or Path(log_path).is_dir()
 
-    try:
-        yield
-    finally:
-        if api_key is not None:
-            os.environ["OPENROUTER_API_KEY"] = api_key
 
-        if prev_agentic is None:
-            os.environ.pop("POKECOACH_AGENTIC_COACH_AUDITOR", None)
+def _expand_log_paths(inputs: Sequence[str]) -> list[Path]:
+    """Resolve files, directories (``*.txt``, recursively) and glob patterns, keeping input order."""
+    paths: list[Path] = []
+    for item in inputs:
+        if _has_glob_magic(item):
+            matches = [Path(match) for match in sorted(glob.glob(item, recursive=True))]
+            paths.extend(
+                match for match in matches if match.is_file() and not match.name.endswith(ARCHIVE_INDEX_SUFFIX)
+            )
+        elif Path(item).is_dir():
+            paths.extend(sorted(path for path in Path(item).rglob("*.txt") if path.is_file()))
         else:
-            os.environ["POKECOACH_AGENTIC_COACH_AUDITOR"] = prev_agentic
+            paths.append(Path(item))
+    return list(dict.fromkeys(paths))
+
 
-        if prev_include_telemetry is None:
-            os.environ.pop("POKECOACH_INCLUDE_AGENTIC_TELEMETRY", None)
+BatchInput = tuple[Path, GameSlice | None]
+
+
+def _split_archive_games(log_paths: Sequence[Path]) -> list[BatchInput]:
+    """One input per game for multi-game exports; single-game and unreadable files stay whole."""
+    inputs: list[BatchInput] = []
+    for log_path in log_paths:
+        try:
+            games = load_archive_index(log_path) if log_path.is_file() else []
+        except OSError:
+            games = []
+        if len(games) > 1:
+            inputs.extend((log_path, game) for game in games)
         else:
-            os.environ["POKECOACH_INCLUDE_AGENTIC_TELEMETRY"] = prev_include_telemetry
+            inputs.append((log_path, None))
+    return inputs
 
 
 def _read_log_text(log_path: str) -> str:
@@ -168,19 +256,216 @@ def _write_output(content: str, output_path: str | None) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def _batch_output_paths(inputs: Sequence[BatchInput], output_dir: Path, output_format: str) -> list[Path]:
+    used: set[str] = set()
+    outputs: list[Path] = []
+    for log_path, game in inputs:
+        stem = log_path.stem if game is None else f"{log_path.stem}-game{game.game_number}"
+        name = f"{stem}.{output_format}"
+        suffix = 2
+        while name in used:
+            name = f"{stem}-{suffix}.{output_format}"
+            suffix += 1
+        used.add(name)
+        outputs.append(output_dir / name)
+    return outputs
+
+
+BatchTask = tuple[str, str, str | None, ReportOptions, GameSlice | None]
+
+
+def _run_batch_item(task: BatchTask) -> dict:
+    """Generate one report inside a batch worker; failures are returned, never raised."""
+    log_path, output_format, output_path, options, game = task
+    started = time.perf_counter()
+    record = _batch_record(task)
+    try:
+        log_text = _read_log_text(log_path) if game is None else read_game_text(Path(log_path), game)
+        report = generate_post_game_report(log_text, options)
+        if output_path is None:
+            record["report"] = report.model_dump(mode="json")
+        else:
+            _write_output(_serialize_report(report, output_format), output_path)
+            record["output_path"] = output_path
+        record["ok"] = True
+    except Exception as exc:  # noqa: BLE001
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    record["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+
+def _init_batch_worker() -> None:
+    # Pool workers skip atexit hooks, so drain background shadow audits through multiprocessing's finalizers.
+    multiprocessing.util.Finalize(None, drain_shadow_audits, exitpriority=10)
+
+
+# Full pools a log may be lost with (a worker died mid-batch) before it is retried in a pool of its own.
+_BATCH_POOL_ROUNDS = 2
+
+
+def _iter_batch_records(tasks: list[BatchTask], workers: int) -> Iterator[dict]:
+    """Yield one record per task, in task order.
+
+    A worker that dies breaks its whole pool and every log still queued on it. Those logs are
+    re-run on a fresh pool; logs lost again are then run one at a time, so only the log that
+    kills its worker gets an error record.
+    """
+    if workers <= 1:
+        yield from map(_run_batch_item, tasks)
+        return
+    records: dict[int, dict] = {}
+    next_index = 0
+    pending = list(range(len(tasks)))
+    rounds = 0
+    while pending:
+        rounds += 1
+        if rounds <= _BATCH_POOL_ROUNDS:
+            outcomes = _iter_pool_round(tasks, pending, workers)
+        else:
+            outcomes = _iter_isolated_round(tasks, pending)
+        lost: list[int] = []
+        for index, record in outcomes:
+            if record is None:
+                lost.append(index)
+                continue
+            records[index] = record
+            while next_index in records:
+                yield records.pop(next_index)
+                next_index += 1
+        pending = lost
+
+
+def _iter_pool_round(tasks: list[BatchTask], indices: list[int], workers: int) -> Iterator[tuple[int, dict | None]]:
+    """Run `indices` on one pool; a None record means the task was lost with a broken pool."""
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as executor:
+        futures = [(index, executor.submit(_run_batch_item, tasks[index])) for index in indices]
+        for index, future in futures:
+            try:
+                yield index, future.result()
+            except BrokenExecutor:
+                yield index, None
+
+
+def _iter_isolated_round(tasks: list[BatchTask], indices: list[int]) -> Iterator[tuple[int, dict]]:
+    """Run `indices` one at a time on a single worker, replacing it whenever a log kills it."""
+    executor: ProcessPoolExecutor | None = None
+    try:
+        for index in indices:
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=1, initializer=_init_batch_worker)
+            started = time.perf_counter()
+            try:
+                yield index, executor.submit(_run_batch_item, tasks[index]).result()
+            except BrokenExecutor as exc:
+                executor.shutdown()
+                executor = None
+                yield index, _lost_batch_record(tasks[index], exc, started)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _lost_batch_record(task: BatchTask, exc: BrokenExecutor, started: float) -> dict:
+    record = _batch_record(task)
+    record["error"] = f"{type(exc).__name__}: worker process died while generating this report"
+    record["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+
+def _batch_record(task: BatchTask) -> dict:
+    record: dict = {"log_path": task[0], "ok": False}
+    game = task[4]
+    if game is not None:
+        record["game_number"] = game.game_number
+    return record
+
+
+def _batch_record_label(record: dict) -> str:
+    if "game_number" in record:
+        return f"{record['log_path']} (game {record['game_number']})"
+    return record["log_path"]
+
+
+def _percentile(sorted_values: Sequence[float], quantile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _format_batch_stats(latencies_ms: list[float], ok_count: int, failed_count: int, elapsed_s: float) -> str:
+    ordered = sorted(latencies_ms)
+    throughput = (ok_count + failed_count) / elapsed_s if elapsed_s > 0 else 0.0
+    return (
+        f"batch: {ok_count + failed_count} logs ({ok_count} ok, {failed_count} failed) in {elapsed_s:.2f}s, "
+        f"{throughput:.1f} logs/s; latency ms p50={_percentile(ordered, 0.50):.1f} "
+        f"p90={_percentile(ordered, 0.90):.1f} p99={_percentile(ordered, 0.99):.1f} "
+        f"max={_percentile(ordered, 1.0):.1f}"
+    )
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    log_paths = _expand_log_paths(args.log_paths)
+    if not log_paths:
+        print("error: no log files matched the given paths", file=sys.stderr)
+        return 2
+
+    inputs = _split_archive_games(log_paths) if args.split_games else [(path, None) for path in log_paths]
+    output_paths: list[str | None] = [None] * len(inputs)
+    if args.output_dir is not None:
+        output_paths = [str(path) for path in _batch_output_paths(inputs, Path(args.output_dir), args.output_format)]
+    options = _report_options(args)
+    tasks = [
+        (str(log_path), args.output_format, output_path, options, game)
+        for (log_path, game), output_path in zip(inputs, output_paths)
+    ]
+    workers = args.workers or os.cpu_count() or 1
+
+    stream = sys.stdout
+    if args.output_dir is None and args.output is not None:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        stream = open(args.output, "w", encoding="utf-8")
+
+    latencies_ms: list[float] = []
+    ok_count = failed_count = 0
+    started = time.perf_counter()
+    try:
+        for record in _iter_batch_records(tasks, min(workers, len(tasks))):
+            latencies_ms.append(record["latency_ms"])
+            if record["ok"]:
+                ok_count += 1
+            else:
+                failed_count += 1
+                print(f"error: {_batch_record_label(record)}: {record['error'].splitlines()[0]}", file=sys.stderr)
+            if args.output_dir is None:
+                stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                stream.flush()
+        drain_shadow_audits()
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+    print(_format_batch_stats(latencies_ms, ok_count, failed_count, time.perf_counter() - started), file=sys.stderr)
+    return 0 if failed_count == 0 else 1
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if _is_batch_request(args):
+        if args.output_format == "md" and args.output_dir is None:
+            parser.error("--format md in batch mode requires --output-dir (the NDJSON stream is JSON only)")
+        if args.workers is not None and args.workers < 1:
+            parser.error("--workers must be >= 1")
+        return _run_batch(args)
+
     try:
-        log_text = _read_log_text(args.log_path)
-        with _temporary_runtime_flags(
-            deterministic_only=args.deterministic_only,
-            agentic_telemetry=args.agentic_telemetry,
-        ):
-            report = generate_post_game_report(log_text)
+        log_text = _read_log_text(args.log_paths[0])
+        report = generate_post_game_report(log_text, _report_options(args))
         rendered = _serialize_report(report, args.output_format)
         _write_output(rendered, args.output)
+        drain_shadow_audits()
     except FileNotFoundError as exc:
         print(f"error: {exc}", file=os.sys.stderr)
         return 2
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Compare event detection throughput of the per-detector loop and the fused engine."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from synthetic_logs import build_synthetic_log
+
+from pokecoach.events.registry import EVENT_DETECTORS, EVENT_ENGINE
+
+
+def _per_detector_loop(lines: list[str]) -> int:
+    count = 0
+    for line_number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text:
+            continue
+        for detector in EVENT_DETECTORS:
+            count += len(detector(text, line_number, raw))
+    return count
+
+
+def _fused_engine(lines: list[str]) -> int:
+    count = 0
+    for line_number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text:
+            continue
+        count += len(EVENT_ENGINE(text, line_number, raw))
+    return count
+
+
+def _best_lines_per_second(runner, lines: list[str], repeats: int) -> tuple[float, int]:
+    best = float("inf")
+    events = 0
+    for _ in range(repeats):
+        started = time.perf_counter()
+        events = runner(lines)
+        best = min(best, time.perf_counter() - started)
+    return len(lines) / best, events
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=20_000, help="Synthetic turns to generate (default: 20000).")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per strategy; best is kept.")
+    args = parser.parse_args()
+
+    lines = build_synthetic_log(args.turns).splitlines()
+    loop_lps, loop_events = _best_lines_per_second(_per_detector_loop, lines, args.repeats)
+    engine_lps, engine_events = _best_lines_per_second(_fused_engine, lines, args.repeats)
+    if loop_events != engine_events:
+        print(f"error: event count mismatch loop={loop_events} engine={engine_events}", file=sys.stderr)
+        return 1
+
+    payload = {
+        "lines": len(lines),
+        "events": engine_events,
+        "per_detector_loop_lines_per_second": round(loop_lps),
+        "fused_engine_lines_per_second": round(engine_lps),
+        "speedup": round(engine_lps / loop_lps, 2),
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare per-event memory of a KeyEvent list and the columnar EventStore."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from synthetic_logs import build_synthetic_log
+
+from pokecoach.events.registry import EVENT_ENGINE
+from pokecoach.schemas import KeyEvent
+from pokecoach.tools import build_event_store
+
+
+def _key_event_list(lines: list[str]) -> list[KeyEvent]:
+    events: list[KeyEvent] = []
+    for line_number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if text:
+            events.extend(EVENT_ENGINE(text, line_number, raw))
+    return events
+
+
+def _retained_bytes(builder, lines: list[str]) -> tuple[int, object]:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = builder(lines)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=20_000, help="Synthetic turns to generate (default: 20000).")
+    args = parser.parse_args()
+
+    lines = build_synthetic_log(args.turns).splitlines()
+
+    model_bytes, index = _retained_bytes(_key_event_list, lines)
+    store_bytes, store = _retained_bytes(build_event_store, lines)
+    if len(index) != len(store) or index[:1000] != [store.event(position) for position in range(min(1000, len(store)))]:
+        print("error: EventStore does not match the KeyEvent list", file=sys.stderr)
+        return 1
+
+    events = len(store)
+    payload = {
+        "lines": len(lines),
+        "events": events,
+        "key_event_list_bytes_per_event": round(model_bytes / events, 1),
+        "event_store_bytes_per_event": round(store_bytes / events, 1),
+        "event_store_column_bytes_per_event": round(store.nbytes / events, 1),
+        "memory_ratio": round(model_bytes / store_bytes, 1),
+        "events_by_type": store.count_by_type(),
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
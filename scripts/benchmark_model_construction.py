@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""Measure pydantic construction cost in the parser: validated vs model_construct, and models built per report."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from synthetic_logs import build_synthetic_log
+
+import pokecoach.tools as tools_module
+from pokecoach.schemas import EvidenceSpan, KeyEvent, PlayBundleEvent, TurnSpan
+
+EVIDENCE = {"start_line": 7, "end_line": 7, "raw_lines": ["Kami-Yan tomó una carta de Premio."]}
+MODEL_BUILDERS = {
+    "KeyEvent": (
+        lambda: KeyEvent(event_type="KO", line=7, text="x"),
+        lambda: KeyEvent.model_construct(event_type="KO", line=7, text="x"),
+    ),
+    "TurnSpan": (
+        lambda: TurnSpan(turn_number=1, start_line=1, end_line=9, actor="Kami-Yan"),
+        lambda: TurnSpan.model_construct(turn_number=1, start_line=1, end_line=9, actor="Kami-Yan"),
+    ),
+    "PlayBundleEvent": (
+        lambda: PlayBundleEvent(line=7, text="x", evidence=EVIDENCE),
+        lambda: PlayBundleEvent.model_construct(line=7, text="x", evidence=EvidenceSpan.model_construct(**EVIDENCE)),
+    ),
+}
+
+
+def _microseconds(builder, number: int) -> float:
+    return min(timeit.repeat(builder, number=number, repeat=3)) * 1_000_000 / number
+
+
+def _bundle_candidate_lines(log_text: str) -> int:
+    candidates = 0
+    in_turn = False
+    for raw in log_text.splitlines():
+        text = raw.strip()
+        in_turn = in_turn or bool(tools_module.TURN_HEADER_RE.match(text))
+        if not in_turn or not text:
+            continue
+        if tools_module.PLAY_BUNDLE_GUST_RE.search(text) or tools_module.PLAY_BUNDLE_ACTION_RE.search(text):
+            candidates += 1
+            continue
+        candidates += bool(tools_module.PLAY_BUNDLE_KO_RE.search(text))
+        candidates += bool(tools_module.PRIZE_TAKEN_RE.match(text))
+    return candidates
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reports", type=int, default=20, help="Synthetic logs to parse (default: 20).")
+    parser.add_argument("--turns", type=int, default=40, help="Turns per synthetic log (default: 40).")
+    parser.add_argument("--number", type=int, default=50_000, help="Constructions per micro-benchmark.")
+    args = parser.parse_args()
+
+    per_model = {}
+    for name, (validated, constructed) in MODEL_BUILDERS.items():
+        per_model[name] = {
+            "validated_us": round(_microseconds(validated, args.number), 3),
+            "model_construct_us": round(_microseconds(constructed, args.number), 3),
+        }
+
+    built = 0
+    original_builder = tools_module._build_play_bundle_event
+
+    def counting_builder(line_number: int, text: str) -> PlayBundleEvent:
+        nonlocal built
+        built += 1
+        return original_builder(line_number, text)
+
+    tools_module._build_play_bundle_event = counting_builder
+    logs = [build_synthetic_log(args.turns, seed=seed) for seed in range(args.reports)]
+    key_events = turns = 0
+    started = time.perf_counter()
+    for log_text in logs:
+        parsed = tools_module.parse_log(log_text)
+        key_events += len(parsed.events)
+        turns += len(parsed.turns)
+    parse_ms = (time.perf_counter() - started) * 1000
+    tools_module._build_play_bundle_event = original_builder
+
+    candidates = sum(_bundle_candidate_lines(log_text) for log_text in logs)
+    skipped_per_report = (candidates - built) / len(logs)
+    construction_us = (
+        key_events * per_model["KeyEvent"]["validated_us"]
+        + turns * per_model["TurnSpan"]["validated_us"]
+        + built * per_model["PlayBundleEvent"]["validated_us"]
+    )
+    payload = {
+        "per_model": per_model,
+        "reports": len(logs),
+        "parse_ms_per_report": round(parse_ms / len(logs), 3),
+        "model_construction_ms_per_report": round(construction_us / 1000 / len(logs), 3),
+        "play_bundle_candidate_lines_per_report": round(candidates / len(logs), 1),
+        "play_bundle_events_built_per_report": round(built / len(logs), 1),
+        "construction_saved_ms_per_report": round(
+            skipped_per_report * per_model["PlayBundleEvent"]["validated_us"] / 1000, 3
+        ),
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Compare guidance prompt size (and optionally live latency per model) for raw logs vs the compact digest."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from synthetic_logs import build_synthetic_log
+
+from pokecoach.llm_provider import _guidance_prompt, load_runtime_config, maybe_generate_guidance
+from pokecoach.prompt_context import DEFAULT_PROMPT_TOKEN_BUDGET, estimate_tokens, select_prompt_log
+
+FIXTURES_DIR = Path(__file__).resolve().parents[1] / "tests" / "golden" / "fixtures"
+
+_FALLBACK_SUMMARY = ["Observed log summary."]
+_FALLBACK_NEXT_ACTIONS = ["Review the key turns."]
+
+
+def _prompt_sizes(log_text: str, token_budget: int) -> dict[str, float | int]:
+    raw_prompt = _guidance_prompt(log_text, _FALLBACK_SUMMARY, _FALLBACK_NEXT_ACTIONS)
+    compact_prompt = _guidance_prompt(
+        select_prompt_log(log_text, token_budget=token_budget), _FALLBACK_SUMMARY, _FALLBACK_NEXT_ACTIONS
+    )
+    raw_tokens, compact_tokens = estimate_tokens(raw_prompt), estimate_tokens(compact_prompt)
+    return {
+        "log_lines": len(log_text.splitlines()),
+        "raw_prompt_chars": len(raw_prompt),
+        "compact_prompt_chars": len(compact_prompt),
+        "raw_prompt_tokens_est": raw_tokens,
+        "compact_prompt_tokens_est": compact_tokens,
+        "token_reduction": round(1 - compact_tokens / raw_tokens, 3),
+    }
+
+
+def _live_latency(log_text: str, models: list[str], token_budget: int) -> dict[str, dict[str, float | None]]:
+    base = replace(load_runtime_config(), cache_dir=None)
+    compact_log = select_prompt_log(log_text, token_budget=token_budget)
+    results: dict[str, dict[str, float | None]] = {}
+    for model in models:
+        config = replace(base, model=model)
+        timings: dict[str, float | None] = {}
+        for mode, prompt_log in (("raw", log_text), ("compact", compact_log)):
+            started = time.perf_counter()
+            guidance = maybe_generate_guidance(
+                log_text=prompt_log,
+                fallback_summary=_FALLBACK_SUMMARY,
+                fallback_next_actions=_FALLBACK_NEXT_ACTIONS,
+                config=config,
+            )
+            timings[f"{mode}_seconds"] = round(time.perf_counter() - started, 3) if guidance is not None else None
+        results[model] = timings
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--turns", default="20,60,200", help="Comma-separated synthetic log sizes in turns (default: 20,60,200)."
+    )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=DEFAULT_PROMPT_TOKEN_BUDGET,
+        help=f"Digest token budget (default: {DEFAULT_PROMPT_TOKEN_BUDGET}).",
+    )
+    parser.add_argument(
+        "--models",
+        default="",
+        help="Comma-separated OpenRouter models to time live (needs OPENROUTER_API_KEY; response cache is bypassed).",
+    )
+    args = parser.parse_args()
+
+    logs = {path.name: path.read_text(encoding="utf-8") for path in sorted(FIXTURES_DIR.glob("*.txt"))}
+    for turns in (int(value) for value in args.turns.split(",") if value.strip()):
+        logs[f"synthetic_{turns}_turns"] = build_synthetic_log(turns)
+
+    payload: dict[str, object] = {
+        "token_budget": args.token_budget,
+        "prompt_size": {name: _prompt_sizes(log_text, args.token_budget) for name, log_text in logs.items()},
+    }
+
+    models = [model.strip() for model in args.models.split(",") if model.strip()]
+    if models:
+        if not load_runtime_config().openrouter_api_key:
+            print("error: --models needs OPENROUTER_API_KEY", file=sys.stderr)
+            return 1
+        largest = max(logs, key=lambda name: len(logs[name]))
+        payload["latency_log"] = largest
+        payload["latency"] = _live_latency(logs[largest], models, args.token_budget)
+
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Load-test a running `report_server.py`: concurrent POST /report requests, client-side latency and server metrics."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from synthetic_logs import build_synthetic_log
+
+
+def _percentile(sorted_values: list[float], quantile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(quantile * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _post_report(url: str, body: bytes, timeout: float) -> tuple[bool, float]:
+    request = urllib.request.Request(
+        url, data=body, method="POST", headers={"Content-Type": "text/plain; charset=utf-8"}
+    )
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            ok = response.status == 200
+    except (urllib.error.URLError, TimeoutError):
+        ok = False
+    return ok, (time.perf_counter() - started) * 1000
+
+
+def _get_json(url: str) -> dict:
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8765", help="Server base URL.")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests to send (default: 200).")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent client connections (default: 8).")
+    parser.add_argument("--turns", type=int, default=20, help="Turns per synthetic log (default: 20).")
+    parser.add_argument("--logs", type=int, default=16, help="Distinct synthetic logs to cycle (default: 16).")
+    parser.add_argument("--format", dest="output_format", choices=("json", "md"), default="json")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds.")
+    args = parser.parse_args()
+
+    base_url = args.url.rstrip("/")
+    try:
+        _get_json(f"{base_url}/healthz")
+    except (urllib.error.URLError, OSError) as exc:
+        print(f"error: server not reachable at {base_url}: {exc}", file=sys.stderr)
+        return 1
+
+    bodies = [build_synthetic_log(args.turns, seed=seed).encode("utf-8") for seed in range(max(1, args.logs))]
+    report_url = f"{base_url}/report?format={args.output_format}"
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(
+            executor.map(
+                lambda index: _post_report(report_url, bodies[index % len(bodies)], args.timeout),
+                range(args.requests),
+            )
+        )
+    elapsed_s = time.perf_counter() - started
+
+    latencies = sorted(latency for _, latency in results)
+    ok_count = sum(1 for ok, _ in results if ok)
+    payload = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "turns": args.turns,
+        "ok": ok_count,
+        "failed": args.requests - ok_count,
+        "elapsed_s": round(elapsed_s, 3),
+        "throughput_rps": round(args.requests / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        "client_latency_ms": {
+            "p50": round(_percentile(latencies, 0.50), 3),
+            "p90": round(_percentile(latencies, 0.90), 3),
+            "p99": round(_percentile(latencies, 0.99), 3),
+            "max": round(_percentile(latencies, 1.0), 3),
+        },
+        "server_metrics": _get_json(f"{base_url}/metrics"),
+    }
+    print(json.dumps(payload, indent=2, sort_keys=True))
+    return 0 if ok_count == args.requests else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
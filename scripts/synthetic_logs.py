@@ -0,0 +1,56 @@
+"""Synthetic PTCGL Spanish battle logs for benchmarks and scaling checks."""
+
+from __future__ import annotations
+
+import random
+
+PLAYERS = ("Kami-Yan", "SpicyTaco30")
+POKEMON = ("Mega-Lopunny ex", "Latias ex", "Fezandipiti ex", "Colagrito", "Kirlia", "Dusknoir")
+SUPPORTERS = ("Determinación de Lillie", "Órdenes de Jefes", "Liza", "Mirtilo", "Plan del Profesor Turo")
+STADIUMS = ("Pueblo Altamía", "Torre de Interferencia", "Jaula de Combate")
+
+
+def _turn_lines(rng: random.Random, player: str, opponent: str) -> list[str]:
+    lines = ["Turno de [playerName]", f"{player} robó una carta."]
+    for _ in range(rng.randint(4, 12)):
+        roll = rng.random()
+        if roll < 0.35:
+            lines.append(f"   - {player} barajó su mazo.")
+        elif roll < 0.6:
+            lines.append(f"{player} unió (sve_{rng.randint(1, 8)}) Energía a {rng.choice(POKEMON)} en la Banca.")
+        elif roll < 0.75:
+            lines.append(f"{player} puso (sv1_{rng.randint(1, 200)}) {rng.choice(POKEMON)} en la Banca.")
+        elif roll < 0.85:
+            lines.append(f"{player} jugó (me1_{rng.randint(1, 200)}) {rng.choice(SUPPORTERS)}.")
+        elif roll < 0.9:
+            lines.append(f"{player} jugó {rng.choice(STADIUMS)}.")
+        else:
+            lines.append(f"- {player} robó {rng.randint(1, 3)} cartas.")
+
+    attacker, target = rng.choice(POKEMON), rng.choice(POKEMON)
+    lines.append(
+        f"El (sv1_{rng.randint(1, 99)}) {attacker} de {player} infligió {rng.randint(3, 33) * 10} puntos de daño "
+        f"usando Golpe contra el (sv8_{rng.randint(1, 300)}) {target} de {opponent}."
+    )
+    if rng.random() < 0.35:
+        lines.append(f"¡El (sv8_{rng.randint(1, 300)}) {target} de {opponent} quedó Fuera de Combate!")
+        lines.append(f"{player} tomó {rng.choice(('una carta', '2 cartas'))} de Premio.")
+    lines.append(f"{player} terminó su turno.")
+    return lines
+
+
+def build_synthetic_log(turns: int, *, seed: int = 0) -> str:
+    """Return a deterministic single-game log with ``turns`` turn blocks."""
+    rng = random.Random(seed)
+    first, second = PLAYERS
+    lines = [
+        "Preparación",
+        f"{first} robó 7 cartas de la mano inicial.",
+        f"{second} robó 7 cartas de la mano inicial.",
+        f"{first} decidió empezar en primer lugar.",
+    ]
+    for turn in range(turns):
+        player, opponent = (first, second) if turn % 2 == 0 else (second, first)
+        lines.extend(_turn_lines(rng, player, opponent))
+    lines.append(f"El rival se rindió. {first} ganó.")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,161 @@
+"""Memory-mapped splitting of multi-game PTCGL log archives."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+ARCHIVE_INDEX_VERSION = 1
+ARCHIVE_INDEX_SUFFIX = ".games.json"
+
+GAME_MARKER_RE = re.compile(
+    rb"^(?:"
+    rb"(?P<turn>Turno de \[playerName\])"
+    rb"|(?P<draw>[A-Za-z0-9_\-]+ rob\xc3\xb3 7 cartas de la mano inicial\.)"
+    rb"|(?P<setup>Preparaci\xc3\xb3n\b|[A-Za-z0-9_\-]+ declar\xc3\xb3 (?:un|\d+) mulligans?\.)"
+    rb"|(?P<end>[^\n]*?(?:El rival se rindi\xc3\xb3\.|Te rendiste\.|[A-Za-z0-9_\-]+ gan\xc3\xb3\.))"
+    rb")",
+    re.MULTILINE,
+)
+NON_BLANK_RE = re.compile(rb"\S")
+
+
+@dataclass(frozen=True)
+class GameSlice:
+    """Byte range of one game inside an archive (``end_offset`` is exclusive)."""
+
+    game_number: int
+    start_offset: int
+    end_offset: int
+
+
+def scan_game_boundaries(buffer: bytes | mmap.mmap) -> list[GameSlice]:
+    """Split concatenated games on initial-draw setup blocks and concede/winner lines."""
+    bounds: list[tuple[int, int]] = []
+    game_start = 0
+    seen_turn = False
+    setup_start: int | None = None
+    ended_at: int | None = None
+
+    def close_game(end_offset: int) -> None:
+        if NON_BLANK_RE.search(buffer, game_start, end_offset):
+            bounds.append((game_start, end_offset))
+
+    for match in GAME_MARKER_RE.finditer(buffer):
+        kind = match.lastgroup
+        if kind == "end":
+            newline = buffer.find(b"\n", match.end())
+            ended_at = len(buffer) if newline == -1 else newline + 1
+            continue
+
+        if ended_at is not None:
+            close_game(ended_at)
+            game_start = ended_at
+            ended_at = None
+            seen_turn = False
+            setup_start = None
+
+        if kind == "turn":
+            seen_turn = True
+            setup_start = None
+            continue
+
+        if setup_start is None:
+            setup_start = match.start()
+        if kind == "draw" and seen_turn:
+            close_game(setup_start)
+            game_start = setup_start
+            seen_turn = False
+
+    close_game(len(buffer))
+    return [
+        GameSlice(game_number=number, start_offset=start, end_offset=end)
+        for number, (start, end) in enumerate(bounds, start=1)
+    ]
+
+
+def index_path_for(archive_path: Path) -> Path:
+    return archive_path.with_name(archive_path.name + ARCHIVE_INDEX_SUFFIX)
+
+
+def build_archive_index(archive_path: Path, index_path: Path | None = None) -> list[GameSlice]:
+    """Scan ``archive_path`` through mmap and persist the game offset index (best effort)."""
+    path = Path(archive_path)
+    with _mapped(path) as buffer:
+        games = scan_game_boundaries(buffer)
+
+    stat = path.stat()
+    payload = {
+        "version": ARCHIVE_INDEX_VERSION,
+        "archive_size": stat.st_size,
+        "archive_mtime_ns": stat.st_mtime_ns,
+        "games": [[game.start_offset, game.end_offset] for game in games],
+    }
+    target = index_path or index_path_for(path)
+    try:
+        target.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        # The index only saves a rescan; a read-only archive directory still gets its games.
+        pass
+    return games
+
+
+def load_archive_index(archive_path: Path, index_path: Path | None = None) -> list[GameSlice]:
+    """Return the persisted index, rebuilding it when missing or stale."""
+    path = Path(archive_path)
+    target = index_path or index_path_for(path)
+    try:
+        payload = json.loads(target.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return build_archive_index(path, target)
+
+    stat = path.stat()
+    if (
+        payload.get("version") != ARCHIVE_INDEX_VERSION
+        or payload.get("archive_size") != stat.st_size
+        or payload.get("archive_mtime_ns") != stat.st_mtime_ns
+    ):
+        return build_archive_index(path, target)
+
+    return [
+        GameSlice(game_number=number, start_offset=start, end_offset=end)
+        for number, (start, end) in enumerate(payload["games"], start=1)
+    ]
+
+
+def read_game_text(archive_path: Path, game: GameSlice) -> str:
+    """Decode one game from the archive without reading the rest of the file."""
+    with _mapped(Path(archive_path)) as buffer:
+        return _decode_game(buffer, game)
+
+
+def iter_game_texts(archive_path: Path) -> Iterator[str]:
+    """Yield each game's text, using the persisted offset index when it is fresh."""
+    path = Path(archive_path)
+    games = load_archive_index(path)
+    with _mapped(path) as buffer:
+        for game in games:
+            yield _decode_game(buffer, game)
+
+
+def _decode_game(buffer: bytes | mmap.mmap, game: GameSlice) -> str:
+    view = memoryview(buffer)[game.start_offset : game.end_offset]
+    try:
+        return str(view, encoding="utf-8")
+    finally:
+        view.release()
+
+
+@contextmanager
+def _mapped(path: Path) -> Iterator[bytes | mmap.mmap]:
+    with path.open("rb") as handle:
+        if path.stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import json
+import threading
+import time
+from collections.abc import Awaitable, Callable, Generator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
@@ -29,8 +34,12 @@ CoachAuditorEventName = Literal[
     "rewrite_started",
     "rewrite_completed",
     "report_returned",
+    "shadow_audit_completed",
+    "shadow_audit_failed",
 ]
 
+TelemetrySink = Callable[[dict[str, Any]], None]
+
 
 class CoachAuditorEvent(BaseModel):
     event_name: CoachAuditorEventName
@@ -41,11 +50,11 @@ class CoachAuditorEvent(BaseModel):
 
 
 class CoachAuditorMetadata(BaseModel):
-    audit_status: Literal["pass", "fail"]
+    audit_status: Literal["pass", "fail", "shadow"]
     violations_count: int = Field(ge=0)
     rewrite_used: bool
     events_count: int = Field(ge=1)
-    audit_pass_first_try: bool
+    audit_pass_first_try: bool | None
 
 
 class CoachAuditorRunResult(BaseModel):
@@ -61,19 +70,256 @@ def run_one_iteration_coach_auditor(
     event_callback: Callable[[dict[str, Any]], None] | None = None,
 ) -> CoachAuditorRunResult:
     """Run Agent A draft, Agent B audit, and at most one rewrite pass."""
+    handlers: dict[str, Callable[..., Any]] = {
+        "draft": draft_generator,
+        "audit": auditor,
+        "rewrite": rewrite_generator,
+    }
+    steps = _coach_auditor_steps(event_callback)
+    try:
+        step, args = next(steps)
+        while True:
+            step, args = steps.send(handlers[step](*args))
+    except StopIteration as finished:
+        return finished.value
+
+
+async def arun_one_iteration_coach_auditor(
+    draft_generator: Callable[[], Awaitable[DraftReport]],
+    auditor: Callable[[DraftReport], Awaitable[AuditResult]],
+    rewrite_generator: Callable[[DraftReport, list[Violation], list[PatchAction]], Awaitable[DraftReport]],
+    *,
+    event_callback: Callable[[dict[str, Any]], None] | None = None,
+) -> CoachAuditorRunResult:
+    """Async variant of `run_one_iteration_coach_auditor` for awaitable agent callables."""
+    handlers: dict[str, Callable[..., Awaitable[Any]]] = {
+        "draft": draft_generator,
+        "audit": auditor,
+        "rewrite": rewrite_generator,
+    }
+    steps = _coach_auditor_steps(event_callback)
+    try:
+        step, args = next(steps)
+        while True:
+            step, args = steps.send(await handlers[step](*args))
+    except StopIteration as finished:
+        return finished.value
+
+
+def run_shadow_audit_coach_auditor(
+    draft_generator: Callable[[], DraftReport],
+    auditor: Callable[[DraftReport], AuditResult],
+    *,
+    shadow_runner: ShadowAuditRunner,
+    event_callback: Callable[[dict[str, Any]], None] | None = None,
+    shadow_context: dict[str, Any] | None = None,
+) -> CoachAuditorRunResult:
+    """PRD-014 Phase A: return the Agent A draft at once and audit it in the background.
+
+    The audit outcome never changes the returned draft; `shadow_runner` reports it to its telemetry sinks.
+    """
+    events = _start_shadow_run(event_callback)
+    draft = draft_generator()
+    return _finish_shadow_run(draft, auditor, shadow_runner, events, event_callback, shadow_context)
+
+
+async def arun_shadow_audit_coach_auditor(
+    draft_generator: Callable[[], Awaitable[DraftReport]],
+    auditor: Callable[[DraftReport], AuditResult],
+    *,
+    shadow_runner: ShadowAuditRunner,
+    event_callback: Callable[[dict[str, Any]], None] | None = None,
+    shadow_context: dict[str, Any] | None = None,
+) -> CoachAuditorRunResult:
+    """Async variant of `run_shadow_audit_coach_auditor`; the audit still runs on the runner's threads.
+
+    Keeping the audit off the event loop lets it outlive the loop (e.g. `asyncio.run`) until drained.
+    """
+    events = _start_shadow_run(event_callback)
+    draft = await draft_generator()
+    return _finish_shadow_run(draft, auditor, shadow_runner, events, event_callback, shadow_context)
+
+
+class ShadowAuditRunner:
+    """Runs Agent B audits on background threads and records each outcome to telemetry sinks.
+
+    Every submitted audit produces one `shadow_audit_completed` or `shadow_audit_failed` record. Call
+    `drain()` (or `shutdown()`) before the process exits so pending audits are not lost.
+    """
+
+    def __init__(self, sinks: Sequence[TelemetrySink] = (), *, max_workers: int = 4) -> None:
+        self._sinks = list(sinks)
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: set[Future[dict[str, Any]]] = set()
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink: TelemetrySink) -> None:
+        with self._lock:
+            self._sinks.append(sink)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def submit(
+        self,
+        draft: DraftReport,
+        auditor: Callable[[DraftReport], AuditResult],
+        *,
+        context: dict[str, Any] | None = None,
+    ) -> Future[dict[str, Any]]:
+        """Schedule `auditor(draft)`; the returned future resolves to the record sent to the sinks."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="pokecoach-shadow-audit"
+                )
+            future = self._executor.submit(self._audit_and_record, draft, auditor, dict(context or {}))
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait for pending audits; return False if some are still running after `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                pending = {future for future in self._pending if not future.done()}
+            if not pending:
+                return True
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            wait(pending, timeout=remaining)
+
+    def shutdown(self, timeout: float | None = None) -> bool:
+        """Drain pending audits, then release the worker threads. Later submits start a new pool."""
+        drained = self.drain(timeout)
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=drained, cancel_futures=not drained)
+        return drained
+
+    def _forget(self, future: Future[dict[str, Any]]) -> None:
+        with self._lock:
+            self._pending.discard(future)
+
+    def _audit_and_record(
+        self,
+        draft: DraftReport,
+        auditor: Callable[[DraftReport], AuditResult],
+        context: dict[str, Any],
+    ) -> dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            audit = auditor(draft)
+        except Exception as exc:  # noqa: BLE001
+            record = CoachAuditorEvent(event_name="shadow_audit_failed", stage="audit", rewrite_used=False).model_dump()
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        else:
+            passed = evaluate_quality_minimum(audit.violations)
+            record = CoachAuditorEvent(
+                event_name="shadow_audit_completed",
+                stage="audit",
+                violations_count=len(audit.violations),
+                quality_minimum_pass=passed,
+                rewrite_used=False,
+            ).model_dump()
+            record["violations"] = [violation.model_dump() for violation in audit.violations]
+            record["audit_summary"] = audit.audit_summary
+        record["latency_ms"] = round((time.perf_counter() - started) * 1000, 3)
+        record.update(context)
+
+        with self._lock:
+            sinks = list(self._sinks)
+        for sink in sinks:
+            try:
+                sink(record)
+            except Exception:  # noqa: BLE001
+                # Telemetry must never break reporting.
+                continue
+        return record
+
+
+class JsonlTelemetrySink:
+    """Append telemetry records to a JSON Lines file, one write per record."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def __call__(self, record: dict[str, Any]) -> None:
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+def _emit_event(
+    events: list[CoachAuditorEvent],
+    event_callback: Callable[[dict[str, Any]], None] | None,
+    event: CoachAuditorEvent,
+) -> None:
+    events.append(event)
+    if event_callback is not None:
+        event_callback(event.model_dump())
+
+
+def _start_shadow_run(event_callback: Callable[[dict[str, Any]], None] | None) -> list[CoachAuditorEvent]:
+    events: list[CoachAuditorEvent] = []
+    _emit_event(events, event_callback, CoachAuditorEvent(event_name="coach_run_started", stage="coach"))
+    return events
+
+
+def _finish_shadow_run(
+    draft: DraftReport,
+    auditor: Callable[[DraftReport], AuditResult],
+    shadow_runner: ShadowAuditRunner,
+    events: list[CoachAuditorEvent],
+    event_callback: Callable[[dict[str, Any]], None] | None,
+    shadow_context: dict[str, Any] | None,
+) -> CoachAuditorRunResult:
+    _emit_event(
+        events,
+        event_callback,
+        CoachAuditorEvent(event_name="coach_run_completed", stage="coach", rewrite_used=False),
+    )
+    shadow_runner.submit(draft, auditor, context=shadow_context)
+    _emit_event(
+        events,
+        event_callback,
+        CoachAuditorEvent(event_name="report_returned", stage="orchestrator", rewrite_used=False),
+    )
+    return CoachAuditorRunResult(
+        draft_report=draft,
+        metadata=CoachAuditorMetadata(
+            audit_status="shadow",
+            violations_count=0,
+            rewrite_used=False,
+            events_count=len(events),
+            audit_pass_first_try=None,
+        ),
+    )
+
 
+def _coach_auditor_steps(
+    event_callback: Callable[[dict[str, Any]], None] | None,
+) -> Generator[tuple[str, tuple[Any, ...]], Any, CoachAuditorRunResult]:
+    # Yields (step, args) for the driver to execute so sync and async runners share one flow.
     events: list[CoachAuditorEvent] = []
 
     def emit(event: CoachAuditorEvent) -> None:
-        events.append(event)
-        if event_callback is not None:
-            event_callback(event.model_dump())
+        _emit_event(events, event_callback, event)
 
     emit(CoachAuditorEvent(event_name="coach_run_started", stage="coach"))
-    initial_draft = draft_generator()
+    initial_draft = yield "draft", ()
     emit(CoachAuditorEvent(event_name="coach_run_completed", stage="coach", rewrite_used=False))
 
-    first_audit = auditor(initial_draft)
+    first_audit = yield "audit", (initial_draft,)
     first_pass = evaluate_quality_minimum(first_audit.violations)
     emit(
         CoachAuditorEvent(
@@ -108,10 +354,10 @@ def run_one_iteration_coach_auditor(
         )
     )
     emit(CoachAuditorEvent(event_name="rewrite_started", stage="coach", rewrite_used=True))
-    rewritten_draft = rewrite_generator(initial_draft, first_audit.violations, first_audit.patch_plan)
+    rewritten_draft = yield "rewrite", (initial_draft, first_audit.violations, first_audit.patch_plan)
     emit(CoachAuditorEvent(event_name="rewrite_completed", stage="coach", rewrite_used=True))
 
-    second_audit = auditor(rewritten_draft)
+    second_audit = yield "audit", (rewritten_draft,)
     second_pass = evaluate_quality_minimum(second_audit.violations)
     emit(
         CoachAuditorEvent(
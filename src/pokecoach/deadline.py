@@ -0,0 +1,44 @@
+"""Wall-clock budgets for report generation and the LLM calls inside it."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+DEFAULT_REPORT_DEADLINE_SECONDS = 120.0
+DEFAULT_LLM_REQUEST_TIMEOUT_SECONDS = 60.0
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised before an LLM request when its budget is already spent."""
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Absolute point on a monotonic clock; pass it down so every call sees the remaining budget."""
+
+    expires_at: float
+    clock: Callable[[], float] = field(default=time.monotonic, compare=False, repr=False)
+
+    @classmethod
+    def after(cls, seconds: float, *, clock: Callable[[], float] = time.monotonic) -> Deadline:
+        return cls(expires_at=clock() + seconds, clock=clock)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+    def limit(self, seconds: float) -> Deadline:
+        """Return the sooner of this deadline and `seconds` from now (e.g. a per-agent timeout)."""
+        return Deadline(expires_at=min(self.expires_at, self.clock() + seconds), clock=self.clock)
+
+    def check(self, stage: str) -> float:
+        """Return the remaining seconds, or raise `DeadlineExceeded` naming `stage` when none are left."""
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            raise DeadlineExceeded(f"deadline exceeded before {stage}")
+        return remaining
@@ -1,5 +1,27 @@
 """Event detection package."""
 
-from pokecoach.events.registry import EVENT_DETECTORS, SUPPORTER_KEYWORDS
+from pokecoach.events.keywords import CARD_AUTOMATON, KeywordAutomaton, KeywordMatch, KeywordSpec, card_mentions
+from pokecoach.events.registry import (
+    EVENT_DETECTORS,
+    EVENT_ENGINE,
+    SUPPORTER_KEYWORDS,
+    EventDetectorEngine,
+    FusedDetectorSpec,
+    compile_event_detectors,
+)
+from pokecoach.events.store import EventStore
 
-__all__ = ["EVENT_DETECTORS", "SUPPORTER_KEYWORDS"]
+__all__ = [
+    "CARD_AUTOMATON",
+    "EVENT_DETECTORS",
+    "EVENT_ENGINE",
+    "SUPPORTER_KEYWORDS",
+    "EventDetectorEngine",
+    "EventStore",
+    "FusedDetectorSpec",
+    "KeywordAutomaton",
+    "KeywordMatch",
+    "KeywordSpec",
+    "card_mentions",
+    "compile_event_detectors",
+]
@@ -0,0 +1,88 @@
+"""Local card-name lists (as PTCGL writes them in Spanish logs) for keyword matching."""
+
+from __future__ import annotations
+
+SUPPORTER_NAMES: tuple[str, ...] = (
+    "Determinación de Lillie",
+    "Órdenes de Jefes",
+    "Ordenes de Jefes",
+    "Liza",
+    "Mirtilo",
+    "Plan del Profesor Turo",
+    "e-Nigma",
+)
+
+STADIUM_NAMES: tuple[str, ...] = (
+    "Pueblo Altamía",
+    "Torre de Vigilancia del Equipo Rocket",
+    "Torre de Interferencia",
+    "Jaula de Combate",
+)
+
+POKEMON_NAMES: tuple[str, ...] = (
+    "Mega-Lopunny ex",
+    "Lopunny",
+    "Buneary",
+    "Latias ex",
+    "Fezandipiti ex",
+    "Munkidori",
+    "Okidogi",
+    "Colagrito",
+    "Ralts",
+    "Kirlia",
+    "Gardevoir ex",
+    "Drifloon",
+    "Drifblim",
+    "Duskull",
+    "Dusclops",
+    "Dusknoir",
+    "Charmander",
+    "Charmeleon",
+    "Charizard ex",
+    "Pidgey",
+    "Pidgeotto",
+    "Pidgeot ex",
+    "Dreepy",
+    "Drakloak",
+    "Dragapult ex",
+    "Terapagos ex",
+    "Hoothoot",
+    "Noctowl",
+    "Budew",
+    "Squawkabilly ex",
+    "Lumineon V",
+    "Manaphy",
+    "Rotom V",
+    "Mew ex",
+    "Genesect V",
+    "Miraidon ex",
+    "Manos Férreas ex",
+    "Bramaluna ex",
+    "Ferropaladín ex",
+    "Raikou V",
+    "Regieleki V",
+    "Lugia V",
+    "Archeops",
+    "Cinccino",
+    "Minccino",
+    "Gholdengo ex",
+    "Gimmighoul",
+    "Snorlax",
+    "Klefki",
+    "Bibarel",
+    "Bidoof",
+    "Comfey",
+    "Sableye",
+    "Cramorant",
+    "Chien-Pao ex",
+    "Baxcalibur",
+    "Frigibax",
+    "Arctibax",
+    "Tatsugiri",
+    "Zacian V",
+    "Zamazenta",
+)
+
+CARD_CATEGORY_SUPPORTER = "SUPPORTER"
+CARD_CATEGORY_STADIUM = "STADIUM"
+CARD_CATEGORY_POKEMON = "POKEMON"
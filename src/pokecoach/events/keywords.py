@@ -0,0 +1,119 @@
+"""Aho-Corasick keyword automaton for card-name mentions in log lines."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from pokecoach.events.card_names import (
+    CARD_CATEGORY_POKEMON,
+    CARD_CATEGORY_STADIUM,
+    CARD_CATEGORY_SUPPORTER,
+    POKEMON_NAMES,
+    STADIUM_NAMES,
+    SUPPORTER_NAMES,
+)
+
+
+@dataclass(frozen=True)
+class KeywordSpec:
+    keyword: str
+    category: str
+    case_sensitive: bool = True
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """One keyword occurrence; ``end`` is exclusive."""
+
+    start: int
+    end: int
+    keyword: str
+    category: str
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton that reports every keyword occurrence in one pass over a line.
+
+    The trie is built over lower-cased keywords and scanned over the lower-cased line, so
+    case-insensitive keywords need no extra work; case-sensitive keywords are confirmed
+    against the original slice. Overlapping matches are all reported, ordered by end offset.
+    """
+
+    def __init__(self, specs: Iterable[KeywordSpec]) -> None:
+        self.specs = tuple(spec for spec in specs if spec.keyword)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._outputs: list[tuple[int, ...]] = [()]
+
+        for spec_index, spec in enumerate(self.specs):
+            state = 0
+            for char in spec.keyword.lower():
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append(())
+                state = next_state
+            self._outputs[state] += (spec_index,)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def find_all(self, text: str) -> list[KeywordMatch]:
+        folded = text.lower()
+        if len(folded) != len(text):
+            folded = "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        matches: list[KeywordMatch] = []
+        state = 0
+        for position, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for spec_index in outputs[state]:
+                spec = self.specs[spec_index]
+                start = position + 1 - len(spec.keyword)
+                if spec.case_sensitive and text[start : position + 1] != spec.keyword:
+                    continue
+                matches.append(KeywordMatch(start, position + 1, spec.keyword, spec.category))
+        return matches
+
+
+def build_card_automaton(
+    supporters: Iterable[str] = SUPPORTER_NAMES,
+    stadiums: Iterable[str] = STADIUM_NAMES,
+    pokemon: Iterable[str] = POKEMON_NAMES,
+) -> KeywordAutomaton:
+    specs = [KeywordSpec(name, CARD_CATEGORY_SUPPORTER) for name in supporters]
+    specs.extend(KeywordSpec(name, CARD_CATEGORY_STADIUM, case_sensitive=False) for name in stadiums)
+    specs.extend(KeywordSpec(name, CARD_CATEGORY_POKEMON) for name in pokemon)
+    return KeywordAutomaton(specs)
+
+
+CARD_AUTOMATON = build_card_automaton()
+
+
+@lru_cache(maxsize=1)
+def card_mentions(text: str) -> tuple[KeywordMatch, ...]:
+    """Card mentions in ``text``; the last line is cached so every detector on it shares one scan."""
+    return tuple(CARD_AUTOMATON.find_all(text))
+
+
+def mentions_category(text: str, category: str) -> bool:
+    return any(match.category == category for match in card_mentions(text))
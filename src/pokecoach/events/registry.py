@@ -3,31 +3,23 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
 
+from pokecoach.events.card_names import CARD_CATEGORY_STADIUM, CARD_CATEGORY_SUPPORTER, SUPPORTER_NAMES
+from pokecoach.events.keywords import card_mentions, mentions_category
 from pokecoach.schemas import KeyEvent
 
 EventDetector = Callable[[str, int, str], list[KeyEvent]]
 
-SUPPORTER_KEYWORDS: tuple[str, ...] = (
-    "Determinación de Lillie",
-    "Órdenes de Jefes",
-    "Ordenes de Jefes",
-    "Liza",
-    "Mirtilo",
-    "Plan del Profesor Turo",
-    "e-Nigma",
-)
+SUPPORTER_KEYWORDS: tuple[str, ...] = SUPPORTER_NAMES
 
 ATTACK_RE = re.compile(r"\binfligió\b.*\busando\b", re.IGNORECASE)
 KO_RE = re.compile(r"quedó Fuera de Combate", re.IGNORECASE)
 PRIZE_RE = re.compile(r"\btomó\b\s+(una|\d+)\s+cartas?\s+de\s+Premio", re.IGNORECASE)
 CONCEDE_RE = re.compile(r"El rival se rindió", re.IGNORECASE)
 STADIUM_IN_PLAY_RE = re.compile(r"puso en juego la carta de Estadio", re.IGNORECASE)
-STADIUM_PLAY_RE = re.compile(
-    r"\bjugó\b.*(Pueblo Altamía|Torre de Vigilancia del Equipo Rocket|Torre de Interferencia|Jaula de Combate)",
-    re.IGNORECASE,
-)
+PLAYED_RE = re.compile(r"\bjugó\b", re.IGNORECASE)
 
 
 def _event(event_type: str, line: int, raw: str) -> KeyEvent:
@@ -58,14 +50,28 @@ def detect_concede(text: str, line: int, raw: str) -> list[KeyEvent]:
     return []
 
 
+def is_stadium_play(text: str) -> bool:
+    """A stadium card named after ``jugó``, or the generic stadium-in-play line."""
+    if STADIUM_IN_PLAY_RE.search(text):
+        return True
+    played = PLAYED_RE.search(text)
+    if played is None:
+        return False
+    return any(match.category == CARD_CATEGORY_STADIUM and match.start >= played.end() for match in card_mentions(text))
+
+
+def is_supporter_play(text: str) -> bool:
+    return "jugó" in text and mentions_category(text, CARD_CATEGORY_SUPPORTER)
+
+
 def detect_stadium(text: str, line: int, raw: str) -> list[KeyEvent]:
-    if STADIUM_IN_PLAY_RE.search(text) or STADIUM_PLAY_RE.search(text):
+    if is_stadium_play(text):
         return [_event("STADIUM", line, raw)]
     return []
 
 
 def detect_supporter(text: str, line: int, raw: str) -> list[KeyEvent]:
-    if "jugó" in text and any(keyword in text for keyword in SUPPORTER_KEYWORDS):
+    if is_supporter_play(text):
         return [_event("SUPPORTER", line, raw)]
     return []
 
@@ -78,3 +84,109 @@ EVENT_DETECTORS: Sequence[EventDetector] = (
     detect_stadium,
     detect_supporter,
 )
+
+
+@dataclass(frozen=True)
+class FusedDetectorSpec:
+    """Declarative form of a built-in detector that the engine can dispatch without calling it."""
+
+    event_type: str
+    triggers: tuple[str, ...]
+    pattern: re.Pattern[str] | None = None
+    predicate: Callable[[str], bool] | None = None
+
+
+FUSED_DETECTOR_SPECS: Mapping[EventDetector, FusedDetectorSpec] = {
+    detect_attack: FusedDetectorSpec("ATTACK", ("infligió",), ATTACK_RE),
+    detect_ko: FusedDetectorSpec("KO", ("quedó",), KO_RE),
+    detect_prize_taken: FusedDetectorSpec("PRIZE_TAKEN", ("Premio",), PRIZE_RE),
+    detect_concede: FusedDetectorSpec("CONCEDE", ("rindió",), CONCEDE_RE),
+    detect_stadium: FusedDetectorSpec("STADIUM", ("Estadio", "jugó"), predicate=is_stadium_play),
+    detect_supporter: FusedDetectorSpec("SUPPORTER", ("jugó",), predicate=is_supporter_play),
+}
+
+
+class EventDetectorEngine:
+    """Detector sequence compiled into a literal-prefilter dispatch table.
+
+    Detectors with a ``FusedDetectorSpec`` are never called: the engine checks their
+    trigger literals against the casefolded line (the confirming patterns ignore case,
+    so the prefilter must too) and only runs the confirming pattern for candidates, so
+    most lines cost one casefold and a handful of substring checks. Any other detector
+    is still called as a plain ``EventDetector``. Events are emitted in registry order,
+    exactly as the per-detector loop would produce them.
+    """
+
+    def __init__(
+        self,
+        detectors: Sequence[EventDetector],
+        specs: Mapping[EventDetector, FusedDetectorSpec] = FUSED_DETECTOR_SPECS,
+    ) -> None:
+        self.detectors = tuple(detectors)
+        self._slots: tuple[tuple[EventDetector | None, tuple[str, ...], FusedDetectorSpec | None], ...] = tuple(
+            (None, tuple(trigger.casefold() for trigger in specs[detector].triggers), specs[detector])
+            if detector in specs
+            else (detector, (), None)
+            for detector in self.detectors
+        )
+        self._has_fallbacks = any(detector is not None for detector, _, _ in self._slots)
+        triggers: list[str] = []
+        for _, slot_triggers, _ in self._slots:
+            triggers.extend(trigger for trigger in slot_triggers if trigger not in triggers)
+        self._triggers = tuple(triggers)
+
+    def __call__(self, text: str, line: int, raw: str) -> list[KeyEvent]:
+        folded = text.casefold()
+        if not self._has_fallbacks:
+            for trigger in self._triggers:
+                if trigger in folded:
+                    break
+            else:
+                return []
+
+        events: list[KeyEvent] = []
+        for detector, triggers, spec in self._slots:
+            if detector is not None:
+                events.extend(detector(text, line, raw))
+            elif _spec_matches(spec, triggers, text, folded):
+                events.append(_event(spec.event_type, line, raw))
+        return events
+
+    def event_types(self, text: str, line: int, raw: str) -> list[str]:
+        """Same dispatch as ``__call__`` but returns event type names without building ``KeyEvent`` models."""
+        folded = text.casefold()
+        if not self._has_fallbacks:
+            for trigger in self._triggers:
+                if trigger in folded:
+                    break
+            else:
+                return []
+
+        event_types: list[str] = []
+        for detector, triggers, spec in self._slots:
+            if detector is not None:
+                event_types.extend(event.event_type for event in detector(text, line, raw))
+            elif _spec_matches(spec, triggers, text, folded):
+                event_types.append(spec.event_type)
+        return event_types
+
+
+def _spec_matches(spec: FusedDetectorSpec, triggers: tuple[str, ...], text: str, folded: str) -> bool:
+    for trigger in triggers:
+        if trigger in folded:
+            break
+    else:
+        return False
+    if spec.pattern is not None and spec.pattern.search(text) is None:
+        return False
+    return spec.predicate is None or spec.predicate(text)
+
+
+def compile_event_detectors(
+    detectors: Sequence[EventDetector] = EVENT_DETECTORS,
+    specs: Mapping[EventDetector, FusedDetectorSpec] = FUSED_DETECTOR_SPECS,
+) -> EventDetectorEngine:
+    return EventDetectorEngine(detectors, specs)
+
+
+EVENT_ENGINE = compile_event_detectors()
@@ -0,0 +1,101 @@
+"""Columnar key event storage for corpus-scale processing."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+
+from pokecoach.schemas import KeyEvent, KeyEventIndex
+
+NO_ACTOR = 0
+
+
+class EventStore:
+    """Key events kept as parallel arrays instead of one ``KeyEvent`` model per event.
+
+    Line numbers and actor codes live in ``array("I")`` columns, event types in an
+    ``array("H")`` (their names come from the fixed detector registry), and both codes index
+    interned name tables. Actors get the wider column because a store shared across a corpus
+    can see far more than 65,535 player names. The raw text is not stored at all: it is read
+    from the shared ``line_table`` (the log's lines) by line number. ``KeyEvent`` models are
+    only built when an event is read through ``event``, iteration or ``to_index``.
+    """
+
+    def __init__(self, line_table: Sequence[str]) -> None:
+        self.line_table = line_table
+        self.event_type_names: list[str] = []
+        self.actor_names: list[str] = [""]
+        self._event_type_codes: dict[str, int] = {}
+        self._actor_codes: dict[str, int] = {}
+        self._lines = array("I")
+        self._types = array("H")
+        self._actors = array("I")
+
+    def append(self, event_type: str, line: int, actor: str | None = None) -> None:
+        type_code = self._event_type_codes.get(event_type)
+        if type_code is None:
+            type_code = len(self.event_type_names)
+            self.event_type_names.append(sys.intern(event_type))
+            self._event_type_codes[event_type] = type_code
+
+        actor_code = NO_ACTOR
+        if actor is not None:
+            actor_code = self._actor_codes.get(actor, NO_ACTOR)
+            if actor_code == NO_ACTOR:
+                actor_code = len(self.actor_names)
+                self.actor_names.append(sys.intern(actor))
+                self._actor_codes[actor] = actor_code
+
+        self._lines.append(line)
+        self._types.append(type_code)
+        self._actors.append(actor_code)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def __iter__(self) -> Iterator[KeyEvent]:
+        for position in range(len(self._lines)):
+            yield self.event(position)
+
+    def event(self, position: int) -> KeyEvent:
+        return KeyEvent(
+            event_type=self.event_type(position),
+            line=self._lines[position],
+            text=self.text(position),
+        )
+
+    def event_type(self, position: int) -> str:
+        return self.event_type_names[self._types[position]]
+
+    def line(self, position: int) -> int:
+        return self._lines[position]
+
+    def text(self, position: int) -> str:
+        return self.line_table[self._lines[position] - 1]
+
+    def actor(self, position: int) -> str | None:
+        actor_code = self._actors[position]
+        return None if actor_code == NO_ACTOR else self.actor_names[actor_code]
+
+    def positions_of(self, event_type: str) -> Iterator[int]:
+        type_code = self._event_type_codes.get(event_type)
+        if type_code is None:
+            return
+        for position, code in enumerate(self._types):
+            if code == type_code:
+                yield position
+
+    def count_by_type(self) -> dict[str, int]:
+        counts = [0] * len(self.event_type_names)
+        for code in self._types:
+            counts[code] += 1
+        return {name: count for name, count in zip(self.event_type_names, counts) if count}
+
+    def to_index(self) -> KeyEventIndex:
+        return KeyEventIndex(events=list(self))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (the shared line table is not counted)."""
+        return sum(column.itemsize * len(column) for column in (self._lines, self._types, self._actors))
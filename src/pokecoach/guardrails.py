@@ -15,6 +15,7 @@ from pokecoach.constants import (
 )
 from pokecoach.factories import build_placeholder_mistake, build_placeholder_turning_point
 from pokecoach.schemas import KeyEventIndex, Mistake, TurningPoint
+from pokecoach.tools import LogSource
 
 
 def _has_non_empty_evidence(raw_lines: list[str] | None) -> bool:
@@ -31,12 +32,12 @@ def _append_unknown_once(unknowns: list[str], seen: set[str], claim: str) -> Non
 
 
 def apply_report_guardrails(
-    log_text: str,
+    log_text: LogSource,
     turning_points: list[TurningPoint],
     mistakes: list[Mistake],
     unknowns: list[str],
     *,
-    event_indexer: Callable[[str], KeyEventIndex],
+    event_indexer: Callable[[LogSource], KeyEventIndex],
 ) -> tuple[list[TurningPoint], list[Mistake], list[str]]:
     events = event_indexer(log_text).events
     normalized_unknowns = list(dict.fromkeys(unknowns))
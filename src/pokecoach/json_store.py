@@ -0,0 +1,106 @@
+"""Directory of JSON entry files with TTL expiry and LRU size eviction, shared by the disk caches."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+_ENTRY_SUFFIX = ".json"
+
+
+class JSONFileStore:
+    """One JSON file per entry, named by a content digest chosen by the subclass.
+
+    Entries older than `ttl_seconds` (by their `created_at`) are never returned. Hits refresh the file
+    mtime, so every write first drops entries unused for longer than `ttl_seconds` and then the least
+    recently used ones once the directory exceeds `max_bytes`. Disk errors are swallowed: a store that
+    cannot be read or written behaves as empty.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self._entry_paths():
+            path.unlink(missing_ok=True)
+
+    def _load(self, digest: str) -> dict | None:
+        """Return the entry for `digest` if it exists and is fresh; stale or unreadable entries are removed."""
+        path = self._entry_path(digest)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or self._clock() - entry.get("created_at", 0.0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _touch(self, digest: str) -> None:
+        """Mark the entry as used now, so LRU eviction keeps it longer."""
+        now = self._clock()
+        try:
+            os.utime(self._entry_path(digest), (now, now))
+        except OSError:
+            pass
+
+    def _discard(self, digest: str) -> None:
+        self._entry_path(digest).unlink(missing_ok=True)
+
+    def _store(self, digest: str, entry: dict) -> None:
+        """Write `entry` (stamped with `created_at`) atomically, then evict."""
+        path = self._entry_path(digest)
+        now = self._clock()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({**entry, "created_at": now}, ensure_ascii=False), encoding="utf-8")
+            os.utime(tmp_path, (now, now))
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self._evict()
+
+    def _entry_path(self, digest: str) -> Path:
+        return self.directory / f"{digest}{_ENTRY_SUFFIX}"
+
+    def _entry_paths(self) -> list[Path]:
+        if not self.directory.is_dir():
+            return []
+        return [path for path in self.directory.iterdir() if path.suffix == _ENTRY_SUFFIX]
+
+    def _evict(self) -> None:
+        cutoff = self._clock() - self.ttl_seconds
+        entries: list[tuple[float, int, Path]] = []
+        for path in self._entry_paths():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if stat.st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            path.unlink(missing_ok=True)
+            total -= size
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,215 @@
+"""Per-model circuit breakers: skip a failing provider/model for a cool-down instead of paying every retry."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+DEFAULT_BREAKER_FAILURE_THRESHOLD = 5
+DEFAULT_BREAKER_COOLDOWN_SECONDS = 30.0
+DEFAULT_BREAKER_HALF_OPEN_PROBES = 1
+
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """The model's breaker is open (or its half-open probes are taken); no request was sent."""
+
+
+@dataclass(frozen=True)
+class BreakerTicket:
+    """One admitted request, returned by `CircuitBreaker.acquire` and passed back with its outcome.
+
+    `epoch` identifies the breaker state the request was admitted in; `probe` marks a half-open probe.
+    """
+
+    state: str
+    probe: bool
+    epoch: int
+
+
+@dataclass
+class LLMBreakerStats:
+    """Requests short-circuited by an open breaker inside one `track_llm_breaker_stats` block."""
+
+    short_circuited: dict[str, int] = field(default_factory=dict)
+
+
+_BREAKER_STATS: ContextVar[LLMBreakerStats | None] = ContextVar("pokecoach_llm_breaker_stats", default=None)
+
+
+@contextmanager
+def track_llm_breaker_stats() -> Iterator[LLMBreakerStats]:
+    """Count short-circuited requests made in the current context (each asyncio task keeps its own counters)."""
+    stats = LLMBreakerStats()
+    token = _BREAKER_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _BREAKER_STATS.reset(token)
+
+
+class CircuitBreaker:
+    """Closed -> open after `failure_threshold` consecutive failures -> half-open after `cooldown_seconds`.
+
+    While open every `acquire` raises `CircuitOpenError`. Half-open admits up to `half_open_probes` concurrent
+    probe requests: a success closes the breaker, a failure reopens it for another cool-down. Outcomes are
+    reported with the request's ticket to `record_success` / `record_failure`; `release` returns a slot for
+    a request that ended without telling anything about the provider (cancelled, or never sent). Outcomes
+    of requests admitted before the last state change (e.g. a slow call admitted while closed that ends
+    during half-open) are ignored, so only the current state's requests and probes move the breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS,
+        half_open_probes: int = DEFAULT_BREAKER_HALF_OPEN_PROBES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._state = BREAKER_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def acquire(self) -> BreakerTicket:
+        """Admit one request and return its ticket, or raise `CircuitOpenError`."""
+        with self._lock:
+            self._refresh()
+            if self._state == BREAKER_OPEN:
+                retry_in = self._opened_at + self.cooldown_seconds - self._clock()
+                _record_short_circuit(self.name)
+                raise CircuitOpenError(f"circuit open for {self.name}; retry in {retry_in:.1f}s")
+            if self._state == BREAKER_HALF_OPEN:
+                if self._probes_in_flight >= self.half_open_probes:
+                    _record_short_circuit(self.name)
+                    raise CircuitOpenError(f"circuit half-open for {self.name}; probe already in flight")
+                self._probes_in_flight += 1
+                return BreakerTicket(self._state, probe=True, epoch=self._epoch)
+            return BreakerTicket(self._state, probe=False, epoch=self._epoch)
+
+    def record_success(self, ticket: BreakerTicket) -> str:
+        with self._lock:
+            self._refresh()
+            if self._is_current(ticket):
+                self._end_probe(ticket)
+                self._consecutive_failures = 0
+                self._set_state(BREAKER_CLOSED)
+            return self._state
+
+    def record_failure(self, ticket: BreakerTicket) -> str:
+        with self._lock:
+            self._refresh()
+            if self._is_current(ticket):
+                self._end_probe(ticket)
+                self._consecutive_failures += 1
+                if ticket.probe or self._consecutive_failures >= self.failure_threshold:
+                    self._set_state(BREAKER_OPEN)
+                    self._opened_at = self._clock()
+            return self._state
+
+    def release(self, ticket: BreakerTicket) -> None:
+        with self._lock:
+            if self._is_current(ticket):
+                self._end_probe(ticket)
+
+    def snapshot(self) -> dict[str, object]:
+        with self._lock:
+            self._refresh()
+            entry: dict[str, object] = {"state": self._state, "consecutive_failures": self._consecutive_failures}
+            if self._state == BREAKER_OPEN:
+                entry["retry_in_s"] = round(max(0.0, self._opened_at + self.cooldown_seconds - self._clock()), 3)
+            return entry
+
+    def _refresh(self) -> None:
+        if self._state == BREAKER_OPEN and self._clock() - self._opened_at >= self.cooldown_seconds:
+            self._set_state(BREAKER_HALF_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        if state != self._state:
+            self._state = state
+            self._epoch += 1
+            self._probes_in_flight = 0
+
+    def _is_current(self, ticket: BreakerTicket) -> bool:
+        return ticket.epoch == self._epoch
+
+    def _end_probe(self, ticket: BreakerTicket) -> None:
+        if ticket.probe and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+
+class CircuitBreakerRegistry:
+    """One breaker per (base URL, model), shared by every report in the process."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._breakers: dict[tuple[str, str], CircuitBreaker] = {}
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def breaker(
+        self,
+        base_url: str,
+        model: str,
+        *,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS,
+        half_open_probes: int = DEFAULT_BREAKER_HALF_OPEN_PROBES,
+    ) -> CircuitBreaker:
+        key = (base_url, model)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    model,
+                    failure_threshold=failure_threshold,
+                    cooldown_seconds=cooldown_seconds,
+                    half_open_probes=half_open_probes,
+                    clock=self._clock,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def snapshot(self, models: list[str] | None = None) -> dict[str, dict[str, object]]:
+        """Breaker state per model, optionally limited to `models` (breakers not yet created are omitted)."""
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {
+            breaker.name: breaker.snapshot()
+            for breaker in sorted(breakers, key=lambda item: item.name)
+            if models is None or breaker.name in models
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._breakers.clear()
+
+
+LLM_CIRCUIT_BREAKERS = CircuitBreakerRegistry()
+
+
+def _record_short_circuit(model: str) -> None:
+    stats = _BREAKER_STATS.get()
+    if stats is not None:
+        stats.short_circuited[model] = stats.short_circuited.get(model, 0) + 1
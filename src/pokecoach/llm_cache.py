@@ -0,0 +1,133 @@
+"""Content-addressed disk cache for validated LLM outputs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from pokecoach.json_store import JSONFileStore
+
+DEFAULT_LLM_CACHE_DIR = ".pokecoach_cache/llm"
+DEFAULT_LLM_CACHE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_CachedModel = TypeVar("_CachedModel", bound=BaseModel)
+
+
+@dataclass
+class LLMCacheStats:
+    """Hit/miss counters for the cache lookups made inside one `track_llm_cache_stats` block."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+_CACHE_STATS: ContextVar[LLMCacheStats | None] = ContextVar("pokecoach_llm_cache_stats", default=None)
+
+
+@contextmanager
+def track_llm_cache_stats() -> Iterator[LLMCacheStats]:
+    """Count cache lookups made in the current context (each asyncio task keeps its own counters)."""
+    stats = LLMCacheStats()
+    token = _CACHE_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _CACHE_STATS.reset(token)
+
+
+class LLMResponseCache(JSONFileStore):
+    """Disk cache keyed by provider account, model, prompt hash and output schema, with TTL and LRU eviction.
+
+    `account` is an opaque caller-chosen identity (endpoint plus a credential digest), so one provider's or
+    tenant's answers are never served to another. Each entry is one JSON file holding the validated payload
+    and the raw model output; expiry and eviction follow `JSONFileStore`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = DEFAULT_LLM_CACHE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_LLM_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(directory, max_bytes=max_bytes, ttl_seconds=ttl_seconds, clock=clock)
+
+    def get(
+        self,
+        *,
+        model: str,
+        prompt: str,
+        output_type: type[_CachedModel],
+        account: str = "",
+    ) -> tuple[_CachedModel, str | None] | None:
+        """Return `(validated_output, raw_output)` for a fresh entry, or None on a miss."""
+        digest = _entry_digest(account, model, prompt, output_type)
+        entry = self._load(digest)
+        value: _CachedModel | None = None
+        if entry is not None:
+            try:
+                value = output_type.model_validate(entry["payload"])
+            except (KeyError, ValidationError):
+                self._discard(digest)
+        if value is None:
+            _record_lookup(hit=False)
+            return None
+
+        self._touch(digest)
+        _record_lookup(hit=True)
+        return value, entry.get("raw_output")
+
+    def put(
+        self,
+        *,
+        model: str,
+        prompt: str,
+        output_type: type[BaseModel],
+        value: BaseModel,
+        raw_output: str | None,
+        account: str = "",
+    ) -> None:
+        """Store a validated output, then evict stale and least recently used entries."""
+        entry = {
+            "model": model,
+            "output_type": output_type.__name__,
+            "payload": value.model_dump(mode="json"),
+            "raw_output": raw_output,
+        }
+        self._store(_entry_digest(account, model, prompt, output_type), entry)
+
+
+def _entry_digest(account: str, model: str, prompt: str, output_type: type[BaseModel]) -> str:
+    digest = hashlib.sha256()
+    for part in (account, model, _schema_fingerprint(output_type), prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _schema_fingerprint(output_type: type[BaseModel]) -> str:
+    schema = json.dumps(output_type.model_json_schema(), sort_keys=True)
+    return f"{output_type.__name__}:{hashlib.sha256(schema.encode('utf-8')).hexdigest()}"
+
+
+def _record_lookup(*, hit: bool) -> None:
+    stats = _CACHE_STATS.get()
+    if stats is None:
+        return
+    if hit:
+        stats.hits += 1
+    else:
+        stats.misses += 1
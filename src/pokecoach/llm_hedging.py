@@ -0,0 +1,165 @@
+"""Hedged LLM requests: per-model latency tracking, hedge delays and per-report win stats."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_DELAY_SECONDS = 10.0
+HEDGE_MIN_SAMPLES = 20
+_LATENCY_WINDOW = 256
+
+_HedgedResult = TypeVar("_HedgedResult")
+
+
+class ModelLatencyTracker:
+    """Recent successful-response latencies per model, shared by every report in the process."""
+
+    def __init__(self, window: int = _LATENCY_WINDOW) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(model)
+            if samples is None:
+                samples = deque(maxlen=self._window)
+                self._samples[model] = samples
+            samples.append(seconds)
+
+    def percentile(self, model: str, quantile: float, *, min_samples: int = HEDGE_MIN_SAMPLES) -> float | None:
+        """Return the `quantile` latency for `model`, or None until `min_samples` responses were seen."""
+        with self._lock:
+            ordered = sorted(self._samples.get(model, ()))
+        if len(ordered) < min_samples:
+            return None
+        rank = max(1, math.ceil(quantile * len(ordered)))
+        return ordered[rank - 1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+
+
+LATENCY_TRACKER = ModelLatencyTracker()
+
+
+@dataclass
+class LLMHedgeStats:
+    """Per-model response latencies and hedge wins for the calls made inside one `track_llm_hedge_stats` block."""
+
+    hedged_requests: int = 0
+    wins: dict[str, int] = field(default_factory=dict)
+    latencies_ms: dict[str, list[float]] = field(default_factory=dict)
+
+    def model_stats(self) -> dict[str, dict[str, float | int]]:
+        stats: dict[str, dict[str, float | int]] = {}
+        for model in sorted(set(self.wins) | set(self.latencies_ms)):
+            latencies = sorted(self.latencies_ms.get(model, []))
+            entry: dict[str, float | int] = {"responses": len(latencies), "hedge_wins": self.wins.get(model, 0)}
+            if latencies:
+                entry["latency_ms_p50"] = latencies[max(0, math.ceil(0.5 * len(latencies)) - 1)]
+                entry["latency_ms_max"] = latencies[-1]
+            stats[model] = entry
+        return stats
+
+
+_HEDGE_STATS: ContextVar[LLMHedgeStats | None] = ContextVar("pokecoach_llm_hedge_stats", default=None)
+
+
+@contextmanager
+def track_llm_hedge_stats() -> Iterator[LLMHedgeStats]:
+    """Collect per-model latency and hedge-win counters for calls made in the current context."""
+    stats = LLMHedgeStats()
+    token = _HEDGE_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _HEDGE_STATS.reset(token)
+
+
+def record_model_response(model: str, seconds: float) -> None:
+    """Record one validated response: feeds the hedge delay and the current report's stats."""
+    LATENCY_TRACKER.record(model, seconds)
+    stats = _HEDGE_STATS.get()
+    if stats is not None:
+        stats.latencies_ms.setdefault(model, []).append(round(seconds * 1000, 3))
+
+
+def hedge_delay(model: str, *, quantile: float, default_seconds: float) -> float:
+    """Seconds to wait for `model` before hedging: its observed `quantile` latency once known."""
+    observed = LATENCY_TRACKER.percentile(model, quantile)
+    return default_seconds if observed is None else observed
+
+
+async def run_hedged(
+    models: Sequence[str],
+    attempt: Callable[[str], Awaitable[_HedgedResult]],
+    *,
+    delay: float,
+) -> _HedgedResult:
+    """Run `attempt(models[0])`, adding the next ranked model each `delay` seconds or when one fails.
+
+    The first attempt that returns (i.e. produced a validated output) wins and the others are cancelled.
+    If every model fails, the last error is raised.
+    """
+    tasks: dict[asyncio.Task[_HedgedResult], str] = {}
+    pending: set[asyncio.Task[_HedgedResult]] = set()
+    next_index = 0
+    last_error: BaseException | None = None
+
+    def launch() -> None:
+        nonlocal next_index
+        task = asyncio.create_task(attempt(models[next_index]))
+        tasks[task] = models[next_index]
+        pending.add(task)
+        next_index += 1
+
+    launch()
+    try:
+        while pending:
+            can_hedge = next_index < len(models)
+            done, _ = await asyncio.wait(
+                pending, timeout=delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                _record_hedge()
+                launch()
+                continue
+            for task in done:
+                pending.discard(task)
+                error = task.exception()
+                if error is None:
+                    _record_win(tasks[task], hedged=len(tasks) > 1)
+                    return task.result()
+                last_error = error
+            if not pending and next_index < len(models):
+                _record_hedge()
+                launch()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    raise last_error if last_error is not None else RuntimeError("no model produced a response")
+
+
+def _record_hedge() -> None:
+    stats = _HEDGE_STATS.get()
+    if stats is not None:
+        stats.hedged_requests += 1
+
+
+def _record_win(model: str, *, hedged: bool) -> None:
+    stats = _HEDGE_STATS.get()
+    if stats is not None and hedged:
+        stats.wins[model] = stats.wins.get(model, 0) + 1
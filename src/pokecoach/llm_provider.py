@@ -2,38 +2,133 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
 import sys
+import threading
+import time
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from os import environ
-from typing import Mapping, TypeVar
+from typing import TYPE_CHECKING, Any, Mapping, TypeVar
+from weakref import WeakKeyDictionary
 
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
-from pydantic_ai.models.openai import OpenAIChatModel
-from pydantic_ai.providers.openai import OpenAIProvider
 
+from pokecoach.deadline import (
+    DEFAULT_LLM_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_REPORT_DEADLINE_SECONDS,
+    Deadline,
+    DeadlineExceeded,
+)
+from pokecoach.llm_breaker import (
+    DEFAULT_BREAKER_COOLDOWN_SECONDS,
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_HALF_OPEN_PROBES,
+    LLM_CIRCUIT_BREAKERS,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from pokecoach.llm_cache import (
+    DEFAULT_LLM_CACHE_DIR,
+    DEFAULT_LLM_CACHE_MAX_BYTES,
+    DEFAULT_LLM_CACHE_TTL_SECONDS,
+    LLMResponseCache,
+)
+from pokecoach.llm_hedging import (
+    DEFAULT_HEDGE_DELAY_SECONDS,
+    DEFAULT_HEDGE_PERCENTILE,
+    hedge_delay,
+    record_model_response,
+    run_hedged,
+)
+from pokecoach.llm_singleflight import LLM_SINGLE_FLIGHT
+from pokecoach.prompt_context import DEFAULT_PROMPT_TOKEN_BUDGET, PROMPT_CONTEXT_MODES
+from pokecoach.report_store import DEFAULT_REPORT_STORE_MAX_BYTES, DEFAULT_REPORT_STORE_TTL_SECONDS
 from pokecoach.schemas import AuditResult, DraftReport
+from pokecoach.stream_validation import IncrementalJSONValidator, StreamValidationError
+
+if TYPE_CHECKING:
+    import httpx
+    from pydantic_ai import Agent
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+    from pydantic_ai.settings import ModelSettings
 
 DEFAULT_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 DEFAULT_PYDANTICAI_MODEL = "openai/gpt-4o-mini"
+DEFAULT_LLM_MAX_CONCURRENCY = 16
 
 _DEBUG_TRUTHY = {"1", "true", "yes", "on"}
 _TOOL_CHOICE_AUTO_MODELS = {"z-ai/glm-4.5-air:free"}
 _STRUCTURED_JSON_INSTRUCTION = (
     "Return ONLY valid JSON matching the requested schema.\nDo not include markdown fences, commentary, or extra keys."
 )
+_GUIDANCE_JSON_INSTRUCTION = (
+    "Return ONLY valid JSON with keys: summary, next_actions.\n"
+    "Rules:\n"
+    "- summary: array with 5 to 8 strings\n"
+    "- next_actions: array with 3 to 5 strings\n"
+    "- no markdown fences, no extra keys, no commentary"
+)
+_HTTP_TIMEOUT_SECONDS = 600
+_HTTP_CONNECT_TIMEOUT_SECONDS = 5
+_LLM_STACK_NAMES = frozenset({"Agent", "ModelSettings", "OpenAIChatModel", "OpenAIProvider", "httpx"})
+_LLM_STACK_LOCK = threading.Lock()
+_LLM_STACK_LOADED = False
+_REQUEST_SEMAPHORES: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+_LOOP_CLIENTS: WeakKeyDictionary[asyncio.AbstractEventLoop, _ClientRegistry] = WeakKeyDictionary()
+_THREAD_CLIENTS = threading.local()
+_RUNTIME_CONFIG: PydanticAIRuntimeConfig | None = None
+_DOTENV_LOADED = False
 _StructuredModel = TypeVar("_StructuredModel", bound=BaseModel)
+_StepResult = TypeVar("_StepResult")
 
 
 @dataclass(frozen=True)
 class PydanticAIRuntimeConfig:
-    """Environment-driven runtime configuration for live PydanticAI usage."""
+    """Environment-driven runtime configuration for live PydanticAI usage.
+
+    Optional features (disk cache, report store) stay off unless loaded from the environment.
+    """
 
     openrouter_api_key: str | None
     openrouter_base_url: str
     model: str
+    # In-flight async requests per event loop; the first async call on a loop sizes the shared semaphore.
+    max_concurrency: int = DEFAULT_LLM_MAX_CONCURRENCY
+    # Disk response cache directory; None disables caching.
+    cache_dir: str | None = None
+    cache_max_bytes: int = DEFAULT_LLM_CACHE_MAX_BYTES
+    cache_ttl_seconds: int = DEFAULT_LLM_CACHE_TTL_SECONDS
+    # What report prompts embed: the token-budgeted digest ("compact") or the full log ("raw").
+    prompt_context: str = "compact"
+    prompt_token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET
+    # One agent call including its retries and fallbacks.
+    request_timeout_seconds: float = DEFAULT_LLM_REQUEST_TIMEOUT_SECONDS
+    # One whole report.
+    report_deadline_seconds: float = DEFAULT_REPORT_DEADLINE_SECONDS
+    # Ranked backup models; a request still unanswered after the primary's `hedge_percentile` latency
+    # (or `hedge_delay_seconds` until enough samples exist) is also sent to the next one.
+    hedge_models: tuple[str, ...] = ()
+    hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE
+    hedge_delay_seconds: float = DEFAULT_HEDGE_DELAY_SECONDS
+    # Stream text-JSON requests and abort as soon as the partial output can no longer match the schema.
+    stream_validation: bool = False
+    # Finished-report store directory; None disables it.
+    report_store_dir: str | None = None
+    report_store_max_bytes: int = DEFAULT_REPORT_STORE_MAX_BYTES
+    report_store_ttl_seconds: int = DEFAULT_REPORT_STORE_TTL_SECONDS
+    # Concurrent identical requests (same account, model, prompt and schema) share one call.
+    coalesce_requests: bool = True
+    # Skip a model for `breaker_cooldown_seconds` after `breaker_failure_threshold` consecutive provider
+    # failures, then let `breaker_half_open_probes` probe requests through.
+    circuit_breaker: bool = True
+    breaker_failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD
+    breaker_cooldown_seconds: float = DEFAULT_BREAKER_COOLDOWN_SECONDS
+    breaker_half_open_probes: int = DEFAULT_BREAKER_HALF_OPEN_PROBES
 
     @property
     def live_mode_enabled(self) -> bool:
@@ -48,14 +143,79 @@ class LLMReportGuidance(BaseModel):
 
 
 def load_runtime_config(env: Mapping[str, str] | None = None) -> PydanticAIRuntimeConfig:
-    """Load OpenRouter/PydanticAI settings from environment variables."""
-    if env is None:
+    """Load OpenRouter/PydanticAI settings from environment variables.
+
+    Without `env` the process environment is read once and cached; call `reload_runtime_config`
+    after changing it.
+    """
+    if env is not None:
+        return _runtime_config_from_values(env)
+    if _RUNTIME_CONFIG is None:
+        return reload_runtime_config()
+    return _RUNTIME_CONFIG
+
+
+def reload_runtime_config() -> PydanticAIRuntimeConfig:
+    """Re-read the process environment into the cached runtime config (`.env` is only loaded once)."""
+    global _DOTENV_LOADED, _RUNTIME_CONFIG
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+
         load_dotenv()
-    values = environ if env is None else env
+        _DOTENV_LOADED = True
+    _RUNTIME_CONFIG = _runtime_config_from_values(environ)
+    return _RUNTIME_CONFIG
+
+
+def _runtime_config_from_values(values: Mapping[str, str]) -> PydanticAIRuntimeConfig:
     return PydanticAIRuntimeConfig(
         openrouter_api_key=values.get("OPENROUTER_API_KEY"),
         openrouter_base_url=values.get("OPENROUTER_BASE_URL", DEFAULT_OPENROUTER_BASE_URL),
         model=values.get("POKECOACH_PYDANTICAI_MODEL", DEFAULT_PYDANTICAI_MODEL),
+        max_concurrency=_env_positive_int(values, "POKECOACH_LLM_MAX_CONCURRENCY", DEFAULT_LLM_MAX_CONCURRENCY),
+        cache_dir=(
+            None
+            if _env_flag(values, "POKECOACH_LLM_CACHE_BYPASS")
+            else values.get("POKECOACH_LLM_CACHE_DIR", DEFAULT_LLM_CACHE_DIR)
+        ),
+        cache_max_bytes=_env_positive_int(values, "POKECOACH_LLM_CACHE_MAX_BYTES", DEFAULT_LLM_CACHE_MAX_BYTES),
+        cache_ttl_seconds=_env_positive_int(values, "POKECOACH_LLM_CACHE_TTL_SECONDS", DEFAULT_LLM_CACHE_TTL_SECONDS),
+        prompt_context=_env_choice(values, "POKECOACH_LLM_PROMPT_CONTEXT", PROMPT_CONTEXT_MODES),
+        prompt_token_budget=_env_positive_int(values, "POKECOACH_LLM_PROMPT_TOKEN_BUDGET", DEFAULT_PROMPT_TOKEN_BUDGET),
+        request_timeout_seconds=_env_positive_float(
+            values, "POKECOACH_LLM_REQUEST_TIMEOUT_SECONDS", DEFAULT_LLM_REQUEST_TIMEOUT_SECONDS
+        ),
+        report_deadline_seconds=_env_positive_float(
+            values, "POKECOACH_REPORT_DEADLINE_SECONDS", DEFAULT_REPORT_DEADLINE_SECONDS
+        ),
+        hedge_models=tuple(
+            model.strip() for model in values.get("POKECOACH_LLM_HEDGE_MODELS", "").split(",") if model.strip()
+        ),
+        hedge_percentile=min(
+            1.0, _env_positive_float(values, "POKECOACH_LLM_HEDGE_PERCENTILE", DEFAULT_HEDGE_PERCENTILE)
+        ),
+        hedge_delay_seconds=_env_positive_float(
+            values, "POKECOACH_LLM_HEDGE_DELAY_SECONDS", DEFAULT_HEDGE_DELAY_SECONDS
+        ),
+        stream_validation=_env_flag(values, "POKECOACH_LLM_STREAM_VALIDATION"),
+        report_store_dir=values.get("POKECOACH_REPORT_STORE_DIR", "").strip() or None,
+        report_store_max_bytes=_env_positive_int(
+            values, "POKECOACH_REPORT_STORE_MAX_BYTES", DEFAULT_REPORT_STORE_MAX_BYTES
+        ),
+        report_store_ttl_seconds=_env_positive_int(
+            values, "POKECOACH_REPORT_STORE_TTL_SECONDS", DEFAULT_REPORT_STORE_TTL_SECONDS
+        ),
+        coalesce_requests=not _env_flag(values, "POKECOACH_LLM_COALESCE_BYPASS"),
+        circuit_breaker=not _env_flag(values, "POKECOACH_LLM_BREAKER_BYPASS"),
+        breaker_failure_threshold=_env_positive_int(
+            values, "POKECOACH_LLM_BREAKER_FAILURES", DEFAULT_BREAKER_FAILURE_THRESHOLD
+        ),
+        breaker_cooldown_seconds=_env_positive_float(
+            values, "POKECOACH_LLM_BREAKER_COOLDOWN_SECONDS", DEFAULT_BREAKER_COOLDOWN_SECONDS
+        ),
+        breaker_half_open_probes=_env_positive_int(
+            values, "POKECOACH_LLM_BREAKER_PROBES", DEFAULT_BREAKER_HALF_OPEN_PROBES
+        ),
     )
 
 
@@ -65,16 +225,326 @@ def maybe_generate_guidance(
     fallback_summary: list[str],
     fallback_next_actions: list[str],
     config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
 ) -> LLMReportGuidance | None:
     """Return LLM guidance when runtime config is valid; otherwise deterministic fallback."""
+    return _drive_requests(_guidance_steps(log_text, fallback_summary, fallback_next_actions, config, deadline))
+
+
+async def amaybe_generate_guidance(
+    *,
+    log_text: str,
+    fallback_summary: list[str],
+    fallback_next_actions: list[str],
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> LLMReportGuidance | None:
+    """Async variant of `maybe_generate_guidance` bounded by the shared request semaphore."""
+    return await _adrive_requests(_guidance_steps(log_text, fallback_summary, fallback_next_actions, config, deadline))
+
+
+def run_openrouter_structured_json(
+    *,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    model_name: str,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[_StructuredModel | None, str | None]:
+    """Run an OpenRouter model in text mode and parse structured JSON output."""
+    return _drive_requests(_structured_json_steps(prompt, output_type, model_name, config, deadline))
+
+
+async def arun_openrouter_structured_json(
+    *,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    model_name: str,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[_StructuredModel | None, str | None]:
+    """Async variant of `run_openrouter_structured_json` bounded by the shared request semaphore."""
+    return await _adrive_requests(_structured_json_steps(prompt, output_type, model_name, config, deadline))
+
+
+def maybe_generate_guidance_with_raw(
+    *,
+    log_text: str,
+    fallback_summary: list[str],
+    fallback_next_actions: list[str],
+    spanish_mode: bool = False,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[LLMReportGuidance | None, str | None]:
+    """Return guidance and raw model output payload when available."""
+    return _drive_requests(
+        _guidance_with_raw_steps(log_text, fallback_summary, fallback_next_actions, spanish_mode, config, deadline)
+    )
+
+
+async def amaybe_generate_guidance_with_raw(
+    *,
+    log_text: str,
+    fallback_summary: list[str],
+    fallback_next_actions: list[str],
+    spanish_mode: bool = False,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[LLMReportGuidance | None, str | None]:
+    """Async variant of `maybe_generate_guidance_with_raw` bounded by the shared request semaphore."""
+    return await _adrive_requests(
+        _guidance_with_raw_steps(log_text, fallback_summary, fallback_next_actions, spanish_mode, config, deadline)
+    )
+
+
+def maybe_generate_audit_result_with_raw(
+    *,
+    log_text: str,
+    draft: DraftReport,
+    spanish_mode: bool,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[AuditResult | None, str | None]:
+    """Return auditor result and raw model output payload when available."""
+    return _drive_requests(_audit_steps(log_text, draft, spanish_mode, config, deadline))
+
+
+async def amaybe_generate_audit_result_with_raw(
+    *,
+    log_text: str,
+    draft: DraftReport,
+    spanish_mode: bool,
+    config: PydanticAIRuntimeConfig | None = None,
+    deadline: Deadline | None = None,
+) -> tuple[AuditResult | None, str | None]:
+    """Async variant of `maybe_generate_audit_result_with_raw` bounded by the shared request semaphore."""
+    return await _adrive_requests(_audit_steps(log_text, draft, spanish_mode, config, deadline))
+
+
+@dataclass(frozen=True)
+class _RequestStep:
+    """One provider request yielded by a step generator; the driver sends back `_request`'s answer."""
+
+    cfg: PydanticAIRuntimeConfig
+    model_name: str
+    prompt: str
+    output_type: type[BaseModel]
+    budget: Deadline
+    structured: bool = False
+
+
+_RequestSteps = Generator[_RequestStep, Any, _StepResult]
+
+
+def _drive_requests(steps: _RequestSteps[_StepResult]) -> _StepResult:
+    """Run `steps` with blocking requests, throwing each request error back into the generator."""
+    try:
+        step = next(steps)
+        while True:
+            try:
+                answer = _request(
+                    step.cfg, step.model_name, step.prompt, step.output_type, step.budget, structured=step.structured
+                )
+            except Exception as exc:  # noqa: BLE001
+                step = steps.throw(exc)
+            else:
+                step = steps.send(answer)
+    except StopIteration as finished:
+        return finished.value
+
+
+async def _adrive_requests(steps: _RequestSteps[_StepResult]) -> _StepResult:
+    """Async `_drive_requests`: the same steps, sent through `_arequest`."""
+    try:
+        step = next(steps)
+        while True:
+            try:
+                answer = await _arequest(
+                    step.cfg, step.model_name, step.prompt, step.output_type, step.budget, structured=step.structured
+                )
+            except Exception as exc:  # noqa: BLE001
+                step = steps.throw(exc)
+            else:
+                step = steps.send(answer)
+    except StopIteration as finished:
+        return finished.value
+
+
+def _guidance_steps(
+    log_text: str,
+    fallback_summary: list[str],
+    fallback_next_actions: list[str],
+    config: PydanticAIRuntimeConfig | None,
+    deadline: Deadline | None,
+) -> _RequestSteps[LLMReportGuidance | None]:
     cfg = config or load_runtime_config()
+    budget = _call_deadline(cfg, deadline)
     debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
     if not cfg.live_mode_enabled:
         if debug_enabled:
             _emit_debug("live mode disabled (missing OPENROUTER_API_KEY or model)")
         return None
 
-    prompt = (
+    prompt = _guidance_prompt(log_text, fallback_summary, fallback_next_actions)
+    cached = _cache_lookup(cfg, cfg.model, prompt, LLMReportGuidance, debug_enabled)
+    if cached is not None:
+        return cached[0]
+
+    guidance = yield from _generate_guidance_steps(cfg=cfg, prompt=prompt, debug_enabled=debug_enabled, budget=budget)
+    if guidance is not None:
+        _cache_store(cfg, cfg.model, prompt, LLMReportGuidance, guidance, None)
+    return guidance
+
+
+def _structured_json_steps(
+    prompt: str,
+    output_type: type[_StructuredModel],
+    model_name: str,
+    config: PydanticAIRuntimeConfig | None,
+    deadline: Deadline | None,
+) -> _RequestSteps[tuple[_StructuredModel | None, str | None]]:
+    cfg = config or load_runtime_config()
+    budget = _call_deadline(cfg, deadline)
+    if not cfg.openrouter_api_key or not model_name.strip():
+        return None, None
+
+    debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
+    cached = _cache_lookup(cfg, model_name, prompt, output_type, debug_enabled)
+    if cached is not None:
+        return cached
+
+    raw_output: str | None = None
+    for _ in (1, 2):
+        try:
+            parsed, raw_output = yield _RequestStep(
+                cfg, model_name, f"{prompt}\n\n{_STRUCTURED_JSON_INSTRUCTION}", output_type, budget
+            )
+            _cache_store(cfg, model_name, prompt, output_type, parsed, raw_output)
+            return parsed, raw_output
+        except _InvalidModelOutput as exc:
+            raw_output = exc.raw_output
+        except CircuitOpenError:
+            break
+        except Exception:  # noqa: BLE001
+            continue
+    return None, raw_output
+
+
+def _guidance_with_raw_steps(
+    log_text: str,
+    fallback_summary: list[str],
+    fallback_next_actions: list[str],
+    spanish_mode: bool,
+    config: PydanticAIRuntimeConfig | None,
+    deadline: Deadline | None,
+) -> _RequestSteps[tuple[LLMReportGuidance | None, str | None]]:
+    cfg = config or load_runtime_config()
+    budget = _call_deadline(cfg, deadline)
+    debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
+    if not cfg.live_mode_enabled:
+        if debug_enabled:
+            _emit_debug("live mode disabled (missing OPENROUTER_API_KEY or model)")
+        return None, None
+
+    json_prompt = _guidance_with_raw_prompt(log_text, fallback_summary, fallback_next_actions, spanish_mode)
+    cached = _cache_lookup(cfg, cfg.model, json_prompt, LLMReportGuidance, debug_enabled)
+    if cached is not None:
+        return cached
+
+    try:
+        if debug_enabled:
+            _emit_debug(f"attempt=1 mode=text_json model={cfg.model} base_url={cfg.openrouter_base_url}")
+        guidance, raw_output = yield _RequestStep(cfg, cfg.model, json_prompt, LLMReportGuidance, budget)
+        _cache_store(cfg, cfg.model, json_prompt, LLMReportGuidance, guidance, raw_output)
+        return guidance, raw_output
+    except Exception as exc:  # noqa: BLE001
+        if debug_enabled:
+            _emit_debug(f"attempt=1 mode=text_json failed type={type(exc).__name__} detail={exc}")
+            _emit_debug(f"fallback=deterministic reason={type(exc).__name__}")
+        return None, None
+
+
+def _audit_steps(
+    log_text: str,
+    draft: DraftReport,
+    spanish_mode: bool,
+    config: PydanticAIRuntimeConfig | None,
+    deadline: Deadline | None,
+) -> _RequestSteps[tuple[AuditResult | None, str | None]]:
+    cfg = config or load_runtime_config()
+    budget = _call_deadline(cfg, deadline)
+    debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
+    if not cfg.live_mode_enabled:
+        return None, None
+
+    prompt = _audit_prompt(log_text, draft, spanish_mode)
+    cached = _cache_lookup(cfg, cfg.model, prompt, AuditResult, debug_enabled)
+    if cached is not None:
+        return cached
+
+    try:
+        if debug_enabled:
+            _emit_debug(f"attempt=1 mode=audit_text_json model={cfg.model} base_url={cfg.openrouter_base_url}")
+        parsed, raw_output = yield _RequestStep(cfg, cfg.model, prompt, AuditResult, budget)
+        _cache_store(cfg, cfg.model, prompt, AuditResult, parsed, raw_output)
+        return parsed, raw_output
+    except Exception as exc:  # noqa: BLE001
+        if debug_enabled:
+            _emit_debug(f"attempt=1 mode=audit_text_json failed type={type(exc).__name__} detail={exc}")
+            _emit_debug(f"audit_fallback reason={type(exc).__name__}")
+        return None, None
+
+
+def _generate_guidance_steps(
+    *,
+    cfg: PydanticAIRuntimeConfig,
+    prompt: str,
+    debug_enabled: bool,
+    budget: Deadline,
+) -> _RequestSteps[LLMReportGuidance | None]:
+    force_text_json = _model_requires_text_json_mode(cfg.model)
+    if force_text_json and debug_enabled:
+        _emit_debug(f"model={cfg.model} forced_mode=text_json")
+
+    if force_text_json:
+        return (
+            yield from _text_json_guidance_steps(config=cfg, prompt=prompt, debug_enabled=debug_enabled, budget=budget)
+        )
+
+    last_error: Exception | None = None
+    for attempt in (1, 2):
+        try:
+            if debug_enabled:
+                _emit_debug(f"attempt={attempt} mode=structured model={cfg.model} base_url={cfg.openrouter_base_url}")
+            guidance, _raw = yield _RequestStep(cfg, cfg.model, prompt, LLMReportGuidance, budget, structured=True)
+            if debug_enabled:
+                _emit_debug(
+                    f"live guidance ok attempt={attempt} summary_items={len(guidance.summary)} "
+                    f"next_actions_items={len(guidance.next_actions)}"
+                )
+            return guidance
+        except Exception as exc:  # noqa: BLE001
+            last_error = exc
+            if debug_enabled:
+                _emit_debug(f"attempt={attempt} failed type={type(exc).__name__} detail={exc}")
+            if isinstance(exc, CircuitOpenError):
+                break
+            if _is_tool_choice_auto_error(exc):
+                if debug_enabled:
+                    _emit_debug("switching_mode=text_json reason=tool_choice_auto_requirement")
+                return (
+                    yield from _text_json_guidance_steps(
+                        config=cfg, prompt=prompt, debug_enabled=debug_enabled, budget=budget
+                    )
+                )
+
+    if debug_enabled and last_error is not None:
+        _emit_debug(f"fallback=deterministic reason={type(last_error).__name__}")
+    return None
+
+
+def _guidance_prompt(log_text: str, fallback_summary: list[str], fallback_next_actions: list[str]) -> str:
+    return (
         "You are a deterministic Pokémon TCG battle-log reporter.\n"
         "You MUST stay grounded in the provided Battle log.\n\n"
         "OUTPUT:\n"
@@ -111,103 +581,13 @@ def maybe_generate_guidance(
         f"Battle log:\n{log_text}"
     )
 
-    model = OpenAIChatModel(
-        cfg.model,
-        provider=OpenAIProvider(base_url=cfg.openrouter_base_url, api_key=cfg.openrouter_api_key),
-    )
-
-    force_text_json = _model_requires_text_json_mode(cfg.model)
-    if force_text_json and debug_enabled:
-        _emit_debug(f"model={cfg.model} forced_mode=text_json")
-
-    if force_text_json:
-        return _run_text_json_guidance(
-            model=model,
-            prompt=prompt,
-            debug_enabled=debug_enabled,
-            model_name=cfg.model,
-            base_url=cfg.openrouter_base_url,
-        )
 
-    structured_agent = Agent(model, output_type=LLMReportGuidance)
-    last_error: Exception | None = None
-    for attempt in (1, 2):
-        try:
-            if debug_enabled:
-                _emit_debug(f"attempt={attempt} mode=structured model={cfg.model} base_url={cfg.openrouter_base_url}")
-            result = structured_agent.run_sync(prompt)
-            if debug_enabled:
-                _emit_debug(
-                    f"live guidance ok attempt={attempt} summary_items={len(result.output.summary)} "
-                    f"next_actions_items={len(result.output.next_actions)}"
-                )
-            return result.output
-        except Exception as exc:  # noqa: BLE001
-            last_error = exc
-            if debug_enabled:
-                _emit_debug(f"attempt={attempt} failed type={type(exc).__name__} detail={exc}")
-            if _is_tool_choice_auto_error(exc):
-                if debug_enabled:
-                    _emit_debug("switching_mode=text_json reason=tool_choice_auto_requirement")
-                return _run_text_json_guidance(
-                    model=model,
-                    prompt=prompt,
-                    debug_enabled=debug_enabled,
-                    model_name=cfg.model,
-                    base_url=cfg.openrouter_base_url,
-                )
-
-    if debug_enabled and last_error is not None:
-        _emit_debug(f"fallback=deterministic reason={type(last_error).__name__}")
-    return None
-
-
-def run_openrouter_structured_json(
-    *,
-    prompt: str,
-    output_type: type[_StructuredModel],
-    model_name: str,
-    config: PydanticAIRuntimeConfig | None = None,
-) -> tuple[_StructuredModel | None, str | None]:
-    """Run an OpenRouter model in text mode and parse structured JSON output."""
-    cfg = config or load_runtime_config()
-    if not cfg.openrouter_api_key or not model_name.strip():
-        return None, None
-
-    model = OpenAIChatModel(
-        model_name,
-        provider=OpenAIProvider(base_url=cfg.openrouter_base_url, api_key=cfg.openrouter_api_key),
-    )
-    text_agent = Agent(model, output_type=str)
-
-    raw_output: str | None = None
-    for _ in (1, 2):
-        try:
-            result = text_agent.run_sync(f"{prompt}\n\n{_STRUCTURED_JSON_INSTRUCTION}")
-            raw_output = result.output
-            payload = _extract_json_payload(raw_output)
-            return output_type.model_validate_json(payload), raw_output
-        except Exception:  # noqa: BLE001
-            continue
-    return None, raw_output
-
-
-def maybe_generate_guidance_with_raw(
-    *,
+def _guidance_with_raw_prompt(
     log_text: str,
     fallback_summary: list[str],
     fallback_next_actions: list[str],
-    spanish_mode: bool = False,
-    config: PydanticAIRuntimeConfig | None = None,
-) -> tuple[LLMReportGuidance | None, str | None]:
-    """Return guidance and raw model output payload when available."""
-    cfg = config or load_runtime_config()
-    debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
-    if not cfg.live_mode_enabled:
-        if debug_enabled:
-            _emit_debug("live mode disabled (missing OPENROUTER_API_KEY or model)")
-        return None, None
-
+    spanish_mode: bool,
+) -> str:
     language_instruction = "Respond in Spanish." if spanish_mode else "Respond in English."
 
     prompt = (
@@ -224,49 +604,11 @@ def maybe_generate_guidance_with_raw(
         f"Fallback next actions:\n{_format_bullets(fallback_next_actions)}\n\n"
         f"Battle log:\n{log_text}"
     )
-
-    model = OpenAIChatModel(
-        cfg.model,
-        provider=OpenAIProvider(base_url=cfg.openrouter_base_url, api_key=cfg.openrouter_api_key),
-    )
-    text_agent = Agent(model, output_type=str)
-    json_prompt = (
-        f"{prompt}\n\n"
-        "Return ONLY valid JSON with keys: summary, next_actions.\n"
-        "Rules:\n"
-        "- summary: array with 5 to 8 strings\n"
-        "- next_actions: array with 3 to 5 strings\n"
-        "- no markdown fences, no extra keys, no commentary"
-    )
-
-    try:
-        if debug_enabled:
-            _emit_debug(f"attempt=1 mode=text_json model={cfg.model} base_url={cfg.openrouter_base_url}")
-        result = text_agent.run_sync(json_prompt)
-        payload = _extract_json_payload(result.output)
-        guidance = LLMReportGuidance.model_validate_json(payload)
-        return guidance, result.output
-    except Exception as exc:  # noqa: BLE001
-        if debug_enabled:
-            _emit_debug(f"attempt=1 mode=text_json failed type={type(exc).__name__} detail={exc}")
-            _emit_debug(f"fallback=deterministic reason={type(exc).__name__}")
-        return None, None
+    return f"{prompt}\n\n{_GUIDANCE_JSON_INSTRUCTION}"
 
 
-def maybe_generate_audit_result_with_raw(
-    *,
-    log_text: str,
-    draft: DraftReport,
-    spanish_mode: bool,
-    config: PydanticAIRuntimeConfig | None = None,
-) -> tuple[AuditResult | None, str | None]:
-    """Return auditor result and raw model output payload when available."""
-    cfg = config or load_runtime_config()
-    debug_enabled = _env_flag(environ, "POKECOACH_LLM_DEBUG")
-    if not cfg.live_mode_enabled:
-        return None, None
-
-    prompt = (
+def _audit_prompt(log_text: str, draft: DraftReport, spanish_mode: bool) -> str:
+    return (
         "You are Auditor Agent B for Pokémon TCG logs. Validate only observable claims.\n"
         "Output STRICT JSON with keys: quality_minimum_pass, violations, patch_plan, audit_summary.\n"
         "If language mode is spanish, write all textual fields in Spanish.\n"
@@ -279,51 +621,412 @@ def maybe_generate_audit_result_with_raw(
         f"Battle log:\n{log_text}"
     )
 
-    model = OpenAIChatModel(
-        cfg.model,
-        provider=OpenAIProvider(base_url=cfg.openrouter_base_url, api_key=cfg.openrouter_api_key),
-    )
-    text_agent = Agent(model, output_type=str)
+
+def _load_llm_stack() -> None:
+    """Import pydantic-ai, the OpenAI model/provider and httpx on the first live call.
+
+    They dominate import time, and deterministic runs (no API key, `--deterministic-only`) never need them.
+    Names already bound on the module, e.g. a test double for `Agent`, are kept.
+    """
+    global _LLM_STACK_LOADED
+    if _LLM_STACK_LOADED:
+        return
+    with _LLM_STACK_LOCK:
+        if _LLM_STACK_LOADED:
+            return
+        import httpx
+        from pydantic_ai import Agent
+        from pydantic_ai.models.openai import OpenAIChatModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+        from pydantic_ai.settings import ModelSettings
+
+        loaded = {
+            "Agent": Agent,
+            "ModelSettings": ModelSettings,
+            "OpenAIChatModel": OpenAIChatModel,
+            "OpenAIProvider": OpenAIProvider,
+            "httpx": httpx,
+        }
+        for name, value in loaded.items():
+            globals().setdefault(name, value)
+        _LLM_STACK_LOADED = True
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LLM_STACK_NAMES:
+        _load_llm_stack()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _ClientRegistry:
+    """Providers, HTTP pools and agents reused across calls within one event-loop scope."""
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[str, str, str | None], OpenAIChatModel] = {}
+        self._agents: dict[tuple[str, str, str | None, type], Agent] = {}
+
+    def model(self, cfg: PydanticAIRuntimeConfig, model_name: str) -> OpenAIChatModel:
+        key = (model_name, cfg.openrouter_base_url, cfg.openrouter_api_key)
+        model = self._models.get(key)
+        if model is None:
+            provider = OpenAIProvider(
+                base_url=cfg.openrouter_base_url,
+                api_key=cfg.openrouter_api_key,
+                http_client=httpx.AsyncClient(
+                    timeout=httpx.Timeout(timeout=_HTTP_TIMEOUT_SECONDS, connect=_HTTP_CONNECT_TIMEOUT_SECONDS)
+                ),
+            )
+            model = OpenAIChatModel(model_name, provider=provider)
+            self._models[key] = model
+        return model
+
+    def agent(self, cfg: PydanticAIRuntimeConfig, model_name: str, output_type: type) -> Agent:
+        key = (model_name, cfg.openrouter_base_url, cfg.openrouter_api_key, output_type)
+        agent = self._agents.get(key)
+        if agent is None:
+            agent = Agent(self.model(cfg, model_name), output_type=output_type)
+            self._agents[key] = agent
+        return agent
+
+
+def _client_registry() -> _ClientRegistry:
+    # Pooled connections belong to the loop that opened them: async callers get one registry per running
+    # loop, sync callers (Agent.run_sync keeps a loop per thread) one per thread.
     try:
-        if debug_enabled:
-            _emit_debug(f"attempt=1 mode=audit_text_json model={cfg.model} base_url={cfg.openrouter_base_url}")
-        result = text_agent.run_sync(prompt)
-        payload = _extract_json_payload(result.output)
-        parsed = AuditResult.model_validate_json(payload)
-        return parsed, result.output
-    except Exception as exc:  # noqa: BLE001
-        if debug_enabled:
-            _emit_debug(f"attempt=1 mode=audit_text_json failed type={type(exc).__name__} detail={exc}")
-            _emit_debug(f"audit_fallback reason={type(exc).__name__}")
-        return None, None
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        registry = getattr(_THREAD_CLIENTS, "registry", None)
+        if registry is None:
+            registry = _ClientRegistry()
+            _THREAD_CLIENTS.registry = registry
+        return registry
+    registry = _LOOP_CLIENTS.get(loop)
+    if registry is None:
+        registry = _ClientRegistry()
+        _LOOP_CLIENTS[loop] = registry
+    return registry
 
 
-def _run_text_json_guidance(
-    *,
-    model: OpenAIChatModel,
+def _cached_agent(cfg: PydanticAIRuntimeConfig, model_name: str, output_type: type) -> Agent:
+    _load_llm_stack()
+    return _client_registry().agent(cfg, model_name, output_type)
+
+
+def _response_cache(cfg: PydanticAIRuntimeConfig) -> LLMResponseCache | None:
+    if cfg.cache_dir is None:
+        return None
+    return LLMResponseCache(cfg.cache_dir, max_bytes=cfg.cache_max_bytes, ttl_seconds=cfg.cache_ttl_seconds)
+
+
+def _cache_lookup(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
     prompt: str,
+    output_type: type[_StructuredModel],
     debug_enabled: bool,
+) -> tuple[_StructuredModel, str | None] | None:
+    cache = _response_cache(cfg)
+    if cache is None:
+        return None
+    cached = cache.get(model=model_name, prompt=prompt, output_type=output_type, account=_cache_account(cfg))
+    if debug_enabled:
+        _emit_debug(f"cache={'hit' if cached is not None else 'miss'} model={model_name} type={output_type.__name__}")
+    return cached
+
+
+def _cache_store(
+    cfg: PydanticAIRuntimeConfig,
     model_name: str,
-    base_url: str,
-) -> LLMReportGuidance | None:
-    text_agent = Agent(model, output_type=str)
-    json_prompt = (
-        f"{prompt}\n\n"
-        "Return ONLY valid JSON with keys: summary, next_actions.\n"
-        "Rules:\n"
-        "- summary: array with 5 to 8 strings\n"
-        "- next_actions: array with 3 to 5 strings\n"
-        "- no markdown fences, no extra keys, no commentary"
+    prompt: str,
+    output_type: type[BaseModel],
+    value: BaseModel,
+    raw_output: str | None,
+) -> None:
+    cache = _response_cache(cfg)
+    if cache is not None:
+        cache.put(
+            model=model_name,
+            prompt=prompt,
+            output_type=output_type,
+            value=value,
+            raw_output=raw_output,
+            account=_cache_account(cfg),
+        )
+
+
+def _cache_account(cfg: PydanticAIRuntimeConfig) -> str:
+    return "\0".join(_account_identity(cfg))
+
+
+def _request_semaphore(limit: int) -> asyncio.Semaphore:
+    # asyncio primitives bind to the loop that first awaits them, so keep one semaphore per running loop.
+    loop = asyncio.get_running_loop()
+    semaphore = _REQUEST_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(limit)
+        _REQUEST_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+
+def _call_deadline(cfg: PydanticAIRuntimeConfig, deadline: Deadline | None) -> Deadline:
+    if deadline is None:
+        return Deadline.after(cfg.request_timeout_seconds)
+    return deadline.limit(cfg.request_timeout_seconds)
+
+
+def _deadline_settings(budget: Deadline) -> ModelSettings:
+    # Raises DeadlineExceeded instead of starting a request that cannot finish in time.
+    _load_llm_stack()
+    return ModelSettings(timeout=budget.check("llm request"))
+
+
+class _InvalidModelOutput(ValueError):
+    """Model answered, but the output did not validate; keeps the raw text for telemetry."""
+
+    def __init__(self, raw_output: str, detail: str = "model output failed schema validation") -> None:
+        super().__init__(detail)
+        self.raw_output = raw_output
+
+
+def _validated_output(
+    output: Any,
+    output_type: type[_StructuredModel],
+    structured: bool,
+) -> tuple[_StructuredModel, str | None]:
+    # Structured agents already return a validated `output_type`; text agents return JSON text.
+    if structured:
+        return output, None
+    try:
+        return output_type.model_validate_json(_extract_json_payload(output)), output
+    except ValueError as exc:
+        raise _InvalidModelOutput(output) from exc
+
+
+def _request(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    budget: Deadline,
+    *,
+    structured: bool = False,
+) -> tuple[_StructuredModel, str | None]:
+    """Send one validated request; `structured` uses pydantic-ai output tools instead of text JSON."""
+    if not cfg.coalesce_requests:
+        return _send_request(cfg, model_name, prompt, output_type, budget, structured=structured)
+    return LLM_SINGLE_FLIGHT.run(
+        _flight_key(cfg, model_name, prompt, output_type, structured),
+        lambda: _send_request(cfg, model_name, prompt, output_type, budget, structured=structured),
+        timeout=budget.check("llm request"),
+    )
+
+
+async def _arequest(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    budget: Deadline,
+    *,
+    structured: bool = False,
+) -> tuple[_StructuredModel, str | None]:
+    """Async `_request`; identical requests in flight on any thread or loop share one call."""
+    if not cfg.coalesce_requests:
+        return await _asend_request(cfg, model_name, prompt, output_type, budget, structured=structured)
+    return await LLM_SINGLE_FLIGHT.arun(
+        _flight_key(cfg, model_name, prompt, output_type, structured),
+        lambda: _asend_request(cfg, model_name, prompt, output_type, budget, structured=structured),
+        timeout=budget.check("llm request"),
+    )
+
+
+def _flight_key(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
+    prompt: str,
+    output_type: type[BaseModel],
+    structured: bool,
+) -> tuple[object, ...]:
+    return (*_account_identity(cfg), model_name, output_type, structured, prompt)
+
+
+def _account_identity(cfg: PydanticAIRuntimeConfig) -> tuple[str, str]:
+    """Endpoint and API-key digest: requests from different accounts never share an answer."""
+    key_digest = hashlib.sha256((cfg.openrouter_api_key or "").encode("utf-8")).hexdigest()
+    return cfg.openrouter_base_url, key_digest
+
+
+def _send_request(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    budget: Deadline,
+    *,
+    structured: bool = False,
+) -> tuple[_StructuredModel, str | None]:
+    if _hedge_candidates(cfg, model_name)[1:] or (cfg.stream_validation and not structured):
+        # Hedging and streamed validation are async, so run the async path on this thread's own loop.
+        return _thread_event_loop().run_until_complete(
+            _asend_request(cfg, model_name, prompt, output_type, budget, structured=structured)
+        )
+    with _breaker_guard(cfg, model_name):
+        agent = _cached_agent(cfg, model_name, output_type if structured else str)
+        started = time.perf_counter()
+        result = _run_agent_sync(agent, prompt, budget)
+        validated = _validated_output(result.output, output_type, structured)
+    record_model_response(model_name, time.perf_counter() - started)
+    return validated
+
+
+async def _asend_request(
+    cfg: PydanticAIRuntimeConfig,
+    model_name: str,
+    prompt: str,
+    output_type: type[_StructuredModel],
+    budget: Deadline,
+    *,
+    structured: bool = False,
+) -> tuple[_StructuredModel, str | None]:
+    """Send one request without coalescing; with hedge models configured the first validated answer wins."""
+
+    async def attempt(candidate: str) -> tuple[_StructuredModel, str | None]:
+        # An open breaker fails the attempt at once, so hedging moves straight to the next ranked model.
+        with _breaker_guard(cfg, candidate):
+            agent = _cached_agent(cfg, candidate, output_type if structured else str)
+            started = time.perf_counter()
+            if cfg.stream_validation and not structured:
+                output = await _stream_agent_text(agent, prompt, cfg, budget, output_type)
+            else:
+                output = (await _run_agent(agent, prompt, cfg, budget)).output
+            validated = _validated_output(output, output_type, structured)
+        record_model_response(candidate, time.perf_counter() - started)
+        return validated
+
+    candidates = _hedge_candidates(cfg, model_name)
+    if len(candidates) == 1:
+        return await attempt(model_name)
+    delay = hedge_delay(model_name, quantile=cfg.hedge_percentile, default_seconds=cfg.hedge_delay_seconds)
+    return await run_hedged(candidates, attempt, delay=delay)
+
+
+def _circuit_breaker(cfg: PydanticAIRuntimeConfig, model_name: str) -> CircuitBreaker:
+    return LLM_CIRCUIT_BREAKERS.breaker(
+        cfg.openrouter_base_url,
+        model_name,
+        failure_threshold=cfg.breaker_failure_threshold,
+        cooldown_seconds=cfg.breaker_cooldown_seconds,
+        half_open_probes=cfg.breaker_half_open_probes,
     )
 
+
+@contextmanager
+def _breaker_guard(cfg: PydanticAIRuntimeConfig, model_name: str) -> Iterator[None]:
+    """Admit one request through the model's breaker and report how it ended.
+
+    Provider errors and timeouts count as failures. Invalid output still proves the provider answered, so it
+    counts as a success; requests that were cancelled or never sent (deadline already spent) count as neither.
+    """
+    if not cfg.circuit_breaker:
+        yield
+        return
+    breaker = _circuit_breaker(cfg, model_name)
+    try:
+        ticket = breaker.acquire()
+    except CircuitOpenError as exc:
+        _emit_breaker_debug(f"breaker model={model_name} short_circuit detail={exc}")
+        raise
+    try:
+        yield
+    except _InvalidModelOutput:
+        _breaker_transition(breaker, ticket.state, breaker.record_success(ticket))
+        raise
+    except DeadlineExceeded:
+        breaker.release(ticket)
+        raise
+    except Exception:
+        _breaker_transition(breaker, ticket.state, breaker.record_failure(ticket))
+        raise
+    except BaseException:
+        breaker.release(ticket)
+        raise
+    else:
+        _breaker_transition(breaker, ticket.state, breaker.record_success(ticket))
+
+
+def _breaker_transition(breaker: CircuitBreaker, before: str, after: str) -> None:
+    if before != after:
+        _emit_breaker_debug(f"breaker model={breaker.name} state={before}->{after}")
+
+
+def _emit_breaker_debug(message: str) -> None:
+    if _env_flag(environ, "POKECOACH_LLM_DEBUG"):
+        _emit_debug(message)
+
+
+def _hedge_candidates(cfg: PydanticAIRuntimeConfig, model_name: str) -> list[str]:
+    return list(dict.fromkeys([model_name, *cfg.hedge_models]))
+
+
+def _thread_event_loop() -> asyncio.AbstractEventLoop:
+    loop = getattr(_THREAD_CLIENTS, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _THREAD_CLIENTS.loop = loop
+    return loop
+
+
+def _run_agent_sync(agent: Agent, prompt: str, budget: Deadline):
+    return agent.run_sync(prompt, model_settings=_deadline_settings(budget))
+
+
+async def _run_agent(agent: Agent, prompt: str, cfg: PydanticAIRuntimeConfig, budget: Deadline):
+    # The wall-clock bound also covers time spent waiting for a semaphore slot.
+    async with asyncio.timeout(budget.check("llm request")):
+        async with _request_semaphore(cfg.max_concurrency):
+            return await agent.run(prompt, model_settings=_deadline_settings(budget))
+
+
+async def _stream_agent_text(
+    agent: Agent,
+    prompt: str,
+    cfg: PydanticAIRuntimeConfig,
+    budget: Deadline,
+    output_type: type[BaseModel],
+) -> str:
+    """Stream a text completion, aborting (and closing the stream) once it can no longer match `output_type`."""
+    validator = IncrementalJSONValidator(output_type)
+    chunks: list[str] = []
+    async with asyncio.timeout(budget.check("llm request")):
+        async with _request_semaphore(cfg.max_concurrency):
+            async with agent.run_stream(prompt, model_settings=_deadline_settings(budget)) as stream:
+                async for delta in stream.stream_text(delta=True, debounce_by=None):
+                    chunks.append(delta)
+                    try:
+                        validator.feed(delta)
+                    except StreamValidationError as exc:
+                        raise _InvalidModelOutput("".join(chunks), f"stream aborted: {exc}") from exc
+    return "".join(chunks)
+
+
+def _text_json_guidance_steps(
+    *,
+    config: PydanticAIRuntimeConfig,
+    prompt: str,
+    debug_enabled: bool,
+    budget: Deadline,
+) -> _RequestSteps[LLMReportGuidance | None]:
+    json_prompt = f"{prompt}\n\n{_GUIDANCE_JSON_INSTRUCTION}"
+
     last_error: Exception | None = None
     for attempt in (1, 2):
         try:
             if debug_enabled:
-                _emit_debug(f"attempt={attempt} mode=text_json model={model_name} base_url={base_url}")
-            result = text_agent.run_sync(json_prompt)
-            payload = _extract_json_payload(result.output)
-            guidance = LLMReportGuidance.model_validate_json(payload)
+                _emit_debug(
+                    f"attempt={attempt} mode=text_json model={config.model} base_url={config.openrouter_base_url}"
+                )
+            guidance, _raw = yield _RequestStep(config, config.model, json_prompt, LLMReportGuidance, budget)
             if debug_enabled:
                 _emit_debug(
                     f"live guidance ok attempt={attempt} mode=text_json summary_items={len(guidance.summary)} "
@@ -334,6 +1037,8 @@ def _run_text_json_guidance(
             last_error = exc
             if debug_enabled:
                 _emit_debug(f"attempt={attempt} mode=text_json failed type={type(exc).__name__} detail={exc}")
+            if isinstance(exc, CircuitOpenError):
+                break
 
     if debug_enabled and last_error is not None:
         _emit_debug(f"fallback=deterministic reason={type(last_error).__name__}")
@@ -382,5 +1087,26 @@ def _env_flag(values: Mapping[str, str], key: str) -> bool:
     return values.get(key, "").strip().lower() in _DEBUG_TRUTHY
 
 
+def _env_positive_int(values: Mapping[str, str], key: str, default: int) -> int:
+    try:
+        parsed = int(values.get(key, "").strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _env_positive_float(values: Mapping[str, str], key: str, default: float) -> float:
+    try:
+        parsed = float(values.get(key, "").strip())
+    except ValueError:
+        return default
+    return parsed if parsed > 0 else default
+
+
+def _env_choice(values: Mapping[str, str], key: str, choices: tuple[str, ...]) -> str:
+    value = values.get(key, "").strip().lower()
+    return value if value in choices else choices[0]
+
+
 def _emit_debug(message: str) -> None:
     print(f"[pokecoach.llm] {message}", file=sys.stderr)
@@ -0,0 +1,177 @@
+"""Single-flight coalescing: concurrent identical LLM requests share one in-flight call and its result."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TypeVar
+
+_FlightResult = TypeVar("_FlightResult")
+
+
+class _LeaderGaveUp(Exception):
+    """The leader stopped on its own deadline or was cancelled; waiters start a new call instead."""
+
+
+@dataclass
+class LLMCoalesceStats:
+    """Requests answered by another caller's in-flight call inside one `track_llm_coalesce_stats` block."""
+
+    coalesced: int = 0
+
+
+_COALESCE_STATS: ContextVar[LLMCoalesceStats | None] = ContextVar("pokecoach_llm_coalesce_stats", default=None)
+
+
+@contextmanager
+def track_llm_coalesce_stats() -> Iterator[LLMCoalesceStats]:
+    """Count coalesced requests made in the current context (each asyncio task keeps its own counters)."""
+    stats = LLMCoalesceStats()
+    token = _COALESCE_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _COALESCE_STATS.reset(token)
+
+
+class SingleFlight:
+    """In-flight calls by key, shared across threads and event loops.
+
+    The first caller for a key runs the call; callers arriving while it is in flight wait for the same
+    result (or provider error) instead of issuing their own. The key is released as soon as the call
+    settles, so later callers start a fresh one. Waiters are bounded by their own `timeout`, not the
+    leader's: when the leader times out or is cancelled, its waiters start a new call within what is
+    left of their own budget rather than inheriting the leader's failure.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        key: Hashable,
+        call: Callable[[], _FlightResult],
+        *,
+        timeout: float | None = None,
+    ) -> _FlightResult:
+        deadline = _deadline(timeout)
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                result = future.result(timeout=_remaining(deadline))
+            except _LeaderGaveUp:
+                continue
+            except TimeoutError:
+                raise
+            except Exception:
+                _record_coalesced()
+                raise
+            _record_coalesced()
+            return result
+        try:
+            result = call()
+        except TimeoutError:
+            self._settle(key, future, error=_LeaderGaveUp())
+            raise
+        except Exception as exc:
+            self._settle(key, future, error=exc)
+            raise
+        except BaseException:
+            self._settle(key, future, error=_LeaderGaveUp())
+            raise
+        self._settle(key, future, result=result)
+        return result
+
+    async def arun(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[_FlightResult]],
+        *,
+        timeout: float | None = None,
+    ) -> _FlightResult:
+        deadline = _deadline(timeout)
+        while True:
+            future, leader = self._join(key)
+            if leader:
+                break
+            try:
+                # shield: a waiter timing out or being cancelled must not cancel the shared call.
+                async with asyncio.timeout(_remaining(deadline)):
+                    result = await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderGaveUp:
+                continue
+            except TimeoutError:
+                raise
+            except Exception:
+                _record_coalesced()
+                raise
+            _record_coalesced()
+            return result
+        try:
+            result = await call()
+        except TimeoutError:
+            self._settle(key, future, error=_LeaderGaveUp())
+            raise
+        except Exception as exc:
+            self._settle(key, future, error=exc)
+            raise
+        except BaseException:
+            self._settle(key, future, error=_LeaderGaveUp())
+            raise
+        self._settle(key, future, result=result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _settle(
+        self,
+        key: Hashable,
+        future: Future,
+        *,
+        result: object = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+LLM_SINGLE_FLIGHT = SingleFlight()
+
+
+def _deadline(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline: float | None) -> float | None:
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+
+def _record_coalesced() -> None:
+    stats = _COALESCE_STATS.get()
+    if stats is not None:
+        stats.coalesced += 1
@@ -0,0 +1,160 @@
+"""Compact, token-budgeted battle-log digest for LLM prompts."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from pokecoach.schemas import MatchFacts, TurnSpan
+from pokecoach.tools import LogSource, ParsedLog, parse_log
+
+DEFAULT_PROMPT_TOKEN_BUDGET = 1500
+PROMPT_CONTEXT_MODES = ("compact", "raw")
+CHARS_PER_TOKEN = 4
+
+# Lower rank survives first when the budget is tight.
+_EVENT_PRIORITY = {
+    "CONCEDE": 0,
+    "KO": 0,
+    "PRIZE_TAKEN": 0,
+    "ATTACK": 1,
+    "ACTION": 1,
+    "SUPPORTER": 2,
+    "STADIUM": 3,
+}
+_LINE_TEXT_MAX_CHARS = 240
+
+
+@dataclass(frozen=True)
+class _DigestLine:
+    line: int
+    tags: tuple[str, ...]
+    text: str
+    turn_index: int | None
+
+    @property
+    def priority(self) -> int:
+        return min(_EVENT_PRIORITY.get(tag, len(_EVENT_PRIORITY)) for tag in self.tags)
+
+    def render(self) -> str:
+        return f"L{self.line} [{'/'.join(self.tags)}] {self.text}"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap model-agnostic token estimate (~4 characters per token)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def build_prompt_context(log: LogSource, *, token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET) -> str:
+    """Render key events, play-bundle actions and match facts as a turn-by-turn digest.
+
+    Every kept line carries its original log line number so model claims stay checkable against the log.
+    When the digest would exceed ``token_budget``, lower-priority lines (stadiums, then supporters, then
+    attacks) are dropped first, mid-game before opening and endgame, and the omission is stated in the digest.
+    """
+    parsed = log if isinstance(log, ParsedLog) else parse_log(log)
+    header = _render_header(parsed.players, parsed.match_facts, len(parsed.lines))
+    candidates = _collect_digest_lines(parsed)
+    turn_headers = [_render_turn_header(turn) for turn in parsed.turns]
+
+    # Within a priority tier keep the opening and the endgame, dropping mid-game lines first.
+    by_line = sorted(candidates, key=lambda item: item.line)
+    edge_distance = {item.line: min(index, len(by_line) - 1 - index) for index, item in enumerate(by_line)}
+
+    used = estimate_tokens(header) + 1
+    selected: list[_DigestLine] = []
+    opened_turns: set[int | None] = set()
+    for candidate in sorted(candidates, key=lambda item: (item.priority, edge_distance[item.line], item.line)):
+        cost = estimate_tokens(candidate.render()) + 1
+        if candidate.turn_index not in opened_turns:
+            cost += estimate_tokens(_turn_header_text(turn_headers, candidate.turn_index)) + 1
+        if used + cost > token_budget:
+            continue
+        used += cost
+        selected.append(candidate)
+        opened_turns.add(candidate.turn_index)
+
+    rendered = [header]
+    current_turn: object = object()
+    for item in sorted(selected, key=lambda entry: entry.line):
+        if item.turn_index != current_turn:
+            current_turn = item.turn_index
+            rendered.append(_turn_header_text(turn_headers, item.turn_index))
+        rendered.append(item.render())
+    omitted = len(candidates) - len(selected)
+    if omitted:
+        rendered.append(f"({omitted} lower-priority lines omitted to fit the prompt budget.)")
+    return "\n".join(rendered)
+
+
+def select_prompt_log(
+    log_text: str,
+    *,
+    parsed: ParsedLog | None = None,
+    mode: str = "compact",
+    token_budget: int = DEFAULT_PROMPT_TOKEN_BUDGET,
+) -> str:
+    """Return the battle log text a prompt should embed for `mode`.
+
+    "raw" returns `log_text` unchanged. "compact" returns the digest unless it is not shorter than the log
+    itself, which happens for very short logs where the header outweighs the savings. Pass `parsed` to
+    reuse an existing parse of `log_text`.
+    """
+    if mode != "compact":
+        return log_text
+    digest = build_prompt_context(parsed if parsed is not None else log_text, token_budget=token_budget)
+    return digest if len(digest) < len(log_text) else log_text
+
+
+def _collect_digest_lines(parsed: ParsedLog) -> list[_DigestLine]:
+    tags_by_line: dict[int, list[str]] = {}
+    for event in parsed.events:
+        tags_by_line.setdefault(event.line, []).append(event.event_type)
+    for bundle in parsed.play_bundles:
+        if bundle.action_event is not None and "ATTACK" not in tags_by_line.get(bundle.action_event.line, []):
+            tags_by_line.setdefault(bundle.action_event.line, []).append("ACTION")
+
+    turn_starts = [turn.start_line for turn in parsed.turns]
+    digest_lines: list[_DigestLine] = []
+    for line_number, tags in tags_by_line.items():
+        text = " ".join(parsed.lines[line_number - 1].split())
+        if len(text) > _LINE_TEXT_MAX_CHARS:
+            text = text[: _LINE_TEXT_MAX_CHARS - 3] + "..."
+        turn_index = bisect_right(turn_starts, line_number) - 1
+        digest_lines.append(
+            _DigestLine(
+                line=line_number,
+                tags=tuple(dict.fromkeys(tags)),
+                text=text,
+                turn_index=turn_index if turn_index >= 0 else None,
+            )
+        )
+    return digest_lines
+
+
+def _render_header(players: list[str], facts: MatchFacts, line_count: int) -> str:
+    def per_player(counts: dict[str, int]) -> str:
+        return ", ".join(f"{player}={count}" for player, count in sorted(counts.items())) or "none"
+
+    outcome = facts.winner or "unknown"
+    if facts.concede:
+        outcome += " (concede)"
+    return "\n".join(
+        [
+            f"Battle log digest: key lines only, L<n> = line number in the original {line_count}-line log.",
+            f"Players: {', '.join(players) or 'unknown'}. Went first: {facts.went_first_player or 'unknown'}. "
+            f"Turns: {facts.turns_count}. Winner: {outcome}.",
+            f"Observable prizes taken: {per_player(facts.observable_prizes_taken_by_player)}. "
+            f"KOs by player: {per_player(facts.kos_by_player)}.",
+        ]
+    )
+
+
+def _render_turn_header(turn: TurnSpan) -> str:
+    return f"Turn {turn.turn_number} ({turn.actor or 'unknown actor'}, L{turn.start_line}-L{turn.end_line}):"
+
+
+def _turn_header_text(turn_headers: list[str], turn_index: int | None) -> str:
+    if turn_index is None:
+        return "Setup:"
+    return turn_headers[turn_index]
@@ -4,9 +4,22 @@ from __future__ import annotations
 
 import json
 import re
+import threading
+import uuid
+from collections.abc import Awaitable, Callable, Generator, Mapping
+from dataclasses import dataclass, field, replace
 from os import environ
-
-from pokecoach.coach_auditor import run_one_iteration_coach_auditor
+from typing import Any, TypeVar
+
+from pokecoach.coach_auditor import (
+    CoachAuditorRunResult,
+    JsonlTelemetrySink,
+    ShadowAuditRunner,
+    arun_one_iteration_coach_auditor,
+    arun_shadow_audit_coach_auditor,
+    run_one_iteration_coach_auditor,
+    run_shadow_audit_coach_auditor,
+)
 from pokecoach.constants import (
     DEFAULT_NEXT_ACTIONS,
     DEFAULT_UNKNOWNS,
@@ -31,16 +44,30 @@ from pokecoach.constants import (
     TURNING_POINTS_MIN_ITEMS,
     UNKNOWN_INFERRED_TURN_ACTORS,
 )
+from pokecoach.deadline import Deadline
+from pokecoach.events.card_names import CARD_CATEGORY_POKEMON
+from pokecoach.events.keywords import card_mentions
 from pokecoach.factories import build_evidence_span
 from pokecoach.guardrails import apply_report_guardrails
+from pokecoach.llm_breaker import LLM_CIRCUIT_BREAKERS, LLMBreakerStats, track_llm_breaker_stats
+from pokecoach.llm_cache import LLMCacheStats, track_llm_cache_stats
+from pokecoach.llm_hedging import LLMHedgeStats, track_llm_hedge_stats
 from pokecoach.llm_provider import (
+    LLMReportGuidance,
     PydanticAIRuntimeConfig,
+    amaybe_generate_audit_result_with_raw,
+    amaybe_generate_guidance,
+    amaybe_generate_guidance_with_raw,
+    arun_openrouter_structured_json,
     load_runtime_config,
     maybe_generate_audit_result_with_raw,
     maybe_generate_guidance,
     maybe_generate_guidance_with_raw,
     run_openrouter_structured_json,
 )
+from pokecoach.llm_singleflight import LLMCoalesceStats, track_llm_coalesce_stats
+from pokecoach.prompt_context import select_prompt_log
+from pokecoach.report_store import ReportStore, log_digest, pipeline_fingerprint
 from pokecoach.schemas import (
     AuditResult,
     DraftReport,
@@ -49,12 +76,20 @@ from pokecoach.schemas import (
     MatchFacts,
     Mistake,
     PatchAction,
+    PlayBundle,
     PostGameReport,
     TurningPoint,
     Violation,
 )
-from pokecoach.summary_integrity import apply_summary_claim_integrity
-from pokecoach.tools import extract_match_facts, extract_play_bundles, find_key_events, index_turns
+from pokecoach.summary_integrity import KoClaimIndex, apply_summary_claim_integrity, build_ko_claim_index
+from pokecoach.tools import (
+    ParsedLog,
+    extract_match_facts,
+    extract_play_bundles,
+    find_key_events,
+    index_turns,
+    parse_log,
+)
 
 IMPACT_KO_BASE = 100
 IMPACT_TWO_PRIZE_SWING_BONUS = 35
@@ -95,9 +130,11 @@ SPANISH_MISTAKE_FALLBACK_BETTER_LINE = "Aplica una lista de verificación antes
 SPANISH_TURNING_POINT_FALLBACK_IMPACT = "La secuencia temprana probablemente moldeó el flujo de la partida."
 SPANISH_TURNING_POINT_GENERIC_IMPACT = "Impacto observado en el ritmo o la presión de Premios."
 
+_StepResult = TypeVar("_StepResult")
 
-def _is_spanish_log(log_text: str) -> bool:
-    hits = sum(1 for line in log_text.splitlines() if SPANISH_LOG_MARKERS_RE.search(line))
+
+def _is_spanish_log(lines: list[str]) -> bool:
+    hits = sum(1 for line in lines if SPANISH_LOG_MARKERS_RE.search(line))
     return hits >= 2
 
 
@@ -141,9 +178,12 @@ def _extract_prize_count(prize_text: str) -> int:
 
 def _extract_ko_target(ko_text: str) -> str:
     match = KO_TARGET_RE.match(ko_text.strip())
-    if not match:
-        return "Unknown target"
-    return match.group(1)
+    if match:
+        return match.group(1)
+    pokemon = [mention for mention in card_mentions(ko_text) if mention.category == CARD_CATEGORY_POKEMON]
+    if pokemon:
+        return max(pokemon, key=lambda mention: (mention.end - mention.start, -mention.start)).keyword
+    return "Unknown target"
 
 
 def _extract_prize_actor(prize_text: str) -> str | None:
@@ -288,8 +328,8 @@ def _fact_summary_from_bundle(bundle) -> str | None:
     return f"{pokemon_name} de {player_name} noqueó a {target} y tomó {total_prizes} {prize_label} de Premio."
 
 
-def _summary_from_context(log_text: str, match_facts: MatchFacts, spanish_mode: bool) -> list[str]:
-    events = find_key_events(log_text).events
+def _summary_from_context(parsed: ParsedLog, match_facts: MatchFacts, spanish_mode: bool) -> list[str]:
+    events = find_key_events(parsed).events
 
     summary: list[str] = []
     if match_facts.went_first_player:
@@ -299,7 +339,7 @@ def _summary_from_context(log_text: str, match_facts: MatchFacts, spanish_mode:
             summary.append(f"{match_facts.went_first_player} took the first turn.")
 
     if spanish_mode:
-        for bundle in extract_play_bundles(log_text):
+        for bundle in extract_play_bundles(parsed):
             factual_bullet = _fact_summary_from_bundle(bundle)
             if factual_bullet is not None and factual_bullet not in summary:
                 summary.append(factual_bullet)
@@ -327,11 +367,11 @@ def _summary_from_context(log_text: str, match_facts: MatchFacts, spanish_mode:
     return list(dict.fromkeys(summary))[:SUMMARY_MAX_ITEMS]
 
 
-def _build_turning_points(log_text: str, spanish_mode: bool) -> list[TurningPoint]:
-    events = find_key_events(log_text).events
+def _build_turning_points(parsed: ParsedLog, spanish_mode: bool) -> list[TurningPoint]:
+    events = find_key_events(parsed).events
     scored_candidates: list[tuple[int, int, TurningPoint]] = []
 
-    for bundle in extract_play_bundles(log_text):
+    for bundle in extract_play_bundles(parsed):
         candidate = _build_bundle_turning_point(bundle, spanish_mode)
         if candidate is not None:
             scored_candidates.append(candidate)
@@ -380,8 +420,8 @@ def _build_turning_points(log_text: str, spanish_mode: bool) -> list[TurningPoin
     return turning_points[:TURNING_POINTS_MAX_ITEMS]
 
 
-def _build_mistakes(log_text: str, spanish_mode: bool) -> list[Mistake]:
-    events = find_key_events(log_text).events
+def _build_mistakes(parsed: ParsedLog, spanish_mode: bool) -> list[Mistake]:
+    events = find_key_events(parsed).events
     candidates = [event for event in events if event.event_type in {"ATTACK", "KO", "SUPPORTER"}]
 
     mistakes: list[Mistake] = []
@@ -420,200 +460,588 @@ def _build_mistakes(log_text: str, spanish_mode: bool) -> list[Mistake]:
     return mistakes[:MISTAKES_MAX_ITEMS]
 
 
-def _env_flag(name: str) -> bool:
-    return environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+def _env_flag(values: Mapping[str, str], name: str) -> bool:
+    return values.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_seconds(values: Mapping[str, str], name: str) -> float | None:
+    try:
+        parsed = float(values.get(name, "").strip())
+    except ValueError:
+        return None
+    return parsed if parsed > 0 else None
+
+
+@dataclass(frozen=True)
+class ReportOptions:
+    """Immutable per-report settings, so reports with different modes can run concurrently in one process.
+
+    `from_env()` reproduces the environment-driven defaults; derive variants with `dataclasses.replace`
+    instead of changing `os.environ`. `deterministic_only` keeps every stage on the deterministic fallback
+    whatever `runtime` holds. Agent models and timeouts default to the runtime model and request timeout.
+    """
+
+    runtime: PydanticAIRuntimeConfig
+    deterministic_only: bool = False
+    agentic_coach_auditor: bool = False
+    shadow_audit: bool = False
+    include_agentic_telemetry: bool = False
+    agent_a_model: str | None = None
+    agent_b_model: str | None = None
+    agent_a_timeout_seconds: float | None = None
+    agent_b_timeout_seconds: float | None = None
+
+    @classmethod
+    def from_env(cls) -> ReportOptions:
+        """Read the runtime config and the `POKECOACH_AGENTIC_*` / `POKECOACH_AGENT_*` variables."""
+        return cls(
+            runtime=load_runtime_config(),
+            agentic_coach_auditor=_env_flag(environ, "POKECOACH_AGENTIC_COACH_AUDITOR"),
+            shadow_audit=_env_flag(environ, "POKECOACH_AGENTIC_SHADOW_AUDIT"),
+            include_agentic_telemetry=_env_flag(environ, "POKECOACH_INCLUDE_AGENTIC_TELEMETRY"),
+            agent_a_model=environ.get("POKECOACH_AGENT_A_MODEL", "").strip() or None,
+            agent_b_model=environ.get("POKECOACH_AGENT_B_MODEL", "").strip() or None,
+            agent_a_timeout_seconds=_env_seconds(environ, "POKECOACH_AGENT_A_TIMEOUT_SECONDS"),
+            agent_b_timeout_seconds=_env_seconds(environ, "POKECOACH_AGENT_B_TIMEOUT_SECONDS"),
+        )
+
+    @property
+    def llm_config(self) -> PydanticAIRuntimeConfig:
+        """Config for the LLM calls of this report; without an API key when `deterministic_only`."""
+        if self.deterministic_only:
+            return replace(self.runtime, openrouter_api_key=None)
+        return self.runtime
+
+    def agent_configs(self) -> tuple[PydanticAIRuntimeConfig, PydanticAIRuntimeConfig]:
+        """Agent A (coach) and Agent B (auditor) configs with their model and timeout overrides applied."""
+        runtime = self.llm_config
+        return (
+            replace(
+                runtime,
+                model=self.agent_a_model or runtime.model,
+                request_timeout_seconds=self.agent_a_timeout_seconds or runtime.request_timeout_seconds,
+            ),
+            replace(
+                runtime,
+                model=self.agent_b_model or runtime.model,
+                request_timeout_seconds=self.agent_b_timeout_seconds or runtime.request_timeout_seconds,
+            ),
+        )
+
+
+def _stage_deadline(deadline: Deadline, config: PydanticAIRuntimeConfig) -> Deadline:
+    return deadline.limit(config.request_timeout_seconds)
+
+
+def _record_deadline_miss(stages: list[str], stage: str, stage_deadline: Deadline) -> None:
+    if stage_deadline.expired:
+        stages.append(stage)
+
+
+def _record_llm_fallback(stages: list[str], stage: str, config: PydanticAIRuntimeConfig) -> None:
+    # Without live mode the deterministic output is the expected result, not a fallback.
+    if config.live_mode_enabled:
+        stages.append(stage)
+
+
+def _fallback_audit(draft: DraftReport, spanish_mode: bool) -> AuditResult:
+    violations = []
+    if len(draft.summary) < 5 or len(draft.summary) > SUMMARY_MAX_ITEMS:
+        violations.append(
+            {
+                "code": "FORMAT_CARDINALITY_SUMMARY",
+                "severity": "major",
+                "field": "summary",
+                "message": "Summary cardinality out of range.",
+                "suggested_fix": "Adjust summary to 5-8 bullets.",
+            }
+        )
+    if len(draft.next_actions) < 3 or len(draft.next_actions) > len(SPANISH_DEFAULT_NEXT_ACTIONS):
+        violations.append(
+            {
+                "code": "FORMAT_CARDINALITY_ACTIONS",
+                "severity": "major",
+                "field": "next_actions",
+                "message": "Next actions cardinality out of range.",
+                "suggested_fix": "Adjust next_actions to 3-5 bullets.",
+            }
+        )
+    if spanish_mode and any(not _is_spanish_consistent_text(item) for item in draft.summary + draft.next_actions):
+        violations.append(
+            {
+                "code": "LANGUAGE_MISMATCH",
+                "severity": "critical",
+                "field": "summary|next_actions",
+                "message": "Language mismatch with Spanish mode.",
+                "suggested_fix": "Rewrite bullets in Spanish.",
+            }
+        )
+    return AuditResult(
+        quality_minimum_pass=not violations,
+        violations=violations,
+        patch_plan=[],
+        audit_summary="Auto-audit pass." if not violations else "Auto-audit fail.",
+    )
 
 
-def _run_agentic_coach_auditor(
+def _rewrite_prompt(
     *,
     log_text: str,
-    summary: list[str],
-    next_actions: list[str],
+    draft: DraftReport,
+    violations: list[Violation],
+    patch_plan: list[PatchAction],
     fallback_summary: list[str],
     spanish_mode: bool,
-) -> tuple[list[str], list[str], dict[str, object] | None]:
-    if not _env_flag("POKECOACH_AGENTIC_COACH_AUDITOR"):
-        return summary, next_actions, None
-
-    events: list[dict[str, object]] = []
-    include_telemetry = _env_flag("POKECOACH_INCLUDE_AGENTIC_TELEMETRY")
-    raw_outputs: dict[str, str | None] = {
-        "agent_a_raw_output": None,
-        "agent_b_raw_output_first": None,
-        "agent_b_raw_output_second": None,
-    }
-
-    runtime = load_runtime_config()
-    agent_a_model = environ.get("POKECOACH_AGENT_A_MODEL", "").strip() or runtime.model
-    agent_b_model = environ.get("POKECOACH_AGENT_B_MODEL", "").strip() or runtime.model
-    agent_a_config = PydanticAIRuntimeConfig(
-        openrouter_api_key=runtime.openrouter_api_key,
-        openrouter_base_url=runtime.openrouter_base_url,
-        model=agent_a_model,
-    )
-    agent_b_config = PydanticAIRuntimeConfig(
-        openrouter_api_key=runtime.openrouter_api_key,
-        openrouter_base_url=runtime.openrouter_base_url,
-        model=agent_b_model,
+) -> str:
+    fallback_actions = SPANISH_DEFAULT_NEXT_ACTIONS if spanish_mode else DEFAULT_NEXT_ACTIONS
+    return (
+        "You are Agent A (coach) rewriting DraftReport after auditor feedback.\n"
+        "Apply patch_plan and resolve violations while preserving factual grounding in the battle log.\n"
+        "Return JSON matching DraftReport exactly.\n\n"
+        f"fallback_summary={json.dumps(fallback_summary, ensure_ascii=False)}\n"
+        f"fallback_next_actions={json.dumps(fallback_actions, ensure_ascii=False)}\n"
+        f"draft_report={draft.model_dump_json()}\n"
+        f"violations={json.dumps([item.model_dump(mode='json') for item in violations], ensure_ascii=False)}\n"
+        f"patch_plan={json.dumps([item.model_dump(mode='json') for item in patch_plan], ensure_ascii=False)}\n"
+        f"battle_log={json.dumps(log_text, ensure_ascii=False)}"
     )
 
-    def fallback_auditor(draft: DraftReport) -> AuditResult:
-        violations = []
-        if len(draft.summary) < 5 or len(draft.summary) > SUMMARY_MAX_ITEMS:
-            violations.append(
-                {
-                    "code": "FORMAT_CARDINALITY_SUMMARY",
-                    "severity": "major",
-                    "field": "summary",
-                    "message": "Summary cardinality out of range.",
-                    "suggested_fix": "Adjust summary to 5-8 bullets.",
-                }
-            )
-        if len(draft.next_actions) < 3 or len(draft.next_actions) > len(SPANISH_DEFAULT_NEXT_ACTIONS):
-            violations.append(
-                {
-                    "code": "FORMAT_CARDINALITY_ACTIONS",
-                    "severity": "major",
-                    "field": "next_actions",
-                    "message": "Next actions cardinality out of range.",
-                    "suggested_fix": "Adjust next_actions to 3-5 bullets.",
-                }
-            )
-        if spanish_mode and any(not _is_spanish_consistent_text(item) for item in draft.summary + draft.next_actions):
-            violations.append(
-                {
-                    "code": "LANGUAGE_MISMATCH",
-                    "severity": "critical",
-                    "field": "summary|next_actions",
-                    "message": "Language mismatch with Spanish mode.",
-                    "suggested_fix": "Rewrite bullets in Spanish.",
-                }
-            )
-        return AuditResult(
-            quality_minimum_pass=not violations,
-            violations=violations,
-            patch_plan=[],
-            audit_summary="Auto-audit pass." if not violations else "Auto-audit fail.",
+
+def _fallback_rewrite(draft: DraftReport, fallback_summary: list[str], spanish_mode: bool) -> DraftReport:
+    rewritten_summary = list(draft.summary)
+    while len(rewritten_summary) < 5:
+        for item in fallback_summary:
+            if len(rewritten_summary) >= 5:
+                break
+            if item not in rewritten_summary:
+                rewritten_summary.append(item)
+        if not fallback_summary:
+            break
+    rewritten_summary = rewritten_summary[:SUMMARY_MAX_ITEMS]
+
+    rewritten_actions = list(draft.next_actions)
+    defaults = list(SPANISH_DEFAULT_NEXT_ACTIONS if spanish_mode else DEFAULT_NEXT_ACTIONS)
+    while len(rewritten_actions) < 3:
+        for item in defaults:
+            if len(rewritten_actions) >= 3:
+                break
+            if item not in rewritten_actions:
+                rewritten_actions.append(item)
+        if not defaults:
+            break
+    rewritten_actions = rewritten_actions[: len(defaults)]
+
+    if spanish_mode:
+        rewritten_summary = _normalize_spanish_list(
+            rewritten_summary,
+            fallback_summary,
+            min_items=5,
+            max_items=SUMMARY_MAX_ITEMS,
+        )
+        rewritten_actions = _normalize_spanish_list(
+            rewritten_actions,
+            defaults,
+            min_items=3,
+            max_items=len(defaults),
         )
 
-    audit_call_count = 0
+    return DraftReport(summary=rewritten_summary, next_actions=rewritten_actions, unknowns=[])
 
-    def draft_generator() -> DraftReport:
-        guidance, raw = maybe_generate_guidance_with_raw(
-            log_text=log_text,
-            fallback_summary=fallback_summary,
-            fallback_next_actions=next_actions,
-            spanish_mode=spanish_mode,
-            config=agent_a_config,
+
+def _draft_from_guidance(
+    guidance: LLMReportGuidance | None, summary: list[str], next_actions: list[str]
+) -> DraftReport:
+    if guidance is None:
+        return DraftReport(summary=list(summary), next_actions=list(next_actions), unknowns=[])
+    return DraftReport(summary=list(guidance.summary), next_actions=list(guidance.next_actions), unknowns=[])
+
+
+def _agentic_telemetry(
+    result: CoachAuditorRunResult,
+    *,
+    agent_a_config: PydanticAIRuntimeConfig,
+    agent_b_config: PydanticAIRuntimeConfig,
+    raw_outputs: dict[str, str | None],
+    events: list[dict[str, object]],
+    cache_stats: LLMCacheStats,
+    hedge_stats: LLMHedgeStats,
+    coalesce_stats: LLMCoalesceStats,
+    breaker_stats: LLMBreakerStats,
+    include_details: bool,
+) -> dict[str, object]:
+    telemetry: dict[str, object] = result.metadata.model_dump()
+    telemetry.update(
+        _llm_call_telemetry(
+            agent_a_config=agent_a_config,
+            agent_b_config=agent_b_config,
+            cache_stats=cache_stats,
+            hedge_stats=hedge_stats,
+            coalesce_stats=coalesce_stats,
+            breaker_stats=breaker_stats,
         )
-        raw_outputs["agent_a_raw_output"] = raw
-        if guidance is None:
-            return DraftReport(summary=list(summary), next_actions=list(next_actions), unknowns=[])
-        return DraftReport(summary=list(guidance.summary), next_actions=list(guidance.next_actions), unknowns=[])
+    )
+    if include_details:
+        telemetry["agent_a_model"] = agent_a_config.model
+        telemetry["agent_b_model"] = agent_b_config.model
+        telemetry.update(raw_outputs)
+        telemetry["events"] = events
+    return telemetry
+
+
+def _llm_call_telemetry(
+    *,
+    agent_a_config: PydanticAIRuntimeConfig,
+    agent_b_config: PydanticAIRuntimeConfig,
+    cache_stats: LLMCacheStats,
+    hedge_stats: LLMHedgeStats,
+    coalesce_stats: LLMCoalesceStats,
+    breaker_stats: LLMBreakerStats,
+) -> dict[str, object]:
+    return {
+        "llm_cache_hits": cache_stats.hits,
+        "llm_cache_misses": cache_stats.misses,
+        "llm_hedged_requests": hedge_stats.hedged_requests,
+        "llm_coalesced_requests": coalesce_stats.coalesced,
+        "llm_short_circuited_requests": dict(sorted(breaker_stats.short_circuited.items())),
+        "llm_circuit_breakers": LLM_CIRCUIT_BREAKERS.snapshot(
+            [agent_a_config.model, agent_b_config.model, *agent_a_config.hedge_models, *agent_b_config.hedge_models]
+        ),
+        "llm_model_stats": hedge_stats.model_stats(),
+    }
+
+
+DEFAULT_SHADOW_AUDIT_LOG = ".pokecoach_cache/shadow_audits.jsonl"
+
+_SHADOW_AUDIT_RUNNER: ShadowAuditRunner | None = None
+_SHADOW_AUDIT_RUNNER_LOCK = threading.Lock()
+
 
+def shadow_audit_runner() -> ShadowAuditRunner:
+    """Return the process-wide shadow audit runner, writing records to `POKECOACH_SHADOW_AUDIT_LOG`."""
+    global _SHADOW_AUDIT_RUNNER
+    with _SHADOW_AUDIT_RUNNER_LOCK:
+        if _SHADOW_AUDIT_RUNNER is None:
+            log_path = environ.get("POKECOACH_SHADOW_AUDIT_LOG", "").strip() or DEFAULT_SHADOW_AUDIT_LOG
+            _SHADOW_AUDIT_RUNNER = ShadowAuditRunner([JsonlTelemetrySink(log_path)])
+        return _SHADOW_AUDIT_RUNNER
+
+
+def drain_shadow_audits(timeout: float | None = None) -> bool:
+    """Wait for background shadow audits to be recorded; call before a batch run or server exits."""
+    runner = _SHADOW_AUDIT_RUNNER
+    if runner is None:
+        return True
+    return runner.shutdown(timeout)
+
+
+def _shadow_audit_context(
+    options: ReportOptions,
+    agent_a_config: PydanticAIRuntimeConfig,
+    agent_b_config: PydanticAIRuntimeConfig,
+) -> dict[str, object] | None:
+    if not options.shadow_audit:
+        return None
+    return {
+        "shadow_audit_id": uuid.uuid4().hex,
+        "agent_a_model": agent_a_config.model,
+        "agent_b_model": agent_b_config.model,
+    }
+
+
+def _shadow_auditor(
+    *,
+    log_text: str,
+    spanish_mode: bool,
+    config: PydanticAIRuntimeConfig,
+) -> Callable[[DraftReport], AuditResult]:
+    # Runs on a runner thread after the report returned, so it must not touch per-report state. A missing
+    # audit raises, so the runner records `shadow_audit_failed` rather than the deterministic fallback's
+    # violations as if Agent B had found them.
     def auditor(draft: DraftReport) -> AuditResult:
-        nonlocal audit_call_count
-        audit_call_count += 1
-        audit_result, raw = maybe_generate_audit_result_with_raw(
+        audit_result, _raw = maybe_generate_audit_result_with_raw(
             log_text=log_text,
             draft=draft,
             spanish_mode=spanish_mode,
-            config=agent_b_config,
+            config=config,
         )
-        if audit_call_count == 1:
-            raw_outputs["agent_b_raw_output_first"] = raw
-        else:
-            raw_outputs["agent_b_raw_output_second"] = raw
         if audit_result is None:
-            return fallback_auditor(draft)
+            raise RuntimeError(f"no valid audit from model {config.model}")
         return audit_result
 
-    def rewrite_generator(
+    return auditor
+
+
+@dataclass(frozen=True)
+class _LLMCall:
+    """A provider call requested by a report step generator, by name (see `_llm_calls`)."""
+
+    name: str
+    kwargs: dict[str, Any]
+
+
+def _llm_calls() -> dict[str, Callable[..., Any]]:
+    # Resolved per report rather than at import, so the module-level provider functions can be swapped.
+    return {
+        "guidance": maybe_generate_guidance,
+        "guidance_with_raw": maybe_generate_guidance_with_raw,
+        "audit": maybe_generate_audit_result_with_raw,
+        "structured_json": run_openrouter_structured_json,
+    }
+
+
+def _allm_calls() -> dict[str, Callable[..., Awaitable[Any]]]:
+    return {
+        "guidance": amaybe_generate_guidance,
+        "guidance_with_raw": amaybe_generate_guidance_with_raw,
+        "audit": amaybe_generate_audit_result_with_raw,
+        "structured_json": arun_openrouter_structured_json,
+    }
+
+
+@dataclass
+class _AgenticRun:
+    """Agent A/B stages of one report; each stage is a step generator yielding its single provider call."""
+
+    context: _ReportContext
+    agent_a_config: PydanticAIRuntimeConfig
+    agent_b_config: PydanticAIRuntimeConfig
+    shadow_context: dict[str, object] | None
+    events: list[dict[str, object]] = field(default_factory=list)
+    raw_outputs: dict[str, str | None] = field(
+        default_factory=lambda: {
+            "agent_a_raw_output": None,
+            "agent_b_raw_output_first": None,
+            "agent_b_raw_output_second": None,
+        }
+    )
+    audit_call_count: int = 0
+
+    @classmethod
+    def start(cls, context: _ReportContext) -> _AgenticRun:
+        agent_a_config, agent_b_config = context.options.agent_configs()
+        return cls(
+            context=context,
+            agent_a_config=agent_a_config,
+            agent_b_config=agent_b_config,
+            shadow_context=_shadow_audit_context(context.options, agent_a_config, agent_b_config),
+        )
+
+    def draft_steps(self) -> _ReportSteps[DraftReport]:
+        context = self.context
+        stage_deadline = _stage_deadline(context.deadline, self.agent_a_config)
+        guidance, raw = yield _LLMCall(
+            "guidance_with_raw",
+            {
+                "log_text": context.prompt_log,
+                "fallback_summary": context.fallback_summary,
+                "fallback_next_actions": context.next_actions,
+                "spanish_mode": context.spanish_mode,
+                "config": self.agent_a_config,
+                "deadline": stage_deadline,
+            },
+        )
+        self.raw_outputs["agent_a_raw_output"] = raw
+        if guidance is None:
+            _record_deadline_miss(context.deadline_exceeded_stages, "agent_a_draft", stage_deadline)
+            _record_llm_fallback(context.llm_fallback_stages, "agent_a_draft", self.agent_a_config)
+        return _draft_from_guidance(guidance, context.summary, context.next_actions)
+
+    def audit_steps(self, draft: DraftReport) -> _ReportSteps[AuditResult]:
+        context = self.context
+        self.audit_call_count += 1
+        first_audit = self.audit_call_count == 1
+        stage_deadline = _stage_deadline(context.deadline, self.agent_b_config)
+        audit_result, raw = yield _LLMCall(
+            "audit",
+            {
+                "log_text": context.prompt_log,
+                "draft": draft,
+                "spanish_mode": context.spanish_mode,
+                "config": self.agent_b_config,
+                "deadline": stage_deadline,
+            },
+        )
+        self.raw_outputs["agent_b_raw_output_first" if first_audit else "agent_b_raw_output_second"] = raw
+        if audit_result is None:
+            stage = "agent_b_audit" if first_audit else "agent_b_second_audit"
+            _record_deadline_miss(context.deadline_exceeded_stages, stage, stage_deadline)
+            _record_llm_fallback(context.llm_fallback_stages, stage, self.agent_b_config)
+            return _fallback_audit(draft, context.spanish_mode)
+        return audit_result
+
+    def rewrite_steps(
+        self,
         draft: DraftReport,
         violations: list[Violation],
         patch_plan: list[PatchAction],
-    ) -> DraftReport:
-        fallback_actions = SPANISH_DEFAULT_NEXT_ACTIONS if spanish_mode else DEFAULT_NEXT_ACTIONS
-        rewrite_prompt = (
-            "You are Agent A (coach) rewriting DraftReport after auditor feedback.\n"
-            "Apply patch_plan and resolve violations while preserving factual grounding in the battle log.\n"
-            "Return JSON matching DraftReport exactly.\n\n"
-            f"fallback_summary={json.dumps(fallback_summary, ensure_ascii=False)}\n"
-            f"fallback_next_actions={json.dumps(fallback_actions, ensure_ascii=False)}\n"
-            f"draft_report={draft.model_dump_json()}\n"
-            f"violations={json.dumps([item.model_dump(mode='json') for item in violations], ensure_ascii=False)}\n"
-            f"patch_plan={json.dumps([item.model_dump(mode='json') for item in patch_plan], ensure_ascii=False)}\n"
-            f"battle_log={json.dumps(log_text, ensure_ascii=False)}"
-        )
-        rewritten_draft, _rewritten_raw = run_openrouter_structured_json(
-            prompt=rewrite_prompt,
-            output_type=DraftReport,
-            model_name=agent_a_config.model,
-            config=agent_a_config,
+    ) -> _ReportSteps[DraftReport]:
+        context = self.context
+        stage_deadline = _stage_deadline(context.deadline, self.agent_a_config)
+        rewritten_draft, _rewritten_raw = yield _LLMCall(
+            "structured_json",
+            {
+                "prompt": _rewrite_prompt(
+                    log_text=context.prompt_log,
+                    draft=draft,
+                    violations=violations,
+                    patch_plan=patch_plan,
+                    fallback_summary=context.fallback_summary,
+                    spanish_mode=context.spanish_mode,
+                ),
+                "output_type": DraftReport,
+                "model_name": self.agent_a_config.model,
+                "config": self.agent_a_config,
+                "deadline": stage_deadline,
+            },
         )
         if rewritten_draft is not None:
             return rewritten_draft
+        _record_deadline_miss(context.deadline_exceeded_stages, "agent_a_rewrite", stage_deadline)
+        _record_llm_fallback(context.llm_fallback_stages, "agent_a_rewrite", self.agent_a_config)
+        return _fallback_rewrite(draft, context.fallback_summary, context.spanish_mode)
 
-        rewritten_summary = list(draft.summary)
-        while len(rewritten_summary) < 5:
-            for item in fallback_summary:
-                if len(rewritten_summary) >= 5:
-                    break
-                if item not in rewritten_summary:
-                    rewritten_summary.append(item)
-            if not fallback_summary:
-                break
-        rewritten_summary = rewritten_summary[:SUMMARY_MAX_ITEMS]
-
-        rewritten_actions = list(draft.next_actions)
-        defaults = list(SPANISH_DEFAULT_NEXT_ACTIONS if spanish_mode else DEFAULT_NEXT_ACTIONS)
-        while len(rewritten_actions) < 3:
-            for item in defaults:
-                if len(rewritten_actions) >= 3:
-                    break
-                if item not in rewritten_actions:
-                    rewritten_actions.append(item)
-            if not defaults:
-                break
-        rewritten_actions = rewritten_actions[: len(defaults)]
+    def shadow_auditor(self) -> Callable[[DraftReport], AuditResult]:
+        return _shadow_auditor(
+            log_text=self.context.prompt_log, spanish_mode=self.context.spanish_mode, config=self.agent_b_config
+        )
 
-        if spanish_mode:
-            rewritten_summary = _normalize_spanish_list(
-                rewritten_summary,
-                fallback_summary,
-                min_items=5,
-                max_items=SUMMARY_MAX_ITEMS,
-            )
-            rewritten_actions = _normalize_spanish_list(
-                rewritten_actions,
-                defaults,
-                min_items=3,
-                max_items=len(defaults),
-            )
 
-        return DraftReport(summary=rewritten_summary, next_actions=rewritten_actions, unknowns=[])
+_ReportStep = _LLMCall | _AgenticRun
+_ReportSteps = Generator[_ReportStep, Any, _StepResult]
+
+
+def _drive_report_steps(steps: _ReportSteps[_StepResult]) -> _StepResult:
+    """Run report steps with the blocking provider functions and coach/auditor runners."""
+    calls = _llm_calls()
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, _AgenticRun):
+                step = steps.send(_run_coach_auditor(step))
+            else:
+                step = steps.send(calls[step.name](**step.kwargs))
+    except StopIteration as finished:
+        return finished.value
+    finally:
+        steps.close()
+
+
+async def _adrive_report_steps(steps: _ReportSteps[_StepResult]) -> _StepResult:
+    """Async `_drive_report_steps`: the same steps, awaiting the async provider functions and runners."""
+    calls = _allm_calls()
+    try:
+        step = next(steps)
+        while True:
+            if isinstance(step, _AgenticRun):
+                step = steps.send(await _arun_coach_auditor(step))
+            else:
+                step = steps.send(await calls[step.name](**step.kwargs))
+    except StopIteration as finished:
+        return finished.value
+    finally:
+        steps.close()
+
+
+def _run_coach_auditor(run: _AgenticRun) -> CoachAuditorRunResult:
+    def draft_generator() -> DraftReport:
+        return _drive_report_steps(run.draft_steps())
+
+    if run.shadow_context is not None:
+        return run_shadow_audit_coach_auditor(
+            draft_generator,
+            run.shadow_auditor(),
+            shadow_runner=shadow_audit_runner(),
+            event_callback=run.events.append,
+            shadow_context=run.shadow_context,
+        )
+    return run_one_iteration_coach_auditor(
+        draft_generator,
+        lambda draft: _drive_report_steps(run.audit_steps(draft)),
+        lambda draft, violations, patch_plan: _drive_report_steps(run.rewrite_steps(draft, violations, patch_plan)),
+        event_callback=run.events.append,
+    )
+
 
-    result = run_one_iteration_coach_auditor(
+async def _arun_coach_auditor(run: _AgenticRun) -> CoachAuditorRunResult:
+    def draft_generator() -> Awaitable[DraftReport]:
+        return _adrive_report_steps(run.draft_steps())
+
+    if run.shadow_context is not None:
+        return await arun_shadow_audit_coach_auditor(
+            draft_generator,
+            run.shadow_auditor(),
+            shadow_runner=shadow_audit_runner(),
+            event_callback=run.events.append,
+            shadow_context=run.shadow_context,
+        )
+    return await arun_one_iteration_coach_auditor(
         draft_generator,
-        auditor,
-        rewrite_generator,
-        event_callback=events.append,
+        lambda draft: _adrive_report_steps(run.audit_steps(draft)),
+        lambda draft, violations, patch_plan: _adrive_report_steps(run.rewrite_steps(draft, violations, patch_plan)),
+        event_callback=run.events.append,
     )
-    telemetry: dict[str, object] = result.metadata.model_dump()
-    if include_telemetry:
-        telemetry["agent_a_model"] = agent_a_config.model
-        telemetry["agent_b_model"] = agent_b_config.model
-        telemetry.update(raw_outputs)
-        telemetry["events"] = events
+
+
+def _agentic_steps(context: _ReportContext) -> _ReportSteps[tuple[list[str], list[str], dict[str, object] | None]]:
+    if not context.options.agentic_coach_auditor:
+        return context.summary, context.next_actions, None
+
+    run = _AgenticRun.start(context)
+    with (
+        track_llm_cache_stats() as cache_stats,
+        track_llm_hedge_stats() as hedge_stats,
+        track_llm_coalesce_stats() as coalesce_stats,
+        track_llm_breaker_stats() as breaker_stats,
+    ):
+        result = yield run
+    telemetry = _agentic_telemetry(
+        result,
+        agent_a_config=run.agent_a_config,
+        agent_b_config=run.agent_b_config,
+        raw_outputs=run.raw_outputs,
+        events=run.events,
+        cache_stats=cache_stats,
+        hedge_stats=hedge_stats,
+        coalesce_stats=coalesce_stats,
+        breaker_stats=breaker_stats,
+        include_details=context.options.include_agentic_telemetry,
+    )
+    if run.shadow_context is not None:
+        telemetry["shadow_audit_id"] = run.shadow_context["shadow_audit_id"]
     return result.draft_report.summary, result.draft_report.next_actions, telemetry
 
 
-def generate_post_game_report(log_text: str) -> PostGameReport:
-    spanish_mode = _is_spanish_log(log_text)
-    turns = index_turns(log_text)
-    match_facts = extract_match_facts(log_text)
-    play_bundles = extract_play_bundles(log_text)
-    summary = _summary_from_context(log_text, match_facts, spanish_mode)
+@dataclass
+class _ReportContext:
+    """Deterministic report state threaded between the LLM stages."""
+
+    log_text: str
+    prompt_log: str
+    options: ReportOptions
+    deadline: Deadline
+    spanish_mode: bool
+    match_facts: MatchFacts
+    play_bundles: list[PlayBundle]
+    summary: list[str]
+    fallback_summary: list[str]
+    next_actions: list[str]
+    unknowns: list[str]
+    turning_points: list[TurningPoint]
+    mistakes: list[Mistake]
+    claim_index: KoClaimIndex
+    deadline_exceeded_stages: list[str] = field(default_factory=list)
+    llm_fallback_stages: list[str] = field(default_factory=list)
+
+
+def _build_report_context(log_text: str, options: ReportOptions) -> _ReportContext:
+    runtime = options.llm_config
+    deadline = Deadline.after(runtime.report_deadline_seconds)
+    parsed = parse_log(log_text)
+    spanish_mode = _is_spanish_log(parsed.lines)
+    turns = index_turns(parsed)
+    match_facts = extract_match_facts(parsed)
+    play_bundles = extract_play_bundles(parsed)
+    summary = _summary_from_context(parsed, match_facts, spanish_mode)
     fallback_summary = list(summary[:SUMMARY_MAX_ITEMS])
 
     if len(summary) < 5:
@@ -626,83 +1054,219 @@ def generate_post_game_report(log_text: str) -> PostGameReport:
     next_actions = list(SPANISH_DEFAULT_NEXT_ACTIONS if spanish_mode else DEFAULT_NEXT_ACTIONS)
 
     turning_points, mistakes, unknowns = apply_report_guardrails(
-        log_text=log_text,
-        turning_points=_build_turning_points(log_text, spanish_mode),
-        mistakes=_build_mistakes(log_text, spanish_mode),
+        log_text=parsed,
+        turning_points=_build_turning_points(parsed, spanish_mode),
+        mistakes=_build_mistakes(parsed, spanish_mode),
         unknowns=unknowns,
         event_indexer=find_key_events,
     )
 
-    if not _env_flag("POKECOACH_AGENTIC_COACH_AUDITOR"):
-        llm_guidance = maybe_generate_guidance(
-            log_text=log_text,
-            fallback_summary=fallback_summary,
-            fallback_next_actions=next_actions,
+    prompt_log = log_text
+    if runtime.live_mode_enabled:
+        prompt_log = select_prompt_log(
+            log_text, parsed=parsed, mode=runtime.prompt_context, token_budget=runtime.prompt_token_budget
         )
-        if llm_guidance is not None:
-            summary = llm_guidance.summary
-            next_actions = llm_guidance.next_actions
-    summary, unknowns = apply_summary_claim_integrity(
-        summary=summary[:SUMMARY_MAX_ITEMS],
-        unknowns=unknowns,
-        fallback_summary=fallback_summary,
-        log_text=log_text,
-        spanish_mode=spanish_mode,
-    )
-    if spanish_mode:
-        summary = _normalize_spanish_list(summary, fallback_summary, min_items=5, max_items=SUMMARY_MAX_ITEMS)
-        next_actions = _normalize_spanish_list(
-            next_actions,
-            list(SPANISH_DEFAULT_NEXT_ACTIONS),
-            min_items=3,
-            max_items=len(SPANISH_DEFAULT_NEXT_ACTIONS),
-        )
-        turning_points = [
-            tp
-            if _is_spanish_consistent_text(tp.impact)
-            else tp.model_copy(update={"impact": SPANISH_TURNING_POINT_GENERIC_IMPACT})
-            for tp in turning_points
-        ]
-        normalized_mistakes: list[Mistake] = []
-        for mistake in mistakes:
-            normalized_mistakes.append(
-                mistake.model_copy(
-                    update={
-                        "description": (
-                            mistake.description
-                            if _is_spanish_consistent_text(mistake.description)
-                            else SPANISH_MISTAKE_FALLBACK_DESCRIPTION
-                        ),
-                        "why_it_matters": (
-                            mistake.why_it_matters
-                            if _is_spanish_consistent_text(mistake.why_it_matters)
-                            else SPANISH_MISTAKE_FALLBACK_WHY
-                        ),
-                        "better_line": (
-                            mistake.better_line
-                            if _is_spanish_consistent_text(mistake.better_line)
-                            else SPANISH_MISTAKE_FALLBACK_BETTER_LINE
-                        ),
-                    }
-                )
-            )
-        mistakes = normalized_mistakes
 
-    summary, next_actions, agentic_telemetry = _run_agentic_coach_auditor(
+    return _ReportContext(
         log_text=log_text,
+        prompt_log=prompt_log,
+        options=options,
+        deadline=deadline,
+        spanish_mode=spanish_mode,
+        match_facts=match_facts,
+        play_bundles=play_bundles,
         summary=summary,
-        next_actions=next_actions,
         fallback_summary=fallback_summary,
-        spanish_mode=spanish_mode,
+        next_actions=next_actions,
+        unknowns=unknowns,
+        turning_points=turning_points,
+        mistakes=mistakes,
+        claim_index=build_ko_claim_index(parsed.lines),
+    )
+
+
+def _apply_guidance_and_normalize(context: _ReportContext, llm_guidance: LLMReportGuidance | None) -> None:
+    if llm_guidance is not None:
+        context.summary = llm_guidance.summary
+        context.next_actions = llm_guidance.next_actions
+    context.summary, context.unknowns = apply_summary_claim_integrity(
+        summary=context.summary[:SUMMARY_MAX_ITEMS],
+        unknowns=context.unknowns,
+        fallback_summary=context.fallback_summary,
+        log_text=context.log_text,
+        spanish_mode=context.spanish_mode,
+        claim_index=context.claim_index,
     )
+    if not context.spanish_mode:
+        return
 
+    context.summary = _normalize_spanish_list(
+        context.summary, context.fallback_summary, min_items=5, max_items=SUMMARY_MAX_ITEMS
+    )
+    context.next_actions = _normalize_spanish_list(
+        context.next_actions,
+        list(SPANISH_DEFAULT_NEXT_ACTIONS),
+        min_items=3,
+        max_items=len(SPANISH_DEFAULT_NEXT_ACTIONS),
+    )
+    context.turning_points = [
+        tp
+        if _is_spanish_consistent_text(tp.impact)
+        else tp.model_copy(update={"impact": SPANISH_TURNING_POINT_GENERIC_IMPACT})
+        for tp in context.turning_points
+    ]
+    normalized_mistakes: list[Mistake] = []
+    for mistake in context.mistakes:
+        normalized_mistakes.append(
+            mistake.model_copy(
+                update={
+                    "description": (
+                        mistake.description
+                        if _is_spanish_consistent_text(mistake.description)
+                        else SPANISH_MISTAKE_FALLBACK_DESCRIPTION
+                    ),
+                    "why_it_matters": (
+                        mistake.why_it_matters
+                        if _is_spanish_consistent_text(mistake.why_it_matters)
+                        else SPANISH_MISTAKE_FALLBACK_WHY
+                    ),
+                    "better_line": (
+                        mistake.better_line
+                        if _is_spanish_consistent_text(mistake.better_line)
+                        else SPANISH_MISTAKE_FALLBACK_BETTER_LINE
+                    ),
+                }
+            )
+        )
+    context.mistakes = normalized_mistakes
+
+
+def _finalize_report(
+    context: _ReportContext,
+    summary: list[str],
+    next_actions: list[str],
+    agentic_telemetry: dict[str, object] | None,
+) -> PostGameReport:
+    if context.deadline_exceeded_stages:
+        agentic_telemetry = {
+            **(agentic_telemetry or {}),
+            "deadline_exceeded_stages": list(context.deadline_exceeded_stages),
+        }
     return PostGameReport(
         summary=summary[:SUMMARY_MAX_ITEMS],
-        turning_points=turning_points,
-        mistakes=mistakes,
-        unknowns=unknowns,
+        turning_points=context.turning_points,
+        mistakes=context.mistakes,
+        unknowns=context.unknowns,
         next_actions=next_actions,
-        match_facts=match_facts,
-        play_bundles=play_bundles,
+        match_facts=context.match_facts,
+        play_bundles=context.play_bundles,
         agentic_telemetry=agentic_telemetry,
     )
+
+
+@dataclass(frozen=True)
+class _ReportStoreKey:
+    store: ReportStore
+    log_hash: str
+    fingerprint: str
+
+
+def _report_store_key(log_text: str, options: ReportOptions) -> _ReportStoreKey | None:
+    runtime = options.llm_config
+    if runtime.report_store_dir is None:
+        return None
+    settings: dict[str, object] = {
+        "live_mode": runtime.live_mode_enabled,
+        "openrouter_base_url": runtime.openrouter_base_url,
+        "agentic_coach_auditor": options.agentic_coach_auditor,
+        "shadow_audit": options.shadow_audit,
+        "include_agentic_telemetry": options.include_agentic_telemetry,
+    }
+    if runtime.live_mode_enabled:
+        agent_a_config, agent_b_config = options.agent_configs()
+        settings.update(
+            models=[runtime.model, agent_a_config.model, agent_b_config.model, *runtime.hedge_models],
+            prompt_context=runtime.prompt_context,
+            prompt_token_budget=runtime.prompt_token_budget,
+        )
+    store = ReportStore(
+        runtime.report_store_dir,
+        max_bytes=runtime.report_store_max_bytes,
+        ttl_seconds=runtime.report_store_ttl_seconds,
+    )
+    return _ReportStoreKey(store=store, log_hash=log_digest(log_text), fingerprint=pipeline_fingerprint(settings))
+
+
+def _stored_report(key: _ReportStoreKey | None, options: ReportOptions) -> PostGameReport | None:
+    if key is None:
+        return None
+    report = key.store.get(log_hash=key.log_hash, fingerprint=key.fingerprint)
+    if report is None or report.agentic_telemetry is None:
+        return report
+    # The LLM counters describe the run that built the report; serving it from the store made no calls.
+    agent_a_config, agent_b_config = options.agent_configs()
+    served = _llm_call_telemetry(
+        agent_a_config=agent_a_config,
+        agent_b_config=agent_b_config,
+        cache_stats=LLMCacheStats(),
+        hedge_stats=LLMHedgeStats(),
+        coalesce_stats=LLMCoalesceStats(),
+        breaker_stats=LLMBreakerStats(),
+    )
+    return report.model_copy(update={"agentic_telemetry": {**report.agentic_telemetry, **served}})
+
+
+def _store_report(key: _ReportStoreKey | None, context: _ReportContext, report: PostGameReport) -> None:
+    # Reports degraded by a missed deadline or a failed live stage (provider error, open breaker, invalid
+    # output) are not what the pipeline would normally produce; storing them would outlive the outage.
+    if key is None or context.deadline_exceeded_stages or context.llm_fallback_stages:
+        return
+    # Raw agent outputs, events and shadow audit ids belong to one run: a hit would replay them, and a
+    # shadow-audited report served from the store would schedule no audit.
+    if context.options.shadow_audit or context.options.include_agentic_telemetry:
+        return
+    key.store.put(log_hash=key.log_hash, fingerprint=key.fingerprint, report=report)
+
+
+def _report_steps(log_text: str, options: ReportOptions) -> _ReportSteps[PostGameReport]:
+    store_key = _report_store_key(log_text, options)
+    stored = _stored_report(store_key, options)
+    if stored is not None:
+        return stored
+    context = _build_report_context(log_text, options)
+
+    llm_guidance = None
+    if not options.agentic_coach_auditor:
+        stage_deadline = _stage_deadline(context.deadline, options.llm_config)
+        llm_guidance = yield _LLMCall(
+            "guidance",
+            {
+                "log_text": context.prompt_log,
+                "fallback_summary": context.fallback_summary,
+                "fallback_next_actions": context.next_actions,
+                "config": options.llm_config,
+                "deadline": stage_deadline,
+            },
+        )
+        if llm_guidance is None:
+            _record_deadline_miss(context.deadline_exceeded_stages, "guidance", stage_deadline)
+            _record_llm_fallback(context.llm_fallback_stages, "guidance", options.llm_config)
+    _apply_guidance_and_normalize(context, llm_guidance)
+
+    summary, next_actions, agentic_telemetry = yield from _agentic_steps(context)
+    report = _finalize_report(context, summary, next_actions, agentic_telemetry)
+    _store_report(store_key, context, report)
+    return report
+
+
+def generate_post_game_report(log_text: str, options: ReportOptions | None = None) -> PostGameReport:
+    """Build the post-game report, served from the report store when one is configured and holds it.
+
+    Without `options` the settings are read from the environment (`ReportOptions.from_env()`).
+    """
+    return _drive_report_steps(_report_steps(log_text, options or ReportOptions.from_env()))
+
+
+async def agenerate_post_game_report(log_text: str, options: ReportOptions | None = None) -> PostGameReport:
+    """Async variant of `generate_post_game_report`; LLM calls share the provider request semaphore."""
+    return await _adrive_report_steps(_report_steps(log_text, options or ReportOptions.from_env()))
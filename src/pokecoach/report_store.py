@@ -0,0 +1,107 @@
+"""Content-addressed disk store for finished post-game reports."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from pokecoach.events import EVENT_DETECTORS
+from pokecoach.json_store import JSONFileStore
+from pokecoach.schemas import PostGameReport
+
+DEFAULT_REPORT_STORE_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_REPORT_STORE_TTL_SECONDS = 30 * 24 * 60 * 60
+# Bump for behaviour changes the source fingerprint cannot see (e.g. data files read at runtime).
+REPORT_PIPELINE_VERSION = 1
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def log_digest(log_text: str) -> str:
+    """SHA-256 of the raw log text; the only work a store lookup does on the log."""
+    return hashlib.sha256(log_text.encode("utf-8")).hexdigest()
+
+
+def pipeline_fingerprint(settings: Mapping[str, object]) -> str:
+    """Fingerprint of everything besides the log that shapes a report.
+
+    Covers the pokecoach sources (parser, detectors, constants), the registered detector set, the report
+    schema and `settings` (model and mode configuration), so any change yields a new key and older entries
+    are never served again.
+    """
+    payload = {
+        "pipeline_version": REPORT_PIPELINE_VERSION,
+        "sources": _source_fingerprint(),
+        "detectors": [getattr(detector, "__qualname__", repr(detector)) for detector in EVENT_DETECTORS],
+        "report_schema": _report_schema_fingerprint(),
+        "settings": dict(settings),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class ReportStore(JSONFileStore):
+    """Disk store keyed by log hash and pipeline fingerprint, with TTL and LRU size eviction.
+
+    Each entry is one JSON file holding the serialized report; expiry and eviction follow `JSONFileStore`.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        max_bytes: int = DEFAULT_REPORT_STORE_MAX_BYTES,
+        ttl_seconds: float = DEFAULT_REPORT_STORE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(directory, max_bytes=max_bytes, ttl_seconds=ttl_seconds, clock=clock)
+
+    def get(self, *, log_hash: str, fingerprint: str) -> PostGameReport | None:
+        """Return the stored report for a fresh entry, or None on a miss."""
+        digest = _entry_digest(log_hash, fingerprint)
+        entry = self._load(digest)
+        if entry is None:
+            return None
+        try:
+            report = PostGameReport.model_validate(entry["report"])
+        except (KeyError, ValidationError):
+            self._discard(digest)
+            return None
+        self._touch(digest)
+        return report
+
+    def put(self, *, log_hash: str, fingerprint: str, report: PostGameReport) -> None:
+        """Store a finished report, then evict stale and least recently used entries."""
+        entry = {
+            "log_sha256": log_hash,
+            "pipeline_fingerprint": fingerprint,
+            "report": report.model_dump(mode="json"),
+        }
+        self._store(_entry_digest(log_hash, fingerprint), entry)
+
+
+def _entry_digest(log_hash: str, fingerprint: str) -> str:
+    return hashlib.sha256(f"{fingerprint}\0{log_hash}".encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _source_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(_PACKAGE_DIR.rglob("*.py")):
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _report_schema_fingerprint() -> str:
+    schema = json.dumps(PostGameReport.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
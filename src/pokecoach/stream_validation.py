@@ -0,0 +1,267 @@
+"""Incremental JSON checking for streamed LLM output against a pydantic schema."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*", re.IGNORECASE)
+_LITERAL_CHARS = frozenset("0123456789+-.eEtruefalsn")
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+class StreamValidationError(ValueError):
+    """The streamed prefix can no longer become a valid payload for the schema."""
+
+
+@dataclass
+class _Frame:
+    kind: str  # "object" or "array"
+    node: dict[str, Any]
+    state: str
+    key: str | None = None
+    seen_keys: set[str] = field(default_factory=set)
+    count: int = 0
+
+
+class IncrementalJSONValidator:
+    """Feed streamed text chunks; raises `StreamValidationError` as soon as the output cannot match the schema.
+
+    Checks prose before the JSON object (a leading ```json fence is allowed), malformed JSON, keys the schema
+    does not define (the prompts forbid extra keys), wrong value types, arrays outside their item bounds, values
+    outside an enum, and required keys missing when an object closes. Text after the top-level object is ignored.
+    """
+
+    def __init__(self, output_type: type[BaseModel]) -> None:
+        schema = output_type.model_json_schema()
+        self._defs: dict[str, Any] = schema.get("$defs", {})
+        self._root = schema
+        self._stack: list[_Frame] = []
+        self._prefix = ""
+        self._started = False
+        self.complete = False
+        self._string: list[str] | None = None
+        self._string_escape = False
+        self._string_is_key = False
+        self._string_node: dict[str, Any] | None = None
+        self._literal: list[str] | None = None
+        self._consumed = 0
+
+    def feed(self, chunk: str) -> None:
+        for char in chunk:
+            if self.complete:
+                return
+            self._consumed += 1
+            if not self._started:
+                self._feed_prefix(char)
+            elif self._string is not None:
+                self._feed_string(char)
+            else:
+                if self._literal is not None:
+                    if char in _LITERAL_CHARS:
+                        self._literal.append(char)
+                        continue
+                    self._finish_literal()
+                self._feed_structural(char)
+
+    def _fail(self, reason: str) -> None:
+        raise StreamValidationError(f"{reason} (after {self._consumed} chars)")
+
+    def _feed_prefix(self, char: str) -> None:
+        if char == "{" and (not self._prefix.strip() or _FENCE_RE.fullmatch(self._prefix.lstrip())):
+            self._started = True
+            self._open(self._root, "{")
+            return
+        self._prefix += char
+        stripped = self._prefix.lstrip()
+        if stripped and not "```json".startswith(stripped.lower()) and not _FENCE_RE.fullmatch(stripped):
+            self._fail("text before the JSON object")
+
+    def _feed_string(self, char: str) -> None:
+        assert self._string is not None
+        if self._string_escape:
+            self._string_escape = False
+            self._string.append(char)
+            return
+        if char == "\\":
+            self._string_escape = True
+            self._string.append(char)
+            return
+        if char != '"':
+            self._string.append(char)
+            return
+        try:
+            value = json.loads('"' + "".join(self._string) + '"')
+        except ValueError:
+            self._fail("malformed JSON string")
+        self._string = None
+        if self._string_is_key:
+            self._accept_key(value)
+        else:
+            self._check_enum(self._string_node or {}, value)
+            self._value_done()
+
+    def _feed_structural(self, char: str) -> None:
+        if char in _WHITESPACE:
+            return
+        frame = self._stack[-1]
+        if frame.kind == "object":
+            if frame.state in ("key_or_end", "key"):
+                if char == '"':
+                    self._begin_string(is_key=True, node=None)
+                elif char == "}" and frame.state == "key_or_end":
+                    self._close_object()
+                else:
+                    self._fail("expected an object key")
+            elif frame.state == "colon":
+                if char != ":":
+                    self._fail("expected ':' after a key")
+                frame.state = "value"
+            elif frame.state == "value":
+                self._begin_value(self._property_node(frame), char)
+            elif char == ",":
+                frame.state = "key"
+            elif char == "}":
+                self._close_object()
+            else:
+                self._fail("expected ',' or '}' in an object")
+            return
+
+        if frame.state in ("value_or_end", "value"):
+            if char == "]" and frame.state == "value_or_end":
+                self._close_array()
+                return
+            frame.count += 1
+            max_items = frame.node.get("maxItems")
+            if max_items is not None and frame.count > max_items:
+                self._fail(f"more than {max_items} items")
+            self._begin_value(self._resolve(frame.node.get("items", {})), char)
+        elif char == ",":
+            frame.state = "value"
+        elif char == "]":
+            self._close_array()
+        else:
+            self._fail("expected ',' or ']' in an array")
+
+    def _begin_string(self, *, is_key: bool, node: dict[str, Any] | None) -> None:
+        self._string = []
+        self._string_escape = False
+        self._string_is_key = is_key
+        self._string_node = node
+
+    def _begin_value(self, node: dict[str, Any], char: str) -> None:
+        if char == "{":
+            self._expect_type(node, "object")
+            self._open(node, char)
+        elif char == "[":
+            self._expect_type(node, "array")
+            self._open(node, char)
+        elif char == '"':
+            self._expect_type(node, "string")
+            self._begin_string(is_key=False, node=node)
+        elif char in "tf":
+            self._expect_type(node, "boolean")
+            self._literal = [char]
+        elif char == "n":
+            self._expect_type(node, "null")
+            self._literal = [char]
+        elif char == "-" or char.isdigit():
+            self._expect_type(node, "number")
+            self._literal = [char]
+        else:
+            self._fail("malformed JSON value")
+
+    def _finish_literal(self) -> None:
+        assert self._literal is not None
+        text = "".join(self._literal)
+        self._literal = None
+        try:
+            json.loads(text)
+        except ValueError:
+            self._fail(f"malformed JSON literal {text!r}")
+        self._value_done()
+
+    def _open(self, node: dict[str, Any], char: str) -> None:
+        node = self._resolve(node)
+        if char == "{":
+            self._stack.append(_Frame(kind="object", node=node, state="key_or_end"))
+        else:
+            self._stack.append(_Frame(kind="array", node=node, state="value_or_end"))
+
+    def _close_object(self) -> None:
+        frame = self._stack.pop()
+        missing = [key for key in frame.node.get("required", []) if key not in frame.seen_keys]
+        if missing:
+            self._fail(f"object closed without required keys {missing}")
+        self._value_done()
+
+    def _close_array(self) -> None:
+        frame = self._stack.pop()
+        min_items = frame.node.get("minItems")
+        if min_items is not None and frame.count < min_items:
+            self._fail(f"fewer than {min_items} items")
+        self._value_done()
+
+    def _value_done(self) -> None:
+        if not self._stack:
+            self.complete = True
+            return
+        frame = self._stack[-1]
+        frame.state = "comma_or_end"
+
+    def _accept_key(self, key: str) -> None:
+        frame = self._stack[-1]
+        properties = frame.node.get("properties")
+        if properties is not None and key not in properties:
+            self._fail(f"unexpected key {key!r}")
+        frame.key = key
+        frame.seen_keys.add(key)
+        frame.state = "colon"
+
+    def _property_node(self, frame: _Frame) -> dict[str, Any]:
+        properties = frame.node.get("properties", {})
+        return self._resolve(properties.get(frame.key or "", {}))
+
+    def _resolve(self, node: dict[str, Any]) -> dict[str, Any]:
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            return self._defs.get(ref.removeprefix("#/$defs/"), {})
+        return node
+
+    def _allowed_types(self, node: dict[str, Any]) -> set[str] | None:
+        options = node.get("anyOf") or node.get("oneOf")
+        if options:
+            allowed: set[str] = set()
+            for option in options:
+                option_types = self._allowed_types(self._resolve(option))
+                if option_types is None:
+                    return None
+                allowed |= option_types
+            return allowed
+        declared = node.get("type")
+        if declared is None:
+            if "properties" in node:
+                return {"object"}
+            return None
+        types = set(declared) if isinstance(declared, list) else {declared}
+        if "integer" in types:
+            types.add("number")
+        return types
+
+    def _expect_type(self, node: dict[str, Any], json_type: str) -> None:
+        allowed = self._allowed_types(node)
+        if allowed is not None and json_type not in allowed:
+            self._fail(f"expected {'/'.join(sorted(allowed))}, got {json_type}")
+
+    def _check_enum(self, node: dict[str, Any], value: str) -> None:
+        options = node.get("anyOf") or [node]
+        enums = [self._resolve(option) for option in options]
+        if any("enum" not in option and "const" not in option for option in enums):
+            return
+        allowed = {item for option in enums for item in option.get("enum", [option.get("const")])}
+        if value not in allowed:
+            self._fail(f"value {value!r} is not one of the allowed values")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 
 from pokecoach.constants import SUMMARY_MAX_ITEMS
 
@@ -21,6 +23,94 @@ INTERPRETIVE_SPIN_RE = re.compile(
     re.IGNORECASE,
 )
 DEFAULT_WINDOW = 12
+MAX_INDEXED_NAME_TOKENS = 6
+
+
+@dataclass(frozen=True)
+class KoIndexEntry:
+    """One KO line with the normalized causal lines that may explain it."""
+
+    line_idx: int
+    normalized_text: str
+    causal_texts: tuple[str, ...]
+    causal_names: frozenset[str]
+
+
+@dataclass
+class KoClaimIndex:
+    """KO/causal-actor index built once per log and shared by claim verifiers.
+
+    Names match on whole normalized tokens. Names of up to ``MAX_INDEXED_NAME_TOKENS`` tokens are
+    indexed as n-grams, so checking whether a target was knocked out, or whether an actor appears in
+    the causal window of that KO, is a dictionary or set lookup; longer names scan the indexed lines.
+    """
+
+    entries: list[KoIndexEntry] = field(default_factory=list)
+    entries_by_target: dict[str, list[KoIndexEntry]] = field(default_factory=dict)
+    _verdicts: dict[tuple[str, str], str] = field(default_factory=dict, repr=False)
+
+    def ko_entries_for_target(self, target: str) -> list[KoIndexEntry]:
+        target_norm = _normalize(target)
+        if len(target_norm.split()) <= MAX_INDEXED_NAME_TOKENS:
+            return self.entries_by_target.get(target_norm, [])
+        return [entry for entry in self.entries if _contains_name(entry.normalized_text, target_norm)]
+
+    def verify_ko_claim(self, *, actor: str, target: str) -> str:
+        key = (_normalize(actor), _normalize(target))
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            verdict = self._compute_verdict(actor_norm=key[0], target=target)
+            self._verdicts[key] = verdict
+        return verdict
+
+    def _compute_verdict(self, *, actor_norm: str, target: str) -> str:
+        ko_entries = self.ko_entries_for_target(target)
+        if not ko_entries:
+            return "missing_target_ko"
+        for entry in ko_entries:
+            if _entry_has_causal_actor(entry, actor_norm):
+                return "verified"
+        return "target_only"
+
+
+def build_ko_claim_index(lines: Sequence[str]) -> KoClaimIndex:
+    """Index every KO line with the causal lines above it in the same turn and window."""
+    index = KoClaimIndex()
+    normalized_cache: dict[int, str] = {}
+
+    def normalized_line(idx: int) -> str:
+        cached = normalized_cache.get(idx)
+        if cached is None:
+            cached = _normalize(lines[idx])
+            normalized_cache[idx] = cached
+        return cached
+
+    for ko_idx, raw in enumerate(lines):
+        text = raw.strip()
+        if not text or not KO_LINE_RE.search(text):
+            continue
+
+        causal_texts: list[str] = []
+        lower_bound = max(0, ko_idx - DEFAULT_WINDOW)
+        for idx in range(ko_idx - 1, lower_bound - 1, -1):
+            prev_text = lines[idx].strip()
+            if not prev_text:
+                continue
+            if TURN_HEADER_RE.match(prev_text):
+                break
+            if CAUSAL_LINE_RE.search(prev_text):
+                causal_texts.append(normalized_line(idx))
+
+        entry = KoIndexEntry(
+            line_idx=ko_idx,
+            normalized_text=normalized_line(ko_idx),
+            causal_texts=tuple(causal_texts),
+            causal_names=frozenset(name for causal in causal_texts for name in _token_ngrams(causal)),
+        )
+        index.entries.append(entry)
+        for name in _token_ngrams(entry.normalized_text):
+            index.entries_by_target.setdefault(name, []).append(entry)
+    return index
 
 
 def apply_summary_claim_integrity(
@@ -30,9 +120,9 @@ def apply_summary_claim_integrity(
     fallback_summary: list[str],
     log_text: str,
     spanish_mode: bool = False,
+    claim_index: KoClaimIndex | None = None,
 ) -> tuple[list[str], list[str]]:
     """Validate summary bullets and rewrite/drop unverifiable KO attribution claims."""
-    lines = log_text.splitlines()
     normalized_unknowns = list(dict.fromkeys(unknowns))
     unknown_seen = set(normalized_unknowns)
     normalized_summary: list[str] = []
@@ -55,7 +145,9 @@ def apply_summary_claim_integrity(
             continue
 
         actor, target = claim
-        verification = _verify_ko_claim(actor=actor, target=target, lines=lines)
+        if claim_index is None:
+            claim_index = build_ko_claim_index(log_text.splitlines())
+        verification = claim_index.verify_ko_claim(actor=actor, target=target)
         if verification == "verified":
             normalized_summary.append(bullet)
             continue
@@ -95,42 +187,24 @@ def _extract_ko_claim(text: str) -> tuple[str, str] | None:
     return actor, target
 
 
-def _verify_ko_claim(*, actor: str, target: str, lines: list[str]) -> str:
-    actor_norm = _normalize(actor)
-    target_norm = _normalize(target)
-    ko_lines: list[int] = []
-
-    for idx, raw in enumerate(lines):
-        text = raw.strip()
-        if not text:
-            continue
-        if not KO_LINE_RE.search(text):
-            continue
-        if target_norm in _normalize(text):
-            ko_lines.append(idx)
+def _entry_has_causal_actor(entry: KoIndexEntry, actor_norm: str) -> bool:
+    if len(actor_norm.split()) <= MAX_INDEXED_NAME_TOKENS:
+        return actor_norm in entry.causal_names
+    return any(_contains_name(causal, actor_norm) for causal in entry.causal_texts)
 
-    if not ko_lines:
-        return "missing_target_ko"
 
-    for ko_idx in ko_lines:
-        if _has_causal_actor(actor_norm=actor_norm, ko_idx=ko_idx, lines=lines):
-            return "verified"
-    return "target_only"
+def _contains_name(normalized_text: str, name_norm: str) -> bool:
+    # Token-aligned, like the n-gram lookup: "kirlia" must not match inside "gardevoir kirlias".
+    return f" {name_norm} " in f" {normalized_text} "
 
 
-def _has_causal_actor(*, actor_norm: str, ko_idx: int, lines: list[str]) -> bool:
-    lower_bound = max(0, ko_idx - DEFAULT_WINDOW)
-    for idx in range(ko_idx - 1, lower_bound - 1, -1):
-        text = lines[idx].strip()
-        if not text:
-            continue
-        if TURN_HEADER_RE.match(text):
-            break
-        if not CAUSAL_LINE_RE.search(text):
-            continue
-        if actor_norm in _normalize(text):
-            return True
-    return False
+def _token_ngrams(normalized: str) -> set[str]:
+    tokens = normalized.split()
+    return {
+        " ".join(tokens[start:end])
+        for start in range(len(tokens))
+        for end in range(start + 1, min(len(tokens), start + MAX_INDEXED_NAME_TOKENS) + 1)
+    }
 
 
 def _normalize(value: str) -> str:
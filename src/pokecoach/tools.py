@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import TypeVar, overload
 
-from pokecoach.events.registry import EVENT_DETECTORS, SUPPORTER_KEYWORDS
+from pokecoach.events.registry import EVENT_ENGINE, is_supporter_play
+from pokecoach.events.store import EventStore
 from pokecoach.schemas import (
     KeyEvent,
     KeyEventIndex,
@@ -24,6 +29,10 @@ PLAYER_ACTION_VERB_RE = re.compile(
     re.IGNORECASE,
 )
 PLAYER_INITIAL_DRAW_RE = re.compile(r"^([A-Za-z0-9_\-]+) robó 7 cartas de la mano inicial\.$")
+STATS_INITIAL_DRAW_RE = re.compile(r"^([A-Za-z0-9_\-]+) robó 7 cartas de la mano inicial\.")
+WENT_FIRST_RE = re.compile(r"^([A-Za-z0-9_\-]+) decidió empezar en (primer|segundo) lugar\.")
+ONE_MULLIGAN_RE = re.compile(r"^([A-Za-z0-9_\-]+) declaró un mulligan\.")
+MANY_MULLIGANS_RE = re.compile(r"^([A-Za-z0-9_\-]+) declaró (\d+) mulligans\.")
 PRIZE_TAKEN_RE = re.compile(r"^([A-Za-z0-9_\-]+) tomó (una|\d+) cartas? de Premio\.$")
 CONCEDE_LINE_RE = re.compile(r"(?:El rival se rindió|Te rendiste)\.", re.IGNORECASE)
 CONCEDE_WINNER_RE = re.compile(r"(?:El rival se rindió|Te rendiste)\.\s*([A-Za-z0-9_\-]+) ganó\.", re.IGNORECASE)
@@ -40,14 +49,6 @@ PLAY_BUNDLE_ACTION_RE = re.compile(r"(?:\busó\b|\binfligió\b.*\busando\b)", re
 PLAY_BUNDLE_KO_RE = re.compile(r"quedó Fuera de Combate", re.IGNORECASE)
 
 
-def _infer_actor(lines: list[str]) -> str | None:
-    for line in lines:
-        actor = infer_actor(line)
-        if actor is not None:
-            return actor
-    return None
-
-
 def infer_actor(line: str) -> str | None:
     text = line.strip()
     if not text:
@@ -77,46 +78,117 @@ def _actor_prefix_from_text(text: str) -> str | None:
     return match.group(1)
 
 
-def index_turns(log_text: str) -> list[TurnSpan]:
-    lines = log_text.splitlines()
-    header_idxs = [i for i, line in enumerate(lines) if TURN_HEADER_RE.match(line.strip())]
-    if not header_idxs:
-        return []
-
-    spans: list[TurnSpan] = []
-    for turn_number, header_idx in enumerate(header_idxs, start=1):
-        end_idx = header_idxs[turn_number] - 1 if turn_number < len(header_idxs) else len(lines) - 1
-        block_lines = lines[header_idx : end_idx + 1]
-        spans.append(
-            TurnSpan(
-                turn_number=turn_number,
-                start_line=header_idx + 1,
-                end_line=end_idx + 1,
-                actor=_infer_actor(block_lines[1:]),
-            )
-        )
-    return spans
+_Item = TypeVar("_Item")
 
 
-def _iter_events(lines: list[str]) -> list[KeyEvent]:
-    events: list[KeyEvent] = []
-    for i, raw in enumerate(lines, start=1):
-        text = raw.strip()
-        if not text:
-            continue
+class _FrozenView(Sequence[_Item]):
+    """Read-only view of the first ``length`` items of an append-only list, followed by a fixed tail.
+
+    The list may keep growing after the view is taken; the view never sees those items, so
+    snapshots share the parser's storage instead of copying it.
+    """
+
+    __slots__ = ("_base", "_length", "_tail")
+
+    def __init__(self, base: list[_Item], tail: tuple[_Item, ...] = ()) -> None:
+        self._base = base
+        self._length = len(base)
+        self._tail = tail
 
-        for detector in EVENT_DETECTORS:
-            events.extend(detector(text, i, raw))
+    def __len__(self) -> int:
+        return self._length + len(self._tail)
 
-    return events
+    @overload
+    def __getitem__(self, index: int) -> _Item: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_Item]: ...
+
+    def __getitem__(self, index: int | slice) -> _Item | list[_Item]:
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("view index out of range")
+        if index < self._length:
+            return self._base[index]
+        return self._tail[index - self._length]
+
+    def __iter__(self) -> Iterator[_Item]:
+        yield from islice(self._base, self._length)
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(left == right for left, right in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+@dataclass(frozen=True)
+class ParsedLog:
+    """Single-pass intermediate representation shared by every deterministic tool."""
+
+    lines: Sequence[str]
+    turns: Sequence[TurnSpan]
+    events: Sequence[KeyEvent]
+    players: Sequence[str]
+    stats: MatchStats
+    play_bundles: Sequence[PlayBundle]
+    match_facts: MatchFacts
+    concede: bool = False
+    winner: str | None = None
+    ko_mentions: Sequence[tuple[int, str, int]] = field(default_factory=list)
+    causal_actors: Sequence[tuple[int, str]] = field(default_factory=list)
 
 
-def find_key_events(log_text: str) -> KeyEventIndex:
-    return KeyEventIndex(events=_iter_events(log_text.splitlines()))
+LogSource = str | ParsedLog
+BundleLine = tuple[int, str]
 
 
-def extract_turn_summary(turn_span: TurnSpan, log_text: str) -> TurnSummary:
-    lines = log_text.splitlines()[turn_span.start_line - 1 : turn_span.end_line]
+def _as_parsed_log(log: LogSource) -> ParsedLog:
+    if isinstance(log, ParsedLog):
+        return log
+    return parse_log(log)
+
+
+def _log_lines(log: LogSource) -> Sequence[str]:
+    if isinstance(log, ParsedLog):
+        return log.lines
+    return log.splitlines()
+
+
+def index_turns(log: LogSource) -> list[TurnSpan]:
+    return list(_as_parsed_log(log).turns)
+
+
+def find_key_events(log: LogSource) -> KeyEventIndex:
+    return KeyEventIndex(events=list(_as_parsed_log(log).events))
+
+
+def build_event_store(lines: Sequence[str]) -> EventStore:
+    """Detect key events into a columnar ``EventStore`` that reads raw text from ``lines``."""
+    store = EventStore(lines)
+    for idx, raw in enumerate(lines):
+        text = raw.strip()
+        if not text:
+            continue
+        event_types = EVENT_ENGINE.event_types(text, idx + 1, raw)
+        if not event_types:
+            continue
+        actor = infer_actor(text)
+        for event_type in event_types:
+            store.append(event_type, idx + 1, actor)
+    return store
+
+
+def extract_turn_summary(turn_span: TurnSpan, log: LogSource) -> TurnSummary:
+    lines = _log_lines(log)[turn_span.start_line - 1 : turn_span.end_line]
     bullets: list[str] = []
 
     for raw in lines:
@@ -127,7 +199,7 @@ def extract_turn_summary(turn_span: TurnSpan, log_text: str) -> TurnSummary:
             bullets.append("A knockout occurred during this turn.")
         elif "tomó" in text and "Premio" in text:
             bullets.append("A prize card was taken.")
-        elif "jugó" in text and any(keyword in text for keyword in SUPPORTER_KEYWORDS):
+        elif is_supporter_play(text):
             bullets.append("A supporter was played.")
 
     bullets = list(dict.fromkeys(bullets))[:4]
@@ -190,265 +262,461 @@ def _parse_prize_count(prize_text: str) -> int:
 
 
 def _pick_primary_action_index(
-    action_events: list[PlayBundleEvent],
-    action_ko_events: list[list[PlayBundleEvent]],
-    action_prize_events: list[list[PlayBundleEvent]],
+    action_lines: list[BundleLine],
+    action_ko_lines: list[list[BundleLine]],
+    action_prize_lines: list[list[BundleLine]],
 ) -> int:
     ranked = []
-    for index, action_event in enumerate(action_events):
-        ko_count = len(action_ko_events[index])
-        prize_total = sum(_parse_prize_count(event.text) for event in action_prize_events[index])
-        prize_event_count = len(action_prize_events[index])
-        ranked.append((ko_count, prize_total, prize_event_count, action_event.line, index))
+    for index, (action_line, _raw) in enumerate(action_lines):
+        ko_count = len(action_ko_lines[index])
+        prize_total = sum(_parse_prize_count(raw) for _line, raw in action_prize_lines[index])
+        prize_event_count = len(action_prize_lines[index])
+        ranked.append((ko_count, prize_total, prize_event_count, action_line, index))
     return max(ranked)[4]
 
 
-def extract_play_bundles(log_text: str) -> list[PlayBundle]:
-    lines = log_text.splitlines()
-    turns = index_turns(log_text)
-    bundles: list[PlayBundle] = []
-
-    for turn_span in turns:
-        window_lines = lines[turn_span.start_line - 1 : turn_span.end_line]
-        actor = turn_span.actor or _infer_actor(window_lines[1:])
-        gust_events: list[PlayBundleEvent] = []
-        action_events: list[PlayBundleEvent] = []
-        action_ko_events: list[list[PlayBundleEvent]] = []
-        action_prize_events: list[list[PlayBundleEvent]] = []
-        unscoped_ko_events: list[PlayBundleEvent] = []
-        unscoped_prize_events: list[PlayBundleEvent] = []
-        current_action_index: int | None = None
-
-        for offset, raw in enumerate(window_lines):
-            text = raw.strip()
-            if not text:
-                continue
-            line_number = turn_span.start_line + offset
-
-            if PLAY_BUNDLE_GUST_RE.search(text):
-                gust_events.append(_build_play_bundle_event(line_number, raw))
-                continue
-
-            if PLAY_BUNDLE_ACTION_RE.search(text):
-                action_events.append(_build_play_bundle_event(line_number, raw))
-                action_ko_events.append([])
-                action_prize_events.append([])
-                current_action_index = len(action_events) - 1
-                continue
-
-            if PLAY_BUNDLE_KO_RE.search(text):
-                event = _build_play_bundle_event(line_number, raw)
-                if current_action_index is None:
-                    unscoped_ko_events.append(event)
-                else:
-                    action_ko_events[current_action_index].append(event)
-
-            prize_match = PRIZE_TAKEN_RE.match(text)
-            if prize_match:
-                event = _build_play_bundle_event(line_number, raw)
-                if current_action_index is None:
-                    unscoped_prize_events.append(event)
-                else:
-                    action_prize_events[current_action_index].append(event)
-
-        primary_action: PlayBundleEvent | None = None
-        ko_events: list[PlayBundleEvent] = list(unscoped_ko_events)
-        prize_events: list[PlayBundleEvent] = list(unscoped_prize_events)
-        if action_events:
-            primary_action_index = _pick_primary_action_index(action_events, action_ko_events, action_prize_events)
-            primary_action = action_events[primary_action_index]
-            ko_events.extend(action_ko_events[primary_action_index])
-            prize_events.extend(action_prize_events[primary_action_index])
-
-        gust_event: PlayBundleEvent | None = None
-        if gust_events:
-            if primary_action is None:
-                gust_event = gust_events[-1]
-            else:
-                gust_before_action = [event for event in gust_events if event.line < primary_action.line]
-                if gust_before_action:
-                    gust_event = gust_before_action[-1]
+def extract_play_bundles(log: LogSource) -> list[PlayBundle]:
+    return list(_as_parsed_log(log).play_bundles)
 
-        bundle = _start_play_bundle(
-            turn_span=turn_span,
-            actor=actor,
-            gust_event=gust_event,
-            action_event=primary_action,
-        )
-        bundle.ko_events = ko_events
-        bundle.prize_events = prize_events
-        bundle.window.raw_lines = _build_play_bundle_window_raw_lines(
-            gust_event=bundle.gust_event,
-            action_event=bundle.action_event,
-            ko_events=bundle.ko_events,
-            prize_events=bundle.prize_events,
-        )
-        if bundle.gust_event or bundle.action_event or bundle.ko_events or bundle.prize_events:
-            bundles.append(bundle)
 
-    return bundles
+def compute_basic_stats(log: LogSource) -> MatchStats:
+    return _as_parsed_log(log).stats
 
 
-def compute_basic_stats(log_text: str) -> MatchStats:
-    lines = log_text.splitlines()
+def _resolve_ko_lookback_window(ko_lookback_window: int | None) -> int:
+    if ko_lookback_window is None:
+        return KO_LOOKBACK_DEFAULT
+    return max(KO_LOOKBACK_MIN, min(KO_LOOKBACK_MAX, ko_lookback_window))
 
-    players: list[str] = []
-    for raw in lines:
-        match = re.match(r"^([A-Za-z0-9_\-]+) robó 7 cartas de la mano inicial\.", raw.strip())
-        if match and match.group(1) not in players:
-            players.append(match.group(1))
 
-    went_first_player: str | None = None
-    mulligans_by_player: dict[str, int] = {}
-    prizes_by_player: dict[str, int] = {}
+def _is_causal_ko_event(text: str) -> bool:
+    return bool(KO_CAUSAL_DAMAGE_RE.search(text) or KO_CAUSAL_USED_RE.search(text) or KO_CAUSAL_GUST_RE.search(text))
 
-    for raw in lines:
-        text = raw.strip()
 
-        first_match = re.match(r"^([A-Za-z0-9_\-]+) decidió empezar en (primer|segundo) lugar\.", text)
-        if first_match:
-            actor = first_match.group(1)
-            choice = first_match.group(2)
-            if choice == "primer":
-                went_first_player = actor
-            elif len(players) == 2:
-                went_first_player = players[0] if players[1] == actor else players[1]
-
-        one_mulligan = re.match(r"^([A-Za-z0-9_\-]+) declaró un mulligan\.", text)
-        if one_mulligan:
-            actor = one_mulligan.group(1)
-            mulligans_by_player[actor] = mulligans_by_player.get(actor, 0) + 1
+def _resolve_causal_actor(
+    inferred: str | None,
+    before_verb: str | None,
+    known_players: Sequence[str] | set[str],
+) -> str | None:
+    if inferred and inferred in known_players:
+        return inferred
+    if before_verb and before_verb in known_players:
+        return before_verb
+    return None
 
-        many_mulligan = re.match(r"^([A-Za-z0-9_\-]+) declaró (\d+) mulligans\.", text)
-        if many_mulligan:
-            actor = many_mulligan.group(1)
-            mulligans_by_player[actor] = mulligans_by_player.get(actor, 0) + int(many_mulligan.group(2))
 
-        prize_match = PRIZE_TAKEN_RE.match(text)
-        if prize_match:
-            actor = prize_match.group(1)
-            count_text = prize_match.group(2)
-            count = 1 if count_text == "una" else int(count_text)
-            prizes_by_player[actor] = prizes_by_player.get(actor, 0) + count
+def _resolve_causal_actors(
+    causal_candidates: Sequence[tuple[int, str | None, str | None]],
+    players: Sequence[str],
+) -> list[tuple[int, str]]:
+    """Resolve each causal line's actor against the player list."""
+    known_players = set(players)
+    causal_actors: list[tuple[int, str]] = []
+    for idx, inferred, before_verb in causal_candidates:
+        causal_actor = _resolve_causal_actor(inferred, before_verb, known_players)
+        if causal_actor is not None:
+            causal_actors.append((idx, causal_actor))
+    return causal_actors
 
-    return MatchStats(
-        went_first_player=went_first_player,
-        mulligans_by_player=mulligans_by_player,
-        observable_prizes_taken_by_player=prizes_by_player,
-    )
 
+def _ko_actor(
+    idx: int,
+    turn_floor: int,
+    last_causal: tuple[int, str] | None,
+    ko_lookback_window: int,
+) -> str | None:
+    """Actor credited with the KO on line ``idx``, or None when no causal line is close enough."""
+    search_floor = max(idx - ko_lookback_window, turn_floor)
+    if last_causal is None or last_causal[0] < search_floor:
+        return None
+    return last_causal[1]
 
-def _collect_players(log_text: str) -> list[str]:
-    players: list[str] = []
-    for raw in log_text.splitlines():
-        text = raw.strip()
-        draw_match = PLAYER_INITIAL_DRAW_RE.match(text)
-        if draw_match:
-            player = draw_match.group(1)
-            if player not in players:
-                players.append(player)
-            continue
-        actor = infer_actor(text)
-        if actor and actor not in players:
-            players.append(actor)
-    return players
 
+def _attribute_kos(
+    ko_mentions: Sequence[tuple[int, str, int]],
+    causal_actors: Sequence[tuple[int, str]],
+    ko_lookback_window: int,
+) -> dict[str, int]:
+    """Attribute KOs in one merge over KO mentions and causal lines, both sorted by line.
 
-def _resolve_ko_lookback_window(ko_lookback_window: int | None) -> int:
-    if ko_lookback_window is None:
-        return KO_LOOKBACK_DEFAULT
-    return max(KO_LOOKBACK_MIN, min(KO_LOOKBACK_MAX, ko_lookback_window))
+    A KO goes to the latest causal actor above it that is inside both the lookback window
+    and the current turn; the turn floor for each mention is recorded while parsing.
+    """
+    kos_by_player: dict[str, int] = {}
+    unknown_kos = 0
+    causal_cursor = 0
+    last_causal: tuple[int, str] | None = None
+    for idx, owner, turn_floor in ko_mentions:
+        while causal_cursor < len(causal_actors) and causal_actors[causal_cursor][0] < idx:
+            last_causal = causal_actors[causal_cursor]
+            causal_cursor += 1
+
+        ko_actor = _ko_actor(idx, turn_floor, last_causal, ko_lookback_window)
+        if ko_actor is None:
+            unknown_kos += 1
+            continue
+        if ko_actor == owner:
+            continue
+        kos_by_player[ko_actor] = kos_by_player.get(ko_actor, 0) + 1
 
+    if unknown_kos > 0:
+        kos_by_player["unknown"] = unknown_kos
+    return kos_by_player
 
-def _turn_floor_idx(lines: list[str], idx: int) -> int:
-    for prev_idx in range(idx, -1, -1):
-        if TURN_HEADER_RE.match(lines[prev_idx].strip()):
-            return prev_idx
-    return 0
 
+def _build_match_facts(
+    *,
+    stats: MatchStats,
+    turns_count: int,
+    concede: bool,
+    winner: str | None,
+    kos_by_player: dict[str, int],
+) -> MatchFacts:
+    return MatchFacts(
+        winner=winner,
+        went_first_player=stats.went_first_player,
+        turns_count=turns_count,
+        observable_prizes_taken_by_player=dict(stats.observable_prizes_taken_by_player),
+        kos_by_player=kos_by_player,
+        concede=concede,
+    )
 
-def _extract_causal_actor(text: str, players: list[str]) -> str | None:
-    inferred = infer_actor(text)
-    if inferred and inferred in players:
-        return inferred
 
-    match = KO_CAUSAL_ACTOR_BEFORE_VERB_RE.search(text)
-    if match and match.group(1) in players:
-        return match.group(1)
+def extract_match_facts(log: LogSource, ko_lookback_window: int | None = None) -> MatchFacts:
+    parsed = _as_parsed_log(log)
+    resolved_ko_lookback_window = _resolve_ko_lookback_window(ko_lookback_window)
+    if resolved_ko_lookback_window == KO_LOOKBACK_DEFAULT:
+        return parsed.match_facts
+    return _build_match_facts(
+        stats=parsed.stats,
+        turns_count=len(parsed.turns),
+        concede=parsed.concede,
+        winner=parsed.winner,
+        kos_by_player=_attribute_kos(parsed.ko_mentions, parsed.causal_actors, resolved_ko_lookback_window),
+    )
 
-    return None
 
+@dataclass
+class _TurnAccumulator:
+    """Open turn state collected line by line until the next turn header.
+
+    Bundle candidates are kept as ``(line_number, raw)`` pairs; ``PlayBundleEvent`` models are
+    only built for the lines that end up in the turn's bundle when it closes.
+    """
+
+    turn_number: int
+    start_line: int
+    actor: str | None = None
+    gust_lines: list[BundleLine] = field(default_factory=list)
+    action_lines: list[BundleLine] = field(default_factory=list)
+    action_ko_lines: list[list[BundleLine]] = field(default_factory=list)
+    action_prize_lines: list[list[BundleLine]] = field(default_factory=list)
+    unscoped_ko_lines: list[BundleLine] = field(default_factory=list)
+    unscoped_prize_lines: list[BundleLine] = field(default_factory=list)
+
+    def add_line(self, line_number: int, raw: str, text: str, *, is_prize: bool) -> None:
+        if PLAY_BUNDLE_GUST_RE.search(text):
+            self.gust_lines.append((line_number, raw))
+            return
+
+        if PLAY_BUNDLE_ACTION_RE.search(text):
+            self.action_lines.append((line_number, raw))
+            self.action_ko_lines.append([])
+            self.action_prize_lines.append([])
+            return
+
+        if PLAY_BUNDLE_KO_RE.search(text):
+            if self.action_lines:
+                self.action_ko_lines[-1].append((line_number, raw))
+            else:
+                self.unscoped_ko_lines.append((line_number, raw))
 
-def _is_causal_ko_event(text: str) -> bool:
-    return bool(KO_CAUSAL_DAMAGE_RE.search(text) or KO_CAUSAL_USED_RE.search(text) or KO_CAUSAL_GUST_RE.search(text))
+        if is_prize:
+            if self.action_lines:
+                self.action_prize_lines[-1].append((line_number, raw))
+            else:
+                self.unscoped_prize_lines.append((line_number, raw))
+
+    def close(self, end_line: int) -> tuple[TurnSpan, PlayBundle | None]:
+        turn_span = TurnSpan(
+            turn_number=self.turn_number,
+            start_line=self.start_line,
+            end_line=end_line,
+            actor=self.actor,
+        )
 
+        primary_action: BundleLine | None = None
+        ko_lines: list[BundleLine] = list(self.unscoped_ko_lines)
+        prize_lines: list[BundleLine] = list(self.unscoped_prize_lines)
+        if self.action_lines:
+            primary_action_index = _pick_primary_action_index(
+                self.action_lines, self.action_ko_lines, self.action_prize_lines
+            )
+            primary_action = self.action_lines[primary_action_index]
+            ko_lines.extend(self.action_ko_lines[primary_action_index])
+            prize_lines.extend(self.action_prize_lines[primary_action_index])
 
-def _infer_ko_actor(
-    lines: list[str],
-    idx: int,
-    players: list[str],
-    ko_lookback_window: int,
-) -> str | None:
-    floor_by_window = max(0, idx - ko_lookback_window)
-    floor_by_turn = _turn_floor_idx(lines, idx)
-    search_floor = max(floor_by_window, floor_by_turn)
+        gust: BundleLine | None = None
+        if self.gust_lines:
+            if primary_action is None:
+                gust = self.gust_lines[-1]
+            else:
+                gust_before_action = [line for line in self.gust_lines if line[0] < primary_action[0]]
+                if gust_before_action:
+                    gust = gust_before_action[-1]
 
-    for prev_idx in range(idx - 1, search_floor - 1, -1):
-        prev_text = lines[prev_idx].strip()
-        if not prev_text:
-            continue
-        if not _is_causal_ko_event(prev_text):
-            continue
-        actor = _extract_causal_actor(prev_text, players)
-        if actor:
-            return actor
-    return None
+        if not (gust or primary_action or ko_lines or prize_lines):
+            return turn_span, None
 
+        bundle = _start_play_bundle(
+            turn_span=turn_span,
+            actor=self.actor,
+            gust_event=_build_play_bundle_event(*gust) if gust else None,
+            action_event=_build_play_bundle_event(*primary_action) if primary_action else None,
+        )
+        bundle.ko_events = [_build_play_bundle_event(*line) for line in ko_lines]
+        bundle.prize_events = [_build_play_bundle_event(*line) for line in prize_lines]
+        bundle.window.raw_lines = _build_play_bundle_window_raw_lines(
+            gust_event=bundle.gust_event,
+            action_event=bundle.action_event,
+            ko_events=bundle.ko_events,
+            prize_events=bundle.prize_events,
+        )
+        return turn_span, bundle
 
-def extract_match_facts(log_text: str, ko_lookback_window: int | None = None) -> MatchFacts:
-    lines = log_text.splitlines()
-    players = _collect_players(log_text)
-    stats = compute_basic_stats(log_text)
-    resolved_ko_lookback_window = _resolve_ko_lookback_window(ko_lookback_window)
 
-    concede = False
-    winner: str | None = None
-    kos_by_player: dict[str, int] = {}
-    unknown_kos = 0
+def _resolve_went_first(first_choices: list[tuple[str, str]], players: list[str]) -> str | None:
+    went_first_player: str | None = None
+    for actor, choice in first_choices:
+        if choice == "primer":
+            went_first_player = actor
+        elif len(players) == 2:
+            went_first_player = players[0] if players[1] == actor else players[1]
+    return went_first_player
+
+
+class IncrementalLogParser:
+    """Parse a log as it grows: ``feed`` new lines, ``snapshot`` the facts seen so far.
+
+    Each fed line is scanned once and only extends the open turn, the event list and the
+    running counters, so appending to a live log never reparses earlier lines. KOs are
+    attributed as their line is fed, since the lookback only reaches earlier lines. A
+    snapshot shares the accumulated lists through read-only views, closes a copy of the
+    open turn and is equal to ``parse_log`` over the same lines.
+    """
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self._turns: list[TurnSpan] = []
+        self._play_bundles: list[PlayBundle] = []
+        self._events: list[KeyEvent] = []
+        self._players: list[str] = []
+        self._initial_draw_players: list[str] = []
+        self._first_choices: list[tuple[str, str]] = []
+        self._mulligans_by_player: dict[str, int] = {}
+        self._prizes_by_player: dict[str, int] = {}
+        self._concede = False
+        self._winner: str | None = None
+        self._ko_mentions: list[tuple[int, str, int]] = []
+        self._causal_candidates: list[tuple[int, str | None, str | None]] = []
+        self._candidate_names: set[str] = set()
+        self._causal_actors: list[tuple[int, str]] = []
+        self._kos_by_player: dict[str, int] = {}
+        self._unknown_kos = 0
+        self._turn_floor = 0
+        self._current_turn: _TurnAccumulator | None = None
+        self._snapshot: ParsedLog | None = None
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Append lines (with or without trailing newlines) to the parsed log."""
+        for line in lines:
+            self._consume(line.rstrip("\r\n"))
+
+    def snapshot(self) -> ParsedLog:
+        """Return the ``ParsedLog`` for every line fed so far; the open turn is closed at the last line."""
+        if self._snapshot is not None:
+            return self._snapshot
+
+        open_turn: tuple[TurnSpan, ...] = ()
+        open_bundle: tuple[PlayBundle, ...] = ()
+        if self._current_turn is not None:
+            turn_span, bundle = self._current_turn.close(len(self._lines))
+            open_turn = (turn_span,)
+            if bundle is not None:
+                open_bundle = (bundle,)
+        turns = _FrozenView(self._turns, open_turn)
+
+        stats = MatchStats(
+            went_first_player=_resolve_went_first(self._first_choices, self._initial_draw_players),
+            mulligans_by_player=dict(self._mulligans_by_player),
+            observable_prizes_taken_by_player=dict(self._prizes_by_player),
+        )
+        kos_by_player = dict(self._kos_by_player)
+        if self._unknown_kos > 0:
+            kos_by_player["unknown"] = self._unknown_kos
+        self._snapshot = ParsedLog(
+            lines=_FrozenView(self._lines),
+            turns=turns,
+            events=_FrozenView(self._events),
+            players=_FrozenView(self._players),
+            stats=stats,
+            play_bundles=_FrozenView(self._play_bundles, open_bundle),
+            concede=self._concede,
+            winner=self._winner,
+            ko_mentions=_FrozenView(self._ko_mentions),
+            causal_actors=_FrozenView(self._causal_actors),
+            match_facts=_build_match_facts(
+                stats=stats,
+                turns_count=len(turns),
+                concede=self._concede,
+                winner=self._winner,
+                kos_by_player=kos_by_player,
+            ),
+        )
+        return self._snapshot
 
-    for idx, raw in enumerate(lines):
+    def _consume(self, raw: str) -> None:
+        self._snapshot = None
+        idx = len(self._lines)
+        self._lines.append(raw)
         text = raw.strip()
+        line_number = idx + 1
+        if TURN_HEADER_RE.match(text):
+            if self._current_turn is not None:
+                turn_span, bundle = self._current_turn.close(idx)
+                self._turns.append(turn_span)
+                if bundle is not None:
+                    self._play_bundles.append(bundle)
+            self._turn_floor = idx
+            self._current_turn = _TurnAccumulator(turn_number=len(self._turns) + 1, start_line=line_number)
         if not text:
-            continue
+            return
+
+        self._events.extend(EVENT_ENGINE(text, line_number, raw))
+
+        actor = infer_actor(text)
+        draw_match = PLAYER_INITIAL_DRAW_RE.match(text)
+        player = draw_match.group(1) if draw_match else actor
+        if player and player not in self._players:
+            self._players.append(player)
+            if player in self._candidate_names:
+                self._reattribute_kos()
+
+        stats_draw_match = STATS_INITIAL_DRAW_RE.match(text)
+        if stats_draw_match and stats_draw_match.group(1) not in self._initial_draw_players:
+            self._initial_draw_players.append(stats_draw_match.group(1))
+
+        first_match = WENT_FIRST_RE.match(text)
+        if first_match:
+            self._first_choices.append((first_match.group(1), first_match.group(2)))
+
+        mulligans = self._mulligans_by_player
+        one_mulligan = ONE_MULLIGAN_RE.match(text)
+        if one_mulligan:
+            mulligan_actor = one_mulligan.group(1)
+            mulligans[mulligan_actor] = mulligans.get(mulligan_actor, 0) + 1
+
+        many_mulligan = MANY_MULLIGANS_RE.match(text)
+        if many_mulligan:
+            mulligan_actor = many_mulligan.group(1)
+            mulligans[mulligan_actor] = mulligans.get(mulligan_actor, 0) + int(many_mulligan.group(2))
+
+        prize_match = PRIZE_TAKEN_RE.match(text)
+        if prize_match:
+            prize_actor = prize_match.group(1)
+            count_text = prize_match.group(2)
+            count = 1 if count_text == "una" else int(count_text)
+            self._prizes_by_player[prize_actor] = self._prizes_by_player.get(prize_actor, 0) + count
 
         if CONCEDE_LINE_RE.search(text):
-            concede = True
+            self._concede = True
             winner_match = CONCEDE_WINNER_RE.search(text)
             if winner_match:
-                winner = winner_match.group(1)
-
-        ko_mentions = list(KO_OWNER_RE.finditer(text))
-        if not ko_mentions:
+                self._winner = winner_match.group(1)
+
+        for mention in KO_OWNER_RE.finditer(text):
+            self._ko_mentions.append((idx, mention.group(1), self._turn_floor))
+            self._attribute_ko(idx, mention.group(1))
+        if _is_causal_ko_event(text):
+            before_verb_match = KO_CAUSAL_ACTOR_BEFORE_VERB_RE.search(text)
+            before_verb = before_verb_match.group(1) if before_verb_match else None
+            self._causal_candidates.append((idx, actor, before_verb))
+            self._candidate_names.update(name for name in (actor, before_verb) if name)
+            causal_actor = _resolve_causal_actor(actor, before_verb, self._players)
+            if causal_actor is not None:
+                self._causal_actors.append((idx, causal_actor))
+
+        current_turn = self._current_turn
+        if current_turn is not None:
+            if current_turn.actor is None:
+                current_turn.actor = actor
+            current_turn.add_line(line_number, raw, text, is_prize=prize_match is not None)
+
+    def _attribute_ko(self, idx: int, owner: str) -> None:
+        last_causal = self._causal_actors[-1] if self._causal_actors else None
+        ko_actor = _ko_actor(idx, self._turn_floor, last_causal, KO_LOOKBACK_DEFAULT)
+        if ko_actor is None:
+            self._unknown_kos += 1
+        elif ko_actor != owner:
+            self._kos_by_player[ko_actor] = self._kos_by_player.get(ko_actor, 0) + 1
+
+    def _reattribute_kos(self) -> None:
+        # A causal line named a player before that player was known; resolve every causal line again.
+        # Earlier snapshots keep viewing the previous list, so build a new one instead of editing it.
+        self._causal_actors = _resolve_causal_actors(self._causal_candidates, self._players)
+        kos_by_player = _attribute_kos(self._ko_mentions, self._causal_actors, KO_LOOKBACK_DEFAULT)
+        self._unknown_kos = kos_by_player.pop("unknown", 0)
+        self._kos_by_player = kos_by_player
+
+
+def parse_log(log_text: str) -> ParsedLog:
+    """Scan the log once and collect every deterministic fact the tools expose."""
+    parser = IncrementalLogParser()
+    parser.feed(log_text.splitlines())
+    return parser.snapshot()
+
+
+StreamRecord = TurnSpan | KeyEvent | PlayBundle
+
+
+def iter_log_records(lines: Iterable[str]) -> Iterator[StreamRecord]:
+    """Yield key events as lines are read, and each turn span and play bundle once its turn closes.
+
+    Only the open turn's bundle candidates are held in memory, so a file handle, stdin or a
+    decompressor can be parsed without loading the whole log.
+    """
+    current_turn: _TurnAccumulator | None = None
+    turns_count = 0
+    line_number = 0
+
+    for line_number, line in enumerate(lines, start=1):
+        raw = line.rstrip("\r\n")
+        text = raw.strip()
+        if TURN_HEADER_RE.match(text):
+            if current_turn is not None:
+                yield from _close_streamed_turn(current_turn, line_number - 1)
+            turns_count += 1
+            current_turn = _TurnAccumulator(turn_number=turns_count, start_line=line_number)
+        if not text:
             continue
 
-        for mention in ko_mentions:
-            owner = mention.group(1)
-            ko_actor = _infer_ko_actor(lines, idx, players, resolved_ko_lookback_window)
-            if ko_actor is None:
-                unknown_kos += 1
-                continue
-            if ko_actor == owner:
-                continue
-            kos_by_player[ko_actor] = kos_by_player.get(ko_actor, 0) + 1
+        yield from EVENT_ENGINE(text, line_number, raw)
 
-    if unknown_kos > 0:
-        kos_by_player["unknown"] = unknown_kos
+        if current_turn is not None:
+            if current_turn.actor is None:
+                current_turn.actor = infer_actor(text)
+            current_turn.add_line(line_number, raw, text, is_prize=PRIZE_TAKEN_RE.match(text) is not None)
 
-    return MatchFacts(
-        winner=winner,
-        went_first_player=stats.went_first_player,
-        turns_count=len(index_turns(log_text)),
-        observable_prizes_taken_by_player=dict(stats.observable_prizes_taken_by_player),
-        kos_by_player=kos_by_player,
-        concede=concede,
-    )
+    if current_turn is not None:
+        yield from _close_streamed_turn(current_turn, line_number)
+
+
+def _close_streamed_turn(turn: _TurnAccumulator, end_line: int) -> Iterator[StreamRecord]:
+    turn_span, bundle = turn.close(end_line)
+    yield turn_span
+    if bundle is not None:
+        yield bundle
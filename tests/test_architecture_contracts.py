@@ -3,7 +3,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
-from pokecoach.events.registry import EVENT_DETECTORS
+from pokecoach.events.registry import EVENT_DETECTORS, EVENT_ENGINE
 from pokecoach.schemas import KeyEvent
 
 
@@ -17,16 +17,20 @@ def test_event_registry_exposes_callable_detectors() -> None:
         assert all(isinstance(item, KeyEvent) for item in result)
 
 
-def test_tools_iter_events_uses_event_registry() -> None:
+def test_tools_parse_log_uses_compiled_event_engine() -> None:
     tools_source = Path("src/pokecoach/tools.py").read_text(encoding="utf-8")
     module = ast.parse(tools_source)
 
-    iter_events = next(
-        node for node in module.body if isinstance(node, ast.FunctionDef) and node.name == "_iter_events"
+    parse_log = next(node for node in module.body if isinstance(node, ast.FunctionDef) and node.name == "parse_log")
+    parser_class = next(
+        node for node in module.body if isinstance(node, ast.ClassDef) and node.name == "IncrementalLogParser"
     )
-    iter_source = ast.get_source_segment(tools_source, iter_events) or ""
+    parse_source = ast.get_source_segment(tools_source, parse_log) or ""
+    parser_source = ast.get_source_segment(tools_source, parser_class) or ""
 
-    assert "for detector in EVENT_DETECTORS" in iter_source
+    assert "IncrementalLogParser()" in parse_source
+    assert "EVENT_ENGINE(" in parser_source
+    assert EVENT_ENGINE.detectors == tuple(EVENT_DETECTORS)
 
 
 def test_report_module_stays_as_facade_without_guardrail_impl_details() -> None:
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from pokecoach.archive import (
+    build_archive_index,
+    index_path_for,
+    iter_game_texts,
+    load_archive_index,
+    read_game_text,
+    scan_game_boundaries,
+)
+from pokecoach.tools import extract_match_facts, index_turns
+
+GAME_ONE = (
+    "Preparación\n"
+    "A declaró un mulligan.\n"
+    "A robó 7 cartas de la mano inicial.\n"
+    "B robó 7 cartas de la mano inicial.\n"
+    "A decidió empezar en primer lugar.\n"
+    "Turno de [playerName]\n"
+    "A robó una carta.\n"
+    "Turno de [playerName]\n"
+    "B robó una carta.\n"
+    "El rival se rindió. A ganó.\n"
+)
+GAME_TWO = (
+    "Preparación\n"
+    "C robó 7 cartas de la mano inicial.\n"
+    "D robó 7 cartas de la mano inicial.\n"
+    "Turno de [playerName]\n"
+    "C robó una carta.\n"
+)
+GAME_THREE = (
+    "E robó 7 cartas de la mano inicial.\n"
+    "F robó 7 cartas de la mano inicial.\n"
+    "Turno de [playerName]\n"
+    "E robó una carta.\n"
+    "Te rendiste.\n"
+    "F ganó.\n"
+)
+
+
+def _write_archive(tmp_path: Path, *games: str) -> Path:
+    path = tmp_path / "season.txt"
+    path.write_bytes("\n".join(games).encode("utf-8"))
+    return path
+
+
+def test_scan_game_boundaries_splits_on_concede_and_new_initial_draws() -> None:
+    buffer = (GAME_ONE + GAME_TWO + GAME_THREE).encode("utf-8")
+
+    games = scan_game_boundaries(buffer)
+
+    texts = [buffer[game.start_offset : game.end_offset].decode("utf-8") for game in games]
+    assert texts == [GAME_ONE, GAME_TWO, GAME_THREE]
+    assert [game.game_number for game in games] == [1, 2, 3]
+
+
+def test_archive_games_parse_independently(tmp_path: Path) -> None:
+    archive = _write_archive(tmp_path, GAME_ONE, GAME_TWO, GAME_THREE)
+
+    texts = list(iter_game_texts(archive))
+
+    assert len(texts) == 3
+    assert [len(index_turns(text)) for text in texts] == [2, 1, 1]
+    assert extract_match_facts(texts[0]).winner == "A"
+    assert len(index_turns(archive.read_text(encoding="utf-8"))) == 4
+
+
+def test_archive_index_is_persisted_and_reused(tmp_path: Path, monkeypatch) -> None:
+    archive = _write_archive(tmp_path, GAME_ONE, GAME_TWO)
+    games = build_archive_index(archive)
+    assert index_path_for(archive).exists()
+
+    from pokecoach import archive as archive_module
+
+    def fail_scan(_buffer):
+        raise AssertionError("fresh index must not rescan the archive")
+
+    monkeypatch.setattr(archive_module, "scan_game_boundaries", fail_scan)
+    assert load_archive_index(archive) == games
+    assert read_game_text(archive, games[1]).lstrip("\n").startswith("Preparación\nC robó")
+
+
+def test_archive_index_is_rebuilt_when_archive_changes(tmp_path: Path) -> None:
+    archive = _write_archive(tmp_path, GAME_ONE)
+    assert len(build_archive_index(archive)) == 1
+
+    archive.write_bytes((GAME_ONE + GAME_THREE).encode("utf-8"))
+
+    assert len(load_archive_index(archive)) == 2
+
+
+def test_empty_archive_has_no_games(tmp_path: Path) -> None:
+    archive = tmp_path / "empty.txt"
+    archive.write_bytes(b"")
+
+    assert build_archive_index(archive) == []
@@ -0,0 +1,58 @@
+import random
+
+from pokecoach.events import KeywordAutomaton, KeywordSpec, card_mentions
+from pokecoach.events.registry import detect_stadium, detect_supporter
+from pokecoach.report import _extract_ko_target
+
+
+def _naive_matches(specs: list[KeywordSpec], text: str) -> set[tuple[int, int, str]]:
+    found = set()
+    for spec in specs:
+        haystack, needle = (text, spec.keyword) if spec.case_sensitive else (text.lower(), spec.keyword.lower())
+        start = haystack.find(needle)
+        while start != -1:
+            found.add((start, start + len(needle), spec.keyword))
+            start = haystack.find(needle, start + 1)
+    return found
+
+
+def test_card_automaton_finds_every_mention_in_one_pass() -> None:
+    text = "Kami-Yan jugó (me1_1) Órdenes de Jefes y el Mega-Lopunny ex cambió con Latias ex."
+    mentions = [(match.keyword, match.category) for match in card_mentions(text)]
+
+    assert mentions == [
+        ("Órdenes de Jefes", "SUPPORTER"),
+        ("Lopunny", "POKEMON"),
+        ("Mega-Lopunny ex", "POKEMON"),
+        ("Latias ex", "POKEMON"),
+    ]
+    assert all(text[match.start : match.end] == match.keyword for match in card_mentions(text))
+
+
+def test_card_automaton_keeps_supporters_case_sensitive_and_stadiums_case_insensitive() -> None:
+    assert card_mentions("Kami-Yan utiliza su turno.") == ()
+    assert detect_supporter("Kami-Yan jugó Liza.", 3, "Kami-Yan jugó Liza.")
+    assert not detect_supporter("Kami-Yan jugó liza.", 3, "Kami-Yan jugó liza.")
+    assert detect_stadium("Kami-Yan JUGÓ JAULA DE COMBATE.", 4, "Kami-Yan JUGÓ JAULA DE COMBATE.")
+    assert not detect_stadium("Jaula de Combate: Kami-Yan jugó.", 4, "Jaula de Combate: Kami-Yan jugó.")
+
+
+def test_keyword_automaton_matches_naive_scan_for_large_keyword_lists() -> None:
+    rng = random.Random(7)
+    alphabet = "abcde "
+    specs = [
+        KeywordSpec("".join(rng.choice(alphabet) for _ in range(rng.randint(2, 6))), "CARD", rng.random() < 0.5)
+        for _ in range(500)
+    ]
+    automaton = KeywordAutomaton(specs)
+
+    for _ in range(50):
+        text = "".join(rng.choice(alphabet + "ABC") for _ in range(80))
+        found = {(match.start, match.end, match.keyword) for match in automaton.find_all(text)}
+        assert found == _naive_matches(list(automaton.specs), text)
+
+
+def test_ko_target_falls_back_to_card_mentions_without_card_id() -> None:
+    assert _extract_ko_target("¡El (sv8_220) Latias ex de Kami-Yan quedó Fuera de Combate!") == "Latias ex"
+    assert _extract_ko_target("¡El Mega-Lopunny ex de Kami-Yan quedó Fuera de Combate!") == "Mega-Lopunny ex"
+    assert _extract_ko_target("¡El Pokémon de Kami-Yan quedó Fuera de Combate!") == "Unknown target"
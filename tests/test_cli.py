@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -9,6 +11,27 @@ from pathlib import Path
 UV_CACHE_DIR = "/tmp/uv-cache"
 REPO_ROOT = Path(__file__).resolve().parents[1]
 LOG_PATH = "logs_prueba/battle_logs_ptcgl_spanish_con_ids_1.txt"
+FIXTURES_DIR = REPO_ROOT / "tests" / "golden" / "fixtures"
+
+
+def _load_cli_module():
+    spec = importlib.util.spec_from_file_location("run_report", REPO_ROOT / "run_report.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Registered so batch workers can pickle module-level functions by name.
+    sys.modules["run_report"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _batch_logs_dir(tmp_path: Path) -> Path:
+    logs_dir = tmp_path / "logs"
+    (logs_dir / "nested").mkdir(parents=True)
+    for fixture in sorted(FIXTURES_DIR.glob("*.txt")):
+        shutil.copy(fixture, logs_dir / fixture.name)
+    shutil.copy(next(FIXTURES_DIR.glob("*.txt")), logs_dir / "nested" / "again.txt")
+    (logs_dir / "broken.txt").write_text("", encoding="utf-8")
+    return logs_dir
 
 
 def _run_cli(args: list[str]) -> subprocess.CompletedProcess[str]:
@@ -82,3 +105,136 @@ def test_cli_invalid_format_returns_argparse_error() -> None:
 
     assert completed.returncode != 0
     assert "invalid choice" in completed.stderr
+
+
+def test_cli_batch_streams_ndjson_and_reports_failures(tmp_path: Path, capsys) -> None:
+    cli = _load_cli_module()
+    logs_dir = _batch_logs_dir(tmp_path)
+
+    exit_code = cli.main([str(logs_dir), "--deterministic-only", "--workers", "2"])
+
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert exit_code == 1
+    assert [Path(record["log_path"]).name for record in records] == [
+        "ambiguous_turns_interturn_block.txt",
+        "broken.txt",
+        "compound_single_line_events.txt",
+        "again.txt",
+    ]
+    assert [record["ok"] for record in records] == [True, False, True, True]
+    assert "summary" in records[0]["report"]
+    assert "ValidationError" in records[1]["error"]
+    assert f"error: {logs_dir / 'broken.txt'}: ValidationError" in captured.err
+    assert "batch: 4 logs (3 ok, 1 failed)" in captured.err
+    assert "p50=" in captured.err and "p99=" in captured.err
+
+
+_REAL_BATCH_ITEM = {}
+
+
+def _run_batch_item_or_crash(task: tuple) -> dict:
+    # Runs in a forked pool worker: a log asking for a crash kills the worker process outright.
+    if "CRASH" in Path(task[0]).read_text(encoding="utf-8"):
+        os._exit(1)
+    return _REAL_BATCH_ITEM["run"](task)
+
+
+def test_cli_batch_survives_a_worker_that_dies(tmp_path: Path, capsys, monkeypatch) -> None:
+    cli = _load_cli_module()
+    logs_dir = _batch_logs_dir(tmp_path)
+    (logs_dir / "broken.txt").write_text("CRASH\n", encoding="utf-8")
+    monkeypatch.setitem(_REAL_BATCH_ITEM, "run", cli._run_batch_item)
+    monkeypatch.setattr(cli, "_run_batch_item", _run_batch_item_or_crash)
+
+    exit_code = cli.main([str(logs_dir), "--deterministic-only", "--workers", "2"])
+
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert exit_code == 1
+    assert [Path(record["log_path"]).name for record in records] == [
+        "ambiguous_turns_interturn_block.txt",
+        "broken.txt",
+        "compound_single_line_events.txt",
+        "again.txt",
+    ]
+    assert [record["ok"] for record in records] == [True, False, True, True]
+    assert records[1]["error"].startswith("BrokenProcessPool: worker process died")
+    assert "batch: 4 logs (3 ok, 1 failed)" in captured.err
+
+
+def test_cli_batch_writes_per_log_outputs_for_globs(tmp_path: Path, capsys) -> None:
+    cli = _load_cli_module()
+    logs_dir = _batch_logs_dir(tmp_path)
+    output_dir = tmp_path / "reports"
+
+    exit_code = cli.main(
+        [
+            str(logs_dir / "*_*.txt"),
+            str(logs_dir / "**" / "again.txt"),
+            "--format",
+            "md",
+            "--output-dir",
+            str(output_dir),
+        ]
+    )
+
+    captured = capsys.readouterr()
+    assert exit_code == 0, captured.err
+    assert captured.out == ""
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "again.md",
+        "ambiguous_turns_interturn_block.md",
+        "compound_single_line_events.md",
+    ]
+    assert (output_dir / "again.md").read_text(encoding="utf-8").startswith("# Post-Game Report")
+    assert "batch: 3 logs (3 ok, 0 failed)" in captured.err
+
+
+def test_cli_batch_split_games_reports_each_game_of_an_archive(tmp_path: Path, capsys) -> None:
+    cli = _load_cli_module()
+    archive = tmp_path / "season.txt"
+    archive.write_text(
+        "".join(
+            (FIXTURES_DIR / name).read_text(encoding="utf-8")
+            for name in ("compound_single_line_events.txt", "ambiguous_turns_interturn_block.txt")
+        ),
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "reports"
+
+    exit_code = cli.main(
+        [
+            str(tmp_path / "*.txt"),
+            "--split-games",
+            "--deterministic-only",
+            "--workers",
+            "1",
+            "--output-dir",
+            str(output_dir),
+        ]
+    )
+
+    captured = capsys.readouterr()
+    assert exit_code == 0, captured.err
+    assert sorted(path.name for path in output_dir.iterdir()) == ["season-game1.json", "season-game2.json"]
+    assert (tmp_path / "season.txt.games.json").is_file()
+    assert "batch: 2 logs (2 ok, 0 failed)" in captured.err
+
+    exit_code = cli.main([str(tmp_path / "*.txt"), "--split-games", "--deterministic-only", "--workers", "1"])
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert exit_code == 0
+    assert [(record["game_number"], record["ok"]) for record in records] == [(1, True), (2, True)]
+
+
+def test_cli_batch_markdown_requires_output_dir(tmp_path: Path, capsys) -> None:
+    cli = _load_cli_module()
+
+    try:
+        cli.main([str(_batch_logs_dir(tmp_path)), "--format", "md"])
+    except SystemExit as exc:
+        assert exc.code == 2
+    else:
+        raise AssertionError("expected argparse error")
+    assert "requires --output-dir" in capsys.readouterr().err
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from pokecoach.coach_auditor import evaluate_quality_minimum, run_one_iteration_coach_auditor
+import asyncio
+import threading
+
+from pokecoach.coach_auditor import (
+    JsonlTelemetrySink,
+    ShadowAuditRunner,
+    arun_one_iteration_coach_auditor,
+    arun_shadow_audit_coach_auditor,
+    evaluate_quality_minimum,
+    run_one_iteration_coach_auditor,
+    run_shadow_audit_coach_auditor,
+)
 from pokecoach.schemas import AuditResult, DraftReport, PatchAction, Violation
 
 
@@ -326,3 +337,114 @@ def test_callback_payloads_keep_expected_order_and_minimum_fields() -> None:
         assert "violations_count" in payload
         assert "quality_minimum_pass" in payload
         assert "rewrite_used" in payload
+
+
+def test_async_run_matches_sync_rewrite_flow() -> None:
+    sync_events: list[dict[str, object]] = []
+    async_events: list[dict[str, object]] = []
+    failing_audit = AuditResult(
+        quality_minimum_pass=False,
+        violations=[_make_violation(severity="critical")],
+        patch_plan=[],
+        audit_summary="Fail.",
+    )
+    passing_audit = AuditResult(quality_minimum_pass=True, violations=[], patch_plan=[], audit_summary="Pass.")
+
+    def auditor(draft: DraftReport) -> AuditResult:
+        return passing_audit if draft.summary == ["rewritten summary"] else failing_audit
+
+    async def async_draft_generator() -> DraftReport:
+        return _make_draft("initial")
+
+    async def async_auditor(draft: DraftReport) -> AuditResult:
+        return auditor(draft)
+
+    async def async_rewrite_generator(
+        _draft: DraftReport, _violations: list[Violation], _patch_plan: list[PatchAction]
+    ) -> DraftReport:
+        return _make_draft("rewritten")
+
+    sync_result = run_one_iteration_coach_auditor(
+        lambda: _make_draft("initial"),
+        auditor,
+        lambda _draft, _violations, _patch_plan: _make_draft("rewritten"),
+        event_callback=sync_events.append,
+    )
+    async_result = asyncio.run(
+        arun_one_iteration_coach_auditor(
+            async_draft_generator,
+            async_auditor,
+            async_rewrite_generator,
+            event_callback=async_events.append,
+        )
+    )
+
+    assert async_result == sync_result
+    assert async_result.draft_report.summary == ["rewritten summary"]
+    assert async_events == sync_events
+
+
+def test_shadow_audit_returns_draft_before_audit_finishes() -> None:
+    release_audit = threading.Event()
+    records: list[dict] = []
+    runner = ShadowAuditRunner([records.append])
+
+    def auditor(_draft: DraftReport) -> AuditResult:
+        release_audit.wait(timeout=5)
+        return AuditResult(
+            quality_minimum_pass=False,
+            violations=[_make_violation()],
+            patch_plan=[],
+            audit_summary="shadow",
+        )
+
+    result = run_shadow_audit_coach_auditor(
+        lambda: _make_draft("initial"),
+        auditor,
+        shadow_runner=runner,
+        shadow_context={"shadow_audit_id": "abc"},
+    )
+
+    assert result.draft_report == _make_draft("initial")
+    assert result.metadata.audit_status == "shadow"
+    assert result.metadata.audit_pass_first_try is None
+    assert runner.pending_count == 1
+    assert records == []
+    assert runner.drain(timeout=0.01) is False
+
+    release_audit.set()
+    assert runner.shutdown(timeout=5) is True
+    assert runner.pending_count == 0
+    assert len(records) == 1
+    assert records[0]["event_name"] == "shadow_audit_completed"
+    assert records[0]["violations_count"] == 1
+    assert records[0]["quality_minimum_pass"] is False
+    assert records[0]["violations"][0]["code"] == "EVIDENCE_MISSING"
+    assert records[0]["shadow_audit_id"] == "abc"
+
+
+def test_shadow_audit_records_auditor_failures_and_survives_sink_errors(tmp_path) -> None:
+    def broken_sink(_record: dict) -> None:
+        raise OSError("disk full")
+
+    log_path = tmp_path / "shadow.jsonl"
+    runner = ShadowAuditRunner([broken_sink, JsonlTelemetrySink(log_path)])
+
+    def auditor(_draft: DraftReport) -> AuditResult:
+        raise TimeoutError("agent b timed out")
+
+    async def draft_generator() -> DraftReport:
+        return _make_draft("initial")
+
+    events: list[dict] = []
+    result = asyncio.run(
+        arun_shadow_audit_coach_auditor(draft_generator, auditor, shadow_runner=runner, event_callback=events.append)
+    )
+    assert runner.shutdown() is True
+
+    assert result.draft_report.summary == ["initial summary"]
+    assert [event["event_name"] for event in events] == ["coach_run_started", "coach_run_completed", "report_returned"]
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert '"event_name": "shadow_audit_failed"' in lines[0]
+    assert "TimeoutError: agent b timed out" in lines[0]
@@ -0,0 +1,87 @@
+import sys
+import tracemalloc
+from pathlib import Path
+
+from pokecoach.events import EVENT_ENGINE, EventStore
+from pokecoach.tools import build_event_store, find_key_events, infer_actor
+
+FIXTURES_DIR = Path("tests/golden/fixtures")
+
+
+def _synthetic_lines(turns: int) -> list[str]:
+    lines = ["A robó 7 cartas de la mano inicial.", "B robó 7 cartas de la mano inicial."]
+    for turn in range(turns):
+        player, opponent = ("A", "B") if turn % 2 == 0 else ("B", "A")
+        lines.extend(
+            [
+                "Turno de [playerName]",
+                f"{player} jugó Órdenes de Jefes.",
+                f"El (x_1) Atacante de {player} infligió 120 puntos de daño usando Golpe contra el (x_2) Defensor.",
+                f"¡El (x_2) Defensor de {opponent} quedó Fuera de Combate!",
+                f"{player} tomó una carta de Premio.",
+            ]
+        )
+    return lines
+
+
+def test_event_store_matches_find_key_events_for_fixtures() -> None:
+    for path in sorted(FIXTURES_DIR.glob("*.txt")):
+        log_text = path.read_text(encoding="utf-8")
+        lines = log_text.splitlines()
+        store = build_event_store(lines)
+
+        assert store.to_index() == find_key_events(log_text), path.name
+        for position in range(len(store)):
+            assert store.text(position) is lines[store.line(position) - 1]
+            assert store.actor(position) == infer_actor(store.text(position).strip())
+
+
+def test_event_store_interns_types_and_actors() -> None:
+    store = build_event_store(_synthetic_lines(50))
+
+    assert store.event_type_names == ["SUPPORTER", "ATTACK", "KO", "PRIZE_TAKEN"]
+    assert store.actor_names == ["", "A", "B"]
+    assert store.count_by_type() == {"SUPPORTER": 50, "ATTACK": 50, "KO": 50, "PRIZE_TAKEN": 50}
+    assert [store.line(position) for position in store.positions_of("KO")][:2] == [6, 11]
+    assert store.actor(next(store.positions_of("KO"))) is None
+    assert list(store.positions_of("CONCEDE")) == []
+
+
+def test_event_store_append_builds_key_events_on_demand() -> None:
+    store = EventStore(["Alice tomó una carta de Premio."])
+    store.append("PRIZE_TAKEN", 1, "Alice")
+
+    event = store.event(0)
+    assert event.event_type == "PRIZE_TAKEN"
+    assert event.text == "Alice tomó una carta de Premio."
+    assert store.nbytes == 10
+    assert sys.intern("Alice") is store.actor_names[1]
+
+
+def test_event_store_keeps_actor_codes_past_the_16_bit_range() -> None:
+    actors = [f"player{n}" for n in range(70_000)]
+    store = EventStore([f"{actor} tomó una carta de Premio." for actor in actors])
+    for line, actor in enumerate(actors, start=1):
+        store.append("PRIZE_TAKEN", line, actor)
+
+    assert store.actor(len(actors) - 1) == actors[-1]
+    assert store.actor_names[-1] == actors[-1]
+
+
+def test_event_store_uses_less_memory_than_key_event_models() -> None:
+    lines = _synthetic_lines(2_000)
+
+    tracemalloc.start()
+    try:
+        models = [event for idx, raw in enumerate(lines) for event in EVENT_ENGINE(raw.strip(), idx + 1, raw)]
+        model_bytes = tracemalloc.get_traced_memory()[0]
+        del models
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        store = build_event_store(lines)
+        store_bytes = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+    assert len(store) == 8_000
+    assert store_bytes * 10 < model_bytes
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from pokecoach.events.registry import EVENT_DETECTORS, EVENT_ENGINE, compile_event_detectors
+from pokecoach.schemas import KeyEvent
 from pokecoach.tools import find_key_events
 
 
@@ -50,3 +52,71 @@ def test_find_key_events_detects_stadium_from_play_line() -> None:
     index = find_key_events(log_text)
 
     assert any(event.event_type == "STADIUM" for event in index.events)
+
+
+def _per_detector_events(lines: list[str]) -> list[KeyEvent]:
+    events: list[KeyEvent] = []
+    for line_number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if not text:
+            continue
+        for detector in EVENT_DETECTORS:
+            events.extend(detector(text, line_number, raw))
+    return events
+
+
+def test_event_engine_matches_per_detector_loop() -> None:
+    lines = [
+        line
+        for path in sorted(Path("tests/golden/fixtures").glob("*.txt"))
+        for line in path.read_text(encoding="utf-8").splitlines()
+    ]
+    lines += [
+        "Kami-Yan puso en juego la carta de Estadio Torre de Vigilancia del Equipo Rocket.",
+        "Kami-Yan jugó (me1_114) Órdenes de Jefes.",
+        "Kami-Yan jugó (sv2_1) Ultra Ball.",
+        "El (sv1_25) Pikachu de Bob usó Golpe Ligero.",
+        "   - Kami-Yan barajó su mazo.",
+        "",
+    ]
+
+    engine_events: list[KeyEvent] = []
+    for line_number, raw in enumerate(lines, start=1):
+        text = raw.strip()
+        if text:
+            engine_events.extend(EVENT_ENGINE(text, line_number, raw))
+
+    assert engine_events == _per_detector_events(lines)
+
+
+def test_event_engine_matches_per_detector_loop_for_mixed_case_lines() -> None:
+    lines = [
+        "Kami-Yan tomó 2 cartas de PREMIO.",
+        "¡El Pikachu de Bob QUEDÓ Fuera de Combate!",
+        "Quedó Fuera de Combate el Charmander de Bob.",
+        "El Pikachu de Bob INFLIGIÓ 30 puntos de daño USANDO Golpe Ligero.",
+        "EL RIVAL SE RINDIÓ.",
+        "Kami-Yan PUSO EN JUEGO LA CARTA DE ESTADIO Torre de Vigilancia del Equipo Rocket.",
+        "Jugó (me1_114) Órdenes de Jefes Kami-Yan.",
+    ]
+
+    engine_events: list[KeyEvent] = []
+    for line_number, raw in enumerate(lines, start=1):
+        engine_events.extend(EVENT_ENGINE(raw.strip(), line_number, raw))
+
+    expected = _per_detector_events(lines)
+    assert {event.event_type for event in expected} >= {"PRIZE_TAKEN", "KO", "ATTACK", "CONCEDE", "STADIUM"}
+    assert engine_events == expected
+
+
+def test_compiled_engine_still_calls_custom_detectors_in_registry_order() -> None:
+    def detect_retreat(text: str, line: int, raw: str) -> list[KeyEvent]:
+        if "retiró" in text:
+            return [KeyEvent(event_type="RETREAT", line=line, text=raw)]
+        return []
+
+    engine = compile_event_detectors((detect_retreat, *EVENT_DETECTORS))
+    raw = "Kami-Yan retiró a X y jugó Pueblo Altamía."
+
+    assert [event.event_type for event in engine(raw, 3, raw)] == ["RETREAT", "STADIUM"]
+    assert engine("Kami-Yan robó una carta.", 4, "Kami-Yan robó una carta.") == []
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_PATH = REPO_ROOT / "tests" / "golden" / "fixtures" / "compound_single_line_events.txt"
+# The LLM stack alone costs several hundred ms; override on unusually slow machines.
+IMPORT_BUDGET_MS = float(os.environ.get("POKECOACH_IMPORT_BUDGET_MS", "800"))
+LLM_STACK_MODULES = ("pydantic_ai", "openai", "httpx")
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def _deterministic_importtime() -> list[tuple[int, int, str]]:
+    env = {key: value for key, value in os.environ.items() if key != "OPENROUTER_API_KEY"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "run_report.py", "--deterministic-only", str(FIXTURE_PATH)],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: list[tuple[int, int, str]] = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            rows.append((int(match.group(2)), len(match.group(3)), match.group(4)))
+    return rows
+
+
+def test_deterministic_cli_skips_llm_stack_and_stays_within_import_budget() -> None:
+    rows = _deterministic_importtime()
+    assert rows
+
+    loaded_llm_modules = sorted({name for _, _, name in rows if name.split(".")[0] in LLM_STACK_MODULES})
+    assert loaded_llm_modules == []
+    # Top-level rows (one space of indent) carry the cumulative time of everything they imported.
+    total_ms = sum(cumulative_us for cumulative_us, indent, _ in rows if indent == 1) / 1000
+    assert total_ms < IMPORT_BUDGET_MS, f"deterministic CLI imports took {total_ms:.0f} ms"
@@ -0,0 +1,145 @@
+import re
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+import pokecoach.tools as tools_module
+from pokecoach.tools import IncrementalLogParser, parse_log
+
+FIXTURES_DIR = Path("tests/golden/fixtures")
+
+
+class _CountingPattern:
+    def __init__(self, pattern: re.Pattern[str]) -> None:
+        self.pattern = pattern
+        self.calls = 0
+
+    def match(self, text: str) -> re.Match[str] | None:
+        self.calls += 1
+        return self.pattern.match(text)
+
+
+def _ko_heavy_lines(kos: int) -> list[str]:
+    lines = ["A robó 7 cartas de la mano inicial.", "B robó 7 cartas de la mano inicial."]
+    for _ in range(kos):
+        lines.append("Turno de [playerName]")
+        lines.append("El (x_1) Atacante de A usó Ataque.")
+        lines.extend(f"- filler {n}" for n in range(3))
+        lines.append("¡El (x_2) Defensor de B quedó Fuera de Combate!")
+    return lines
+
+
+def _dump(parsed: tools_module.ParsedLog) -> dict:
+    return {
+        "lines": parsed.lines,
+        "turns": [turn.model_dump() for turn in parsed.turns],
+        "events": [event.model_dump() for event in parsed.events],
+        "bundles": [bundle.model_dump() for bundle in parsed.play_bundles],
+        "stats": parsed.stats.model_dump(),
+        "facts": parsed.match_facts.model_dump(),
+    }
+
+
+def test_incremental_snapshots_match_full_reparse_of_each_prefix() -> None:
+    for path in sorted(FIXTURES_DIR.glob("*.txt")):
+        lines = path.read_text(encoding="utf-8").splitlines()
+        parser = IncrementalLogParser()
+        step = max(1, len(lines) // 7)
+        for start in range(0, len(lines), step):
+            parser.feed(lines[start : start + step])
+            fed = lines[: start + step]
+            assert _dump(parser.snapshot()) == _dump(parse_log("\n".join(fed))), (path.name, len(fed))
+
+
+def test_incremental_snapshot_is_not_mutated_by_later_feeds() -> None:
+    lines = next(iter(sorted(FIXTURES_DIR.glob("*.txt")))).read_text(encoding="utf-8").splitlines()
+    parser = IncrementalLogParser()
+    parser.feed(lines[: len(lines) // 2])
+    first = parser.snapshot()
+    first_dump = _dump(first)
+
+    assert parser.snapshot() is first
+    parser.feed(f"{line}\n" for line in lines[len(lines) // 2 :])
+
+    assert _dump(first) == first_dump
+    assert parser.line_count == len(lines)
+    assert parser.snapshot().match_facts == parse_log("\n".join(lines)).match_facts
+
+
+def test_incremental_feed_only_scans_appended_lines(monkeypatch) -> None:
+    counting = _CountingPattern(tools_module.TURN_HEADER_RE)
+    monkeypatch.setattr(tools_module, "TURN_HEADER_RE", counting)
+    lines = next(iter(sorted(FIXTURES_DIR.glob("*.txt")))).read_text(encoding="utf-8").splitlines()
+
+    parser = IncrementalLogParser()
+    for line in lines:
+        parser.feed([line])
+        parser.snapshot()
+
+    assert counting.calls == len(lines)
+
+
+def test_incremental_snapshot_matches_reparse_when_causal_actor_is_named_before_being_seen() -> None:
+    # "C" only becomes a known player after its causal lines, so earlier KOs must be re-attributed.
+    lines = [
+        "A robó 7 cartas de la mano inicial.",
+        "El (x_1) Atacante de C usó Ataque.",
+        "¡El (x_2) Defensor de A quedó Fuera de Combate!",
+        "C tomó una carta de Premio.",
+        "El (x_1) Atacante de C usó Ataque.",
+        "¡El (x_2) Defensor de A quedó Fuera de Combate!",
+    ]
+    parser = IncrementalLogParser()
+    snapshots = []
+    for count, line in enumerate(lines, start=1):
+        parser.feed([line])
+        snapshots.append((parser.snapshot(), parse_log("\n".join(lines[:count]))))
+
+    for snapshot, reparsed in snapshots:
+        assert _dump(snapshot) == _dump(reparsed)
+        assert list(snapshot.causal_actors) == list(reparsed.causal_actors)
+    assert snapshots[-1][0].match_facts.kos_by_player == {"C": 2}
+
+
+def test_incremental_snapshot_work_does_not_grow_with_the_log(monkeypatch) -> None:
+    lines = _ko_heavy_lines(2000)
+    parser = IncrementalLogParser()
+    parser.feed(lines[:-2])
+    expected = parse_log("\n".join(lines))
+
+    def _no_rescan(*_args, **_kwargs):
+        raise AssertionError("snapshot re-scanned earlier KO mentions")
+
+    monkeypatch.setattr(tools_module, "_attribute_kos", _no_rescan)
+    monkeypatch.setattr(tools_module, "_resolve_causal_actors", _no_rescan)
+
+    peaks = []
+    for line in lines[-2:]:
+        parser.feed([line])
+        tracemalloc.start()
+        snapshot = parser.snapshot()
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    assert _dump(snapshot) == _dump(expected)
+    # Copying any of the accumulated lists (12k lines, 2k turns) would allocate far more than this.
+    assert max(peaks) < 16_384
+
+
+def test_snapshot_views_are_read_only_sequences() -> None:
+    lines = _ko_heavy_lines(3)
+    parser = IncrementalLogParser()
+    parser.feed(lines)
+    snapshot = parser.snapshot()
+    reparsed_lines = "\n".join(lines).splitlines()
+
+    assert snapshot.lines == reparsed_lines
+    assert snapshot.lines[-1] == reparsed_lines[-1]
+    assert snapshot.lines[2:5] == reparsed_lines[2:5]
+    assert len(snapshot.turns) == 3
+    assert snapshot.turns[-1].end_line == len(lines)
+    with pytest.raises(IndexError):
+        snapshot.lines[len(lines)]
+    with pytest.raises(AttributeError):
+        snapshot.lines.append("extra")  # type: ignore[attr-defined]
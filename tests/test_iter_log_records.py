@@ -0,0 +1,63 @@
+import io
+import tracemalloc
+from collections.abc import Iterator
+from pathlib import Path
+
+from pokecoach.schemas import KeyEvent, PlayBundle, TurnSpan
+from pokecoach.tools import iter_log_records, parse_log
+
+FIXTURES_DIR = Path("tests/golden/fixtures")
+
+
+def _synthetic_lines(turns: int) -> Iterator[str]:
+    yield "A robó 7 cartas de la mano inicial.\n"
+    yield "B robó 7 cartas de la mano inicial.\n"
+    for turn in range(turns):
+        player, opponent = ("A", "B") if turn % 2 == 0 else ("B", "A")
+        yield "Turno de [playerName]\n"
+        yield f"{player} robó una carta.\n"
+        for _ in range(20):
+            yield f"   - {player} barajó su mazo.\n"
+        yield f"El (x_1) Atacante de {player} infligió 120 puntos de daño usando Golpe contra el (x_2) Defensor.\n"
+        yield f"¡El (x_2) Defensor de {opponent} quedó Fuera de Combate!\n"
+        yield f"{player} tomó una carta de Premio.\n"
+
+
+def _peak_stream_memory(turns: int) -> int:
+    tracemalloc.start()
+    try:
+        for _record in iter_log_records(_synthetic_lines(turns)):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_iter_log_records_matches_parsed_log_for_fixtures() -> None:
+    for path in sorted(FIXTURES_DIR.glob("*.txt")):
+        log_text = path.read_text(encoding="utf-8")
+        parsed = parse_log(log_text)
+
+        with path.open(encoding="utf-8") as handle:
+            records = list(iter_log_records(handle))
+
+        assert [record for record in records if isinstance(record, KeyEvent)] == parsed.events
+        assert [record for record in records if isinstance(record, TurnSpan)] == parsed.turns
+        assert [record for record in records if isinstance(record, PlayBundle)] == parsed.play_bundles
+
+
+def test_iter_log_records_yields_events_before_turn_closes() -> None:
+    stream = iter_log_records(io.StringIO("Turno de [playerName]\nA infligió 10 puntos de daño usando X.\n"))
+
+    first = next(stream)
+
+    assert isinstance(first, KeyEvent)
+    assert first.event_type == "ATTACK"
+    assert isinstance(next(stream), TurnSpan)
+
+
+def test_iter_log_records_peak_memory_does_not_grow_with_log_length() -> None:
+    small_peak = _peak_stream_memory(turns=50)
+    large_peak = _peak_stream_memory(turns=2_000)
+
+    assert large_peak < small_peak * 2
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pytest
+
+from pokecoach.llm_breaker import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitOpenError,
+    track_llm_breaker_stats,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _open_breaker(clock: FakeClock) -> CircuitBreaker:
+    breaker = CircuitBreaker("model/a", failure_threshold=2, cooldown_seconds=30, clock=clock)
+    for _ in range(2):
+        breaker.record_failure(breaker.acquire())
+    return breaker
+
+
+def test_breaker_opens_after_consecutive_failures_only() -> None:
+    breaker = CircuitBreaker("model/a", failure_threshold=3, cooldown_seconds=30, clock=FakeClock())
+
+    for outcome in ("failure", "failure", "success", "failure", "failure"):
+        getattr(breaker, f"record_{outcome}")(breaker.acquire())
+    assert breaker.state == BREAKER_CLOSED
+
+    assert breaker.record_failure(breaker.acquire()) == BREAKER_OPEN
+    assert breaker.snapshot() == {"state": BREAKER_OPEN, "consecutive_failures": 3, "retry_in_s": 30.0}
+
+
+def test_open_breaker_short_circuits_until_cooldown_passes() -> None:
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+
+    with track_llm_breaker_stats() as stats:
+        with pytest.raises(CircuitOpenError, match="retry in 30.0s"):
+            breaker.acquire()
+        clock.now += 29
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+    assert stats.short_circuited == {"model/a": 2}
+    clock.now += 1
+    assert breaker.state == BREAKER_HALF_OPEN
+
+
+def test_half_open_admits_one_probe_and_closes_on_success() -> None:
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+    clock.now += 30
+
+    probe = breaker.acquire()
+    assert (probe.state, probe.probe) == (BREAKER_HALF_OPEN, True)
+    with pytest.raises(CircuitOpenError, match="probe already in flight"):
+        breaker.acquire()
+    assert breaker.record_success(probe) == BREAKER_CLOSED
+    assert breaker.snapshot() == {"state": BREAKER_CLOSED, "consecutive_failures": 0}
+
+
+def test_failed_probe_reopens_for_a_fresh_cooldown() -> None:
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+    clock.now += 30
+
+    assert breaker.record_failure(breaker.acquire()) == BREAKER_OPEN
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+
+def test_released_probe_frees_the_slot_without_changing_state() -> None:
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+    clock.now += 30
+
+    breaker.release(breaker.acquire())
+
+    assert breaker.state == BREAKER_HALF_OPEN
+    assert breaker.acquire().probe is True
+
+
+def test_request_admitted_while_closed_does_not_settle_half_open_probe() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("model/a", failure_threshold=1, cooldown_seconds=30, clock=clock)
+    slow = breaker.acquire()
+    breaker.record_failure(breaker.acquire())
+    clock.now += 30
+    probe = breaker.acquire()
+
+    assert breaker.record_success(slow) == BREAKER_HALF_OPEN
+    breaker.release(slow)
+    with pytest.raises(CircuitOpenError, match="probe already in flight"):
+        breaker.acquire()
+    assert breaker.record_failure(probe) == BREAKER_OPEN
+
+
+def test_outcome_from_before_the_breaker_reopened_is_ignored() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("model/a", failure_threshold=1, cooldown_seconds=30, clock=clock)
+    slow = breaker.acquire()
+    breaker.record_failure(breaker.acquire())
+    clock.now += 10
+
+    assert breaker.record_failure(slow) == BREAKER_OPEN
+    assert breaker.snapshot()["retry_in_s"] == 20.0
+
+
+def test_registry_keeps_one_breaker_per_base_url_and_model() -> None:
+    registry = CircuitBreakerRegistry(clock=FakeClock())
+    first = registry.breaker("https://a.test", "model/a", failure_threshold=1)
+
+    assert registry.breaker("https://a.test", "model/a") is first
+    assert registry.breaker("https://b.test", "model/a") is not first
+
+    registry.breaker("https://a.test", "model/b")
+    first.record_failure(first.acquire())
+    assert registry.snapshot(["model/b"]) == {"model/b": {"state": BREAKER_CLOSED, "consecutive_failures": 0}}
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pokecoach.llm_cache import LLMResponseCache, track_llm_cache_stats
+from pokecoach.llm_provider import LLMReportGuidance
+from pokecoach.schemas import AuditResult
+
+
+def _guidance(tag: str) -> LLMReportGuidance:
+    return LLMReportGuidance(summary=[f"{tag}{i}" for i in range(5)], next_actions=["a", "b", "c"])
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_round_trips_validated_payload_and_raw_output(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path)
+    guidance = _guidance("s")
+
+    assert cache.get(model="m", prompt="p", output_type=LLMReportGuidance) is None
+    cache.put(model="m", prompt="p", output_type=LLMReportGuidance, value=guidance, raw_output="raw")
+
+    assert cache.get(model="m", prompt="p", output_type=LLMReportGuidance) == (guidance, "raw")
+    assert cache.get(model="other", prompt="p", output_type=LLMReportGuidance) is None
+    assert cache.get(model="m", prompt="p2", output_type=LLMReportGuidance) is None
+    assert cache.get(model="m", prompt="p", output_type=AuditResult) is None
+    assert cache.get(model="m", prompt="p", output_type=LLMReportGuidance, account="other-endpoint") is None
+
+
+def test_cache_expires_entries_after_ttl(tmp_path) -> None:
+    clock = _Clock()
+    cache = LLMResponseCache(tmp_path, ttl_seconds=60, clock=clock)
+    cache.put(model="m", prompt="p", output_type=LLMReportGuidance, value=_guidance("s"), raw_output=None)
+
+    clock.now += 59
+    assert cache.get(model="m", prompt="p", output_type=LLMReportGuidance) is not None
+    clock.now += 2
+    assert cache.get(model="m", prompt="p", output_type=LLMReportGuidance) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_writes_sweep_entries_unused_for_longer_than_ttl(tmp_path) -> None:
+    clock = _Clock()
+    cache = LLMResponseCache(tmp_path, ttl_seconds=60, clock=clock)
+    cache.put(model="m", prompt="old", output_type=LLMReportGuidance, value=_guidance("s"), raw_output=None)
+
+    clock.now += 61
+    cache.put(model="m", prompt="new", output_type=LLMReportGuidance, value=_guidance("s"), raw_output=None)
+
+    assert len(list(tmp_path.iterdir())) == 1
+    assert cache.get(model="m", prompt="new", output_type=LLMReportGuidance) is not None
+
+
+def test_cache_evicts_least_recently_used_entries_over_size_budget(tmp_path) -> None:
+    clock = _Clock()
+    probe = LLMResponseCache(tmp_path / "probe")
+    probe.put(model="m", prompt="p0", output_type=LLMReportGuidance, value=_guidance("p"), raw_output=None)
+    entry_size = next((tmp_path / "probe").iterdir()).stat().st_size
+
+    cache = LLMResponseCache(tmp_path / "cache", max_bytes=entry_size * 2 + entry_size // 2, clock=clock)
+    for prompt in ("p0", "p1"):
+        cache.put(model="m", prompt=prompt, output_type=LLMReportGuidance, value=_guidance("p"), raw_output=None)
+        clock.now += 10
+    assert cache.get(model="m", prompt="p0", output_type=LLMReportGuidance) is not None
+    clock.now += 10
+    cache.put(model="m", prompt="p2", output_type=LLMReportGuidance, value=_guidance("p"), raw_output=None)
+
+    assert cache.get(model="m", prompt="p0", output_type=LLMReportGuidance) is not None
+    assert cache.get(model="m", prompt="p1", output_type=LLMReportGuidance) is None
+    assert cache.get(model="m", prompt="p2", output_type=LLMReportGuidance) is not None
+
+
+def test_track_llm_cache_stats_counts_hits_and_misses(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path)
+    with track_llm_cache_stats() as stats:
+        cache.get(model="m", prompt="p", output_type=LLMReportGuidance)
+        cache.put(model="m", prompt="p", output_type=LLMReportGuidance, value=_guidance("s"), raw_output=None)
+        cache.get(model="m", prompt="p", output_type=LLMReportGuidance)
+        cache.get(model="m", prompt="p", output_type=LLMReportGuidance)
+
+    assert (stats.hits, stats.misses) == (2, 1)
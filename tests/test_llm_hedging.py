@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from pokecoach.llm_hedging import (
+    ModelLatencyTracker,
+    run_hedged,
+    track_llm_hedge_stats,
+)
+
+
+def _attempts(behaviour: dict[str, tuple[float, bool]], log: dict[str, str]):
+    async def attempt(model: str) -> str:
+        delay, ok = behaviour[model]
+        log[model] = "started"
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log[model] = "cancelled"
+            raise
+        log[model] = "finished"
+        if not ok:
+            raise ValueError(f"{model} returned invalid output")
+        return model
+
+    return attempt
+
+
+def test_slow_primary_is_hedged_and_cancelled() -> None:
+    log: dict[str, str] = {}
+    attempt = _attempts({"primary": (5.0, True), "backup": (0.01, True)}, log)
+
+    with track_llm_hedge_stats() as stats:
+        started = time.perf_counter()
+        winner = asyncio.run(run_hedged(["primary", "backup"], attempt, delay=0.02))
+
+    assert winner == "backup"
+    assert time.perf_counter() - started < 1
+    assert log == {"primary": "cancelled", "backup": "finished"}
+    assert stats.hedged_requests == 1
+    assert stats.wins == {"backup": 1}
+
+
+def test_fast_primary_never_fires_backup() -> None:
+    log: dict[str, str] = {}
+    attempt = _attempts({"primary": (0.0, True), "backup": (0.0, True)}, log)
+
+    with track_llm_hedge_stats() as stats:
+        winner = asyncio.run(run_hedged(["primary", "backup"], attempt, delay=1.0))
+
+    assert winner == "primary"
+    assert log == {"primary": "finished"}
+    assert stats.hedged_requests == 0
+    assert stats.wins == {}
+
+
+def test_invalid_primary_hands_over_without_waiting_for_delay() -> None:
+    log: dict[str, str] = {}
+    attempt = _attempts({"primary": (0.0, False), "backup": (0.0, True)}, log)
+
+    started = time.perf_counter()
+    winner = asyncio.run(run_hedged(["primary", "backup"], attempt, delay=5.0))
+
+    assert winner == "backup"
+    assert time.perf_counter() - started < 1
+
+
+def test_all_models_failing_raises_last_error() -> None:
+    attempt = _attempts({"primary": (0.0, False), "backup": (0.0, False)}, {})
+
+    with pytest.raises(ValueError, match="backup"):
+        asyncio.run(run_hedged(["primary", "backup"], attempt, delay=0.01))
+
+
+def test_latency_percentile_needs_min_samples() -> None:
+    tracker = ModelLatencyTracker()
+    for seconds in range(1, 11):
+        tracker.record("m", float(seconds))
+
+    assert tracker.percentile("m", 0.9, min_samples=20) is None
+    assert tracker.percentile("m", 0.9, min_samples=10) == 9.0
+    assert tracker.percentile("m", 0.5, min_samples=10) == 5.0
@@ -1,13 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from pokecoach import llm_provider as llm_provider_module
+from pokecoach.deadline import Deadline, DeadlineExceeded
+from pokecoach.llm_breaker import track_llm_breaker_stats
+from pokecoach.llm_hedging import track_llm_hedge_stats
 from pokecoach.llm_provider import (
+    DEFAULT_LLM_MAX_CONCURRENCY,
     DEFAULT_OPENROUTER_BASE_URL,
     DEFAULT_PYDANTICAI_MODEL,
     LLMReportGuidance,
     PydanticAIRuntimeConfig,
+    amaybe_generate_guidance,
+    amaybe_generate_guidance_with_raw,
     load_runtime_config,
     maybe_generate_guidance,
+    maybe_generate_guidance_with_raw,
+    reload_runtime_config,
 )
+from pokecoach.llm_singleflight import track_llm_coalesce_stats
 
 
 def test_load_runtime_config_defaults() -> None:
@@ -15,6 +35,7 @@ def test_load_runtime_config_defaults() -> None:
     assert config.openrouter_api_key is None
     assert config.openrouter_base_url == DEFAULT_OPENROUTER_BASE_URL
     assert config.model == DEFAULT_PYDANTICAI_MODEL
+    assert config.max_concurrency == DEFAULT_LLM_MAX_CONCURRENCY
     assert config.live_mode_enabled is False
 
 
@@ -54,3 +75,586 @@ def test_llm_report_guidance_schema_bounds() -> None:
     )
     assert len(guidance.summary) == 5
     assert len(guidance.next_actions) == 3
+
+
+def test_load_runtime_config_reads_max_concurrency_and_ignores_invalid_values() -> None:
+    assert load_runtime_config({"POKECOACH_LLM_MAX_CONCURRENCY": "4"}).max_concurrency == 4
+    assert load_runtime_config({"POKECOACH_LLM_MAX_CONCURRENCY": "0"}).max_concurrency == DEFAULT_LLM_MAX_CONCURRENCY
+    assert load_runtime_config({"POKECOACH_LLM_MAX_CONCURRENCY": "x"}).max_concurrency == DEFAULT_LLM_MAX_CONCURRENCY
+
+
+def test_async_guidance_returns_none_when_live_mode_disabled() -> None:
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key=None,
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model=DEFAULT_PYDANTICAI_MODEL,
+    )
+    result = asyncio.run(
+        amaybe_generate_guidance(
+            log_text="Turn 1",
+            fallback_summary=["a", "b", "c", "d", "e"],
+            fallback_next_actions=["x", "y", "z"],
+            config=config,
+        )
+    )
+    assert result is None
+
+
+def test_async_requests_share_bounded_semaphore(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    in_flight = {"current": 0, "peak": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model=DEFAULT_PYDANTICAI_MODEL,
+        max_concurrency=3,
+    )
+
+    async def run_batch() -> list[tuple[LLMReportGuidance | None, str | None]]:
+        return await asyncio.gather(
+            *(
+                amaybe_generate_guidance_with_raw(
+                    log_text=f"Turn {index}",
+                    fallback_summary=["a", "b", "c", "d", "e"],
+                    fallback_next_actions=["x", "y", "z"],
+                    config=config,
+                )
+                for index in range(12)
+            )
+        )
+
+    results = asyncio.run(run_batch())
+
+    assert in_flight["peak"] == 3
+    assert all(guidance is not None and raw == payload for guidance, raw in results)
+
+
+def test_runtime_config_is_cached_until_reloaded(monkeypatch) -> None:
+    monkeypatch.setenv("POKECOACH_PYDANTICAI_MODEL", "first/model")
+    assert reload_runtime_config().model == "first/model"
+
+    monkeypatch.setenv("POKECOACH_PYDANTICAI_MODEL", "second/model")
+    assert load_runtime_config().model == "first/model"
+    assert reload_runtime_config().model == "second/model"
+    assert load_runtime_config().model == "second/model"
+
+    monkeypatch.delenv("POKECOACH_PYDANTICAI_MODEL")
+    reload_runtime_config()
+
+
+def test_sync_calls_reuse_agents_per_client_key() -> None:
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model=DEFAULT_PYDANTICAI_MODEL,
+    )
+    other_key = PydanticAIRuntimeConfig(
+        openrouter_api_key="other",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model=DEFAULT_PYDANTICAI_MODEL,
+    )
+
+    agent = llm_provider_module._cached_agent(config, config.model, str)
+
+    assert llm_provider_module._cached_agent(config, config.model, str) is agent
+    assert llm_provider_module._cached_agent(config, config.model, LLMReportGuidance) is not agent
+    assert llm_provider_module._cached_agent(other_key, other_key.model, str) is not agent
+
+
+def test_async_calls_reuse_agents_within_one_event_loop(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    constructed: list[object] = []
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            constructed.append(output_type)
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="pooled/model",
+    )
+
+    async def run_sequence() -> None:
+        for index in range(4):
+            guidance, _raw = await amaybe_generate_guidance_with_raw(
+                log_text=f"Turn {index}",
+                fallback_summary=["a", "b", "c", "d", "e"],
+                fallback_next_actions=["x", "y", "z"],
+                config=config,
+            )
+            assert guidance is not None
+
+    asyncio.run(run_sequence())
+
+    assert constructed == [str]
+
+
+def test_async_guidance_is_served_from_disk_cache_on_repeat(monkeypatch, tmp_path) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="cached/model",
+        cache_dir=str(tmp_path),
+    )
+
+    def run_once() -> tuple[LLMReportGuidance | None, str | None]:
+        return asyncio.run(
+            amaybe_generate_guidance_with_raw(
+                log_text="Turn 1",
+                fallback_summary=["a", "b", "c", "d", "e"],
+                fallback_next_actions=["x", "y", "z"],
+                config=config,
+            )
+        )
+
+    first = run_once()
+    second = run_once()
+
+    assert calls["n"] == 1
+    assert first == second
+    assert second[1] == payload
+
+
+def test_disk_cache_is_not_shared_across_endpoints_or_api_keys(monkeypatch, tmp_path) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    base = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="cached/per-account-model",
+        cache_dir=str(tmp_path),
+    )
+
+    def run_once(config: PydanticAIRuntimeConfig) -> None:
+        asyncio.run(
+            amaybe_generate_guidance_with_raw(
+                log_text="Turn 1",
+                fallback_summary=["a", "b", "c", "d", "e"],
+                fallback_next_actions=["x", "y", "z"],
+                config=config,
+            )
+        )
+
+    run_once(base)
+    run_once(replace(base, openrouter_base_url="https://llm.internal.example/v1"))
+    run_once(replace(base, openrouter_api_key="other-key"))
+    run_once(base)
+
+    assert calls["n"] == 3
+
+
+def test_load_runtime_config_cache_bypass_flag_disables_cache() -> None:
+    assert load_runtime_config({}).cache_dir is not None
+    assert load_runtime_config({"POKECOACH_LLM_CACHE_DIR": "/tmp/x"}).cache_dir == "/tmp/x"
+    assert load_runtime_config({"POKECOACH_LLM_CACHE_BYPASS": "1"}).cache_dir is None
+
+
+def test_expired_deadline_skips_provider_call(monkeypatch) -> None:
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            raise AssertionError("provider must not be called after the deadline")
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="deadline/expired-model",
+    )
+
+    guidance = maybe_generate_guidance(
+        log_text="Turn 1",
+        fallback_summary=["a", "b", "c", "d", "e"],
+        fallback_next_actions=["x", "y", "z"],
+        config=config,
+        deadline=Deadline.after(0),
+    )
+
+    assert guidance is None
+    assert calls["n"] == 0
+
+
+def test_request_timeout_is_capped_by_agent_budget(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    timeouts: list[float] = []
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, _prompt: str, *, model_settings) -> SimpleNamespace:
+            timeouts.append(model_settings["timeout"])
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="deadline/capped-model",
+        request_timeout_seconds=5,
+    )
+
+    guidance, _raw = maybe_generate_guidance_with_raw(
+        log_text="Turn 1",
+        fallback_summary=["a", "b", "c", "d", "e"],
+        fallback_next_actions=["x", "y", "z"],
+        config=config,
+        deadline=Deadline.after(30),
+    )
+
+    assert guidance is not None
+    assert len(timeouts) == 1
+    assert 0 < timeouts[0] <= 5
+
+
+def test_async_call_is_cancelled_when_deadline_passes(monkeypatch) -> None:
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            await asyncio.sleep(5)
+            raise AssertionError("slow call should have been cancelled")
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="deadline/slow-model",
+        request_timeout_seconds=0.05,
+    )
+
+    started = time.perf_counter()
+    guidance, raw = asyncio.run(
+        amaybe_generate_guidance_with_raw(
+            log_text="Turn 1",
+            fallback_summary=["a", "b", "c", "d", "e"],
+            fallback_next_actions=["x", "y", "z"],
+            config=config,
+        )
+    )
+
+    assert (guidance, raw) == (None, None)
+    assert time.perf_counter() - started < 1
+
+
+def test_deadline_limit_keeps_the_sooner_expiry() -> None:
+    now = {"t": 100.0}
+    deadline = Deadline.after(10, clock=lambda: now["t"])
+
+    assert deadline.limit(3).remaining() == 3
+    assert deadline.limit(30).remaining() == 10
+    now["t"] = 111.0
+    assert deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        deadline.check("audit")
+
+
+def test_sync_guidance_hedges_to_backup_model_when_primary_is_slow(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+
+    class FakeAgent:
+        def __init__(self, model, output_type) -> None:
+            self.model_name = model.model_name
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            if self.model_name == "hedge/slow-primary":
+                await asyncio.sleep(5)
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="hedge/slow-primary",
+        hedge_models=("hedge/fast-backup",),
+        hedge_delay_seconds=0.02,
+    )
+
+    started = time.perf_counter()
+    with track_llm_hedge_stats() as stats:
+        guidance, raw = maybe_generate_guidance_with_raw(
+            log_text="Turn 1",
+            fallback_summary=["a", "b", "c", "d", "e"],
+            fallback_next_actions=["x", "y", "z"],
+            config=config,
+        )
+
+    assert guidance is not None
+    assert raw == payload
+    assert time.perf_counter() - started < 1
+    assert stats.hedged_requests == 1
+    assert stats.model_stats()["hedge/fast-backup"]["hedge_wins"] == 1
+    assert "hedge/slow-primary" not in stats.latencies_ms
+
+
+def test_hedge_models_are_read_from_env() -> None:
+    config = load_runtime_config(
+        {"POKECOACH_LLM_HEDGE_MODELS": " a/one, b/two ,", "POKECOACH_LLM_HEDGE_PERCENTILE": "0.9"}
+    )
+
+    assert config.hedge_models == ("a/one", "b/two")
+    assert config.hedge_percentile == 0.9
+
+
+def test_stream_validation_aborts_prose_answer_and_retries(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    prose = ["Sure! ", "Here is ", "your coaching ", "summary: ", payload]
+    answers = [prose, [payload[:20], payload[20:]]]
+    streamed: list[list[str]] = []
+
+    class FakeStream:
+        def __init__(self, chunks: list[str]) -> None:
+            self.chunks = chunks
+            self.sent: list[str] = []
+            streamed.append(self.sent)
+
+        async def stream_text(self, *, delta: bool, **_kwargs):
+            assert delta
+            for chunk in self.chunks:
+                self.sent.append(chunk)
+                yield chunk
+
+    class FakeAgent:
+        def __init__(self, model, output_type) -> None:
+            pass
+
+        @asynccontextmanager
+        async def run_stream(self, _prompt: str, **_kwargs):
+            yield FakeStream(answers[len(streamed)])
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    monkeypatch.setenv("POKECOACH_TOOL_CHOICE_AUTO_MODELS", "stream/prose-then-json")
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="stream/prose-then-json",
+        stream_validation=True,
+    )
+
+    guidance = maybe_generate_guidance(
+        log_text="Turn 1",
+        fallback_summary=["a", "b", "c", "d", "e"],
+        fallback_next_actions=["x", "y", "z"],
+        config=config,
+    )
+
+    assert guidance is not None
+    assert guidance.summary == ["s1", "s2", "s3", "s4", "s5"]
+    assert streamed[0] == ["Sure! "]
+    assert len(streamed) == 2
+
+
+def test_stream_validation_flag_is_read_from_env() -> None:
+    assert load_runtime_config({}).stream_validation is False
+    assert load_runtime_config({"POKECOACH_LLM_STREAM_VALIDATION": "1"}).stream_validation is True
+
+
+def test_identical_concurrent_requests_share_one_provider_call(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type, **_kwargs) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            await asyncio.sleep(0.1)
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="coalesce/shared-model",
+    )
+
+    async def run_report() -> tuple[tuple[LLMReportGuidance | None, str | None], int]:
+        with track_llm_coalesce_stats() as stats:
+            result = await amaybe_generate_guidance_with_raw(
+                log_text="Turn 1",
+                fallback_summary=["a", "b", "c", "d", "e"],
+                fallback_next_actions=["x", "y", "z"],
+                config=config,
+            )
+        return result, stats.coalesced
+
+    # Each report runs on its own thread and event loop, as in the report server's handler threads.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        outcomes = list(executor.map(lambda _: asyncio.run(run_report()), range(3)))
+
+    assert calls["n"] == 1
+    assert all(guidance is not None and raw == payload for (guidance, raw), _ in outcomes)
+    assert sorted(coalesced for _, coalesced in outcomes) == [0, 1, 1]
+
+
+def test_concurrent_requests_with_different_api_keys_are_not_coalesced(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type, **_kwargs) -> None:
+            self.output_type = output_type
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            await asyncio.sleep(0.1)
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+
+    async def run_report(api_key: str) -> int:
+        config = PydanticAIRuntimeConfig(
+            openrouter_api_key=api_key,
+            openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+            model="coalesce/per-account-model",
+        )
+        with track_llm_coalesce_stats() as stats:
+            await amaybe_generate_guidance_with_raw(
+                log_text="Turn 1",
+                fallback_summary=["a", "b", "c", "d", "e"],
+                fallback_next_actions=["x", "y", "z"],
+                config=config,
+            )
+        return stats.coalesced
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        coalesced = list(executor.map(lambda key: asyncio.run(run_report(key)), ["key-a", "key-b"]))
+
+    assert calls["n"] == 2
+    assert coalesced == [0, 0]
+
+
+def test_request_coalescing_bypass_flag_is_read_from_env() -> None:
+    assert load_runtime_config({}).coalesce_requests is True
+    assert load_runtime_config({"POKECOACH_LLM_COALESCE_BYPASS": "1"}).coalesce_requests is False
+
+
+def test_circuit_breaker_skips_provider_after_consecutive_failures(monkeypatch, capsys) -> None:
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type, **_kwargs) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            raise RuntimeError("503 provider unavailable")
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    monkeypatch.setenv("POKECOACH_LLM_DEBUG", "1")
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="breaker/unavailable-model",
+        breaker_failure_threshold=2,
+    )
+    kwargs = {"log_text": "Turn 1", "fallback_summary": ["a"] * 5, "fallback_next_actions": ["x"] * 3}
+
+    assert maybe_generate_guidance(config=config, **kwargs) is None
+    assert calls["n"] == 2
+    assert "state=closed->open" in capsys.readouterr().err
+
+    with track_llm_breaker_stats() as stats:
+        assert maybe_generate_guidance(config=config, **kwargs) is None
+
+    assert calls["n"] == 2
+    assert stats.short_circuited == {"breaker/unavailable-model": 1}
+    assert "short_circuit" in capsys.readouterr().err
+
+
+def test_open_breaker_hands_hedged_request_to_backup_at_once(monkeypatch) -> None:
+    payload = json.dumps({"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]})
+    called: list[str] = []
+
+    class FakeAgent:
+        def __init__(self, model, output_type, **_kwargs) -> None:
+            self.model_name = model.model_name
+
+        async def run(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            called.append(self.model_name)
+            if self.model_name == "breaker/down-primary":
+                raise RuntimeError("502 bad gateway")
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url=DEFAULT_OPENROUTER_BASE_URL,
+        model="breaker/down-primary",
+        hedge_models=("breaker/healthy-backup",),
+        hedge_delay_seconds=10,
+        breaker_failure_threshold=1,
+    )
+    kwargs = {"log_text": "Turn 1", "fallback_summary": ["a"] * 5, "fallback_next_actions": ["x"] * 3}
+
+    first, _ = asyncio.run(amaybe_generate_guidance_with_raw(config=config, **kwargs))
+    started = time.perf_counter()
+    second, _ = asyncio.run(amaybe_generate_guidance_with_raw(config=config, **{**kwargs, "log_text": "Turn 2"}))
+
+    assert first is not None and second is not None
+    assert time.perf_counter() - started < 1
+    assert called == ["breaker/down-primary", "breaker/healthy-backup", "breaker/healthy-backup"]
+
+
+def test_circuit_breaker_settings_are_read_from_env() -> None:
+    config = load_runtime_config(
+        {
+            "POKECOACH_LLM_BREAKER_FAILURES": "3",
+            "POKECOACH_LLM_BREAKER_COOLDOWN_SECONDS": "12.5",
+            "POKECOACH_LLM_BREAKER_PROBES": "2",
+        }
+    )
+    assert (config.breaker_failure_threshold, config.breaker_cooldown_seconds, config.breaker_half_open_probes) == (
+        3,
+        12.5,
+        2,
+    )
+    assert config.circuit_breaker is True
+    assert load_runtime_config({"POKECOACH_LLM_BREAKER_BYPASS": "1"}).circuit_breaker is False
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pokecoach.llm_singleflight import SingleFlight, track_llm_coalesce_stats
+
+
+def test_concurrent_async_callers_share_one_call() -> None:
+    flight = SingleFlight()
+    calls = {"n": 0}
+
+    async def call() -> str:
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run() -> list[str]:
+        return await asyncio.gather(
+            flight.arun("same", call),
+            flight.arun("same", call),
+            flight.arun("same", call),
+            flight.arun("other", call),
+        )
+
+    with track_llm_coalesce_stats() as stats:
+        results = asyncio.run(run())
+
+    assert results == ["answer"] * 4
+    assert calls["n"] == 2
+    assert stats.coalesced == 2
+    assert flight.in_flight() == 0
+
+
+def test_threads_share_one_call_and_key_is_released_afterwards() -> None:
+    flight = SingleFlight()
+    arrived = threading.Barrier(4)
+    calls = {"n": 0}
+
+    def call() -> int:
+        calls["n"] += 1
+        time.sleep(0.1)
+        return calls["n"]
+
+    def caller() -> int:
+        arrived.wait(5)
+        return flight.run("key", call, timeout=5)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: caller(), range(4)))
+
+    assert calls["n"] == 1
+    assert results == [1, 1, 1, 1]
+    assert flight.run("key", call) == 2
+
+
+def test_waiters_receive_the_leaders_error() -> None:
+    flight = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.01)
+        raise ValueError("invalid output")
+
+    async def run() -> list[BaseException | str]:
+        return await asyncio.gather(flight.arun("key", call), flight.arun("key", call), return_exceptions=True)
+
+    results = asyncio.run(run())
+
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert flight.in_flight() == 0
+
+
+def test_cancelled_leader_hands_the_call_to_a_waiter() -> None:
+    flight = SingleFlight()
+    calls = {"n": 0}
+
+    async def call() -> str:
+        calls["n"] += 1
+        await asyncio.sleep(0.05 if calls["n"] == 1 else 0.01)
+        return f"answer {calls['n']}"
+
+    async def run() -> str:
+        leader = asyncio.create_task(flight.arun("key", call))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.arun("key", call, timeout=5))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    with track_llm_coalesce_stats() as stats:
+        assert asyncio.run(run()) == "answer 2"
+    assert stats.coalesced == 0
+    assert flight.in_flight() == 0
+
+
+def test_waiter_outlives_a_leader_that_ran_out_of_its_own_budget() -> None:
+    flight = SingleFlight()
+
+    def call_with_budget(budget: float):
+        def call() -> str:
+            if budget < 0.05:
+                time.sleep(budget)
+                raise TimeoutError("leader deadline exceeded")
+            time.sleep(0.05)
+            return "answer"
+
+        return call
+
+    def waiter() -> str:
+        time.sleep(0.01)
+        return flight.run("key", call_with_budget(5.0), timeout=5.0)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.run, "key", call_with_budget(0.03), timeout=0.03)
+        follower = executor.submit(waiter)
+
+        with pytest.raises(TimeoutError):
+            leader.result()
+        assert follower.result() == "answer"
+    assert flight.in_flight() == 0
+
+
+def test_async_waiter_outlives_a_leader_that_ran_out_of_its_own_budget() -> None:
+    flight = SingleFlight()
+
+    async def short_call() -> str:
+        await asyncio.sleep(0.03)
+        raise TimeoutError("leader deadline exceeded")
+
+    async def long_call() -> str:
+        await asyncio.sleep(0.01)
+        return "answer"
+
+    async def run() -> list[BaseException | str]:
+        leader = asyncio.create_task(flight.arun("key", short_call, timeout=0.03))
+        await asyncio.sleep(0)
+        return await asyncio.gather(leader, flight.arun("key", long_call, timeout=5), return_exceptions=True)
+
+    leader_result, waiter_result = asyncio.run(run())
+
+    assert isinstance(leader_result, TimeoutError)
+    assert waiter_result == "answer"
+
+
+def test_waiter_timeout_does_not_cancel_the_shared_call() -> None:
+    flight = SingleFlight()
+
+    async def call() -> str:
+        await asyncio.sleep(0.05)
+        return "answer"
+
+    async def run() -> str:
+        leader = asyncio.create_task(flight.arun("key", call))
+        await asyncio.sleep(0)
+        with pytest.raises(TimeoutError):
+            await flight.arun("key", call, timeout=0.01)
+        return await leader
+
+    assert asyncio.run(run()) == "answer"
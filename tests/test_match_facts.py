@@ -1,5 +1,9 @@
+import re
+from collections.abc import Sequence
+from dataclasses import replace
 from pathlib import Path
 
+from pokecoach import tools as tools_module
 from pokecoach.tools import extract_match_facts, index_turns
 
 
@@ -71,3 +75,63 @@ def test_match_facts_ko_lookback_window_is_configurable() -> None:
 
     assert default_facts.kos_by_player == {"A": 1}
     assert short_window_facts.kos_by_player == {"unknown": 1}
+
+
+class _CountingPattern:
+    def __init__(self, pattern: re.Pattern[str]) -> None:
+        self.pattern = pattern
+        self.calls = 0
+
+    def match(self, text: str) -> re.Match[str] | None:
+        self.calls += 1
+        return self.pattern.match(text)
+
+    def search(self, text: str) -> re.Match[str] | None:
+        self.calls += 1
+        return self.pattern.search(text)
+
+
+def _ko_heavy_log_without_turn_headers(kos: int) -> str:
+    lines = ["A robó 7 cartas de la mano inicial.", "B robó 7 cartas de la mano inicial."]
+    for ko in range(kos):
+        lines.append("El (x_1) Atacante de A usó Ataque.")
+        lines.extend(f"- filler {n}" for n in range(10))
+        lines.append("¡El (x_2) Defensor de B quedó Fuera de Combate!")
+        # Every other KO is followed by a gap far longer than the lookback window.
+        lines.extend(f"- gap {n}" for n in range(40 * (ko % 2)))
+    return "\n".join(lines) + "\n"
+
+
+class _CountingSequence(Sequence):
+    def __init__(self, items: Sequence) -> None:
+        self.items = items
+        self.reads = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index):
+        self.reads += 1
+        return self.items[index]
+
+
+def test_match_facts_ko_attribution_scales_linearly(monkeypatch) -> None:
+    causal_pattern_names = ("KO_CAUSAL_DAMAGE_RE", "KO_CAUSAL_USED_RE", "KO_CAUSAL_GUST_RE")
+    causal_pattern_names += ("KO_CAUSAL_ACTOR_BEFORE_VERB_RE",)
+    for kos in (200, 800):
+        patterns = {name: _CountingPattern(getattr(tools_module, name)) for name in causal_pattern_names}
+        for name, pattern in patterns.items():
+            monkeypatch.setattr(tools_module, name, pattern)
+
+        log_text = _ko_heavy_log_without_turn_headers(kos)
+        line_count = len(log_text.splitlines())
+        parsed = tools_module.parse_log(log_text)
+        causal_actors = _CountingSequence(parsed.causal_actors)
+        widest = extract_match_facts(replace(parsed, causal_actors=causal_actors), ko_lookback_window=15)
+
+        assert parsed.match_facts.kos_by_player == widest.kos_by_player == {"A": kos}
+        # Each line is tested by the causal patterns at most once, however many KOs look back over it.
+        assert sum(pattern.calls for pattern in patterns.values()) <= 4 * line_count
+        # The non-default window merges KO mentions with causal lines instead of rescanning per KO.
+        assert len(causal_actors) == kos
+        assert causal_actors.reads <= 3 * len(causal_actors)
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from pokecoach import report as report_module
+from pokecoach import tools as tools_module
+from pokecoach.tools import (
+    compute_basic_stats,
+    extract_match_facts,
+    extract_play_bundles,
+    find_key_events,
+    index_turns,
+    parse_log,
+)
+
+FIXTURES_DIR = Path("tests/golden/fixtures")
+
+
+def test_tools_accept_parsed_log_and_match_string_input() -> None:
+    for path in sorted(FIXTURES_DIR.glob("*.txt")):
+        log_text = path.read_text(encoding="utf-8")
+        parsed = parse_log(log_text)
+
+        assert parsed.lines == log_text.splitlines()
+        assert index_turns(parsed) == index_turns(log_text)
+        assert find_key_events(parsed) == find_key_events(log_text)
+        assert compute_basic_stats(parsed) == compute_basic_stats(log_text)
+        assert extract_match_facts(parsed) == extract_match_facts(log_text)
+        assert extract_match_facts(parsed, ko_lookback_window=8) == extract_match_facts(log_text, ko_lookback_window=8)
+        assert extract_play_bundles(parsed) == extract_play_bundles(log_text)
+
+
+def test_parse_log_collects_players_and_facts_in_one_pass() -> None:
+    log_text = (
+        "A robó 7 cartas de la mano inicial.\n"
+        "B robó 7 cartas de la mano inicial.\n"
+        "A decidió empezar en segundo lugar.\n"
+        "B declaró un mulligan.\n"
+        "Turno de [playerName]\n"
+        "El (x_1) Atacante de B usó Ataque.\n"
+        "¡El (x_2) Defensor de A quedó Fuera de Combate!\n"
+        "B tomó una carta de Premio.\n"
+        "El rival se rindió. B ganó.\n"
+    )
+
+    parsed = parse_log(log_text)
+
+    assert parsed.players == ["A", "B"]
+    assert parsed.stats.went_first_player == "B"
+    assert parsed.stats.mulligans_by_player == {"B": 1}
+    assert [turn.actor for turn in parsed.turns] == ["B"]
+    assert parsed.match_facts.kos_by_player == {"B": 1}
+    assert parsed.match_facts.winner == "B"
+    assert len(parsed.play_bundles) == 1
+
+
+def test_generate_post_game_report_parses_log_once(monkeypatch) -> None:
+    log_text = (FIXTURES_DIR / "compound_single_line_events.txt").read_text(encoding="utf-8")
+    calls = {"n": 0}
+
+    def counting_parse_log(text: str) -> tools_module.ParsedLog:
+        calls["n"] += 1
+        return parse_log(text)
+
+    monkeypatch.setattr(report_module, "parse_log", counting_parse_log)
+    monkeypatch.setattr(tools_module, "parse_log", counting_parse_log)
+    monkeypatch.setattr(report_module, "maybe_generate_guidance", lambda **_kwargs: None)
+
+    report_module.generate_post_game_report(log_text)
+
+    assert calls["n"] == 1
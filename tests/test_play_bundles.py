@@ -1,6 +1,7 @@
 from collections import Counter
 from pathlib import Path
 
+import pokecoach.tools as tools_module
 from pokecoach.tools import extract_play_bundles
 
 
@@ -65,3 +66,31 @@ def test_extract_play_bundles_log7_includes_colagrito_ko_latias_with_two_prizes(
     assert "El (sv4_86) Colagrito de SpicyTaco30 usó Grito Rugiente." in target_bundle.window.raw_lines
     assert "¡El (sv8_220) Latias ex de Kami-Yan quedó Fuera de Combate!" in target_bundle.window.raw_lines
     assert "SpicyTaco30 tomó 2 cartas de Premio." in target_bundle.window.raw_lines
+
+
+def test_extract_play_bundles_builds_models_only_for_selected_lines(monkeypatch) -> None:
+    built: list[int] = []
+    original_builder = tools_module._build_play_bundle_event
+
+    def counting_builder(line_number: int, text: str):
+        built.append(line_number)
+        return original_builder(line_number, text)
+
+    monkeypatch.setattr(tools_module, "_build_play_bundle_event", counting_builder)
+    log_text = "\n".join(
+        [
+            "Turno de [playerName]",
+            "Ana jugó Órdenes de Jefes.",
+            "El Kirlia de Ana usó Refinamiento.",
+            "El Fezandipiti ex de Ana usó Voltear el Guion.",
+            "El Colagrito de Ana infligió 120 puntos de daño usando Grito Rugiente al Latias ex de Beto.",
+            "¡El Latias ex de Beto quedó Fuera de Combate!",
+            "Ana tomó 2 cartas de Premio.",
+        ]
+    )
+
+    [bundle] = extract_play_bundles(log_text)
+
+    assert bundle.gust_event is not None and bundle.gust_event.line == 2
+    assert bundle.action_event is not None and bundle.action_event.line == 5
+    assert sorted(built) == [2, 5, 6, 7]
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from pokecoach import report as report_module
+from pokecoach.llm_provider import PydanticAIRuntimeConfig, _runtime_config_from_values
+from pokecoach.prompt_context import build_prompt_context, estimate_tokens, select_prompt_log
+from pokecoach.report import generate_post_game_report
+
+FIXTURE = Path("tests/golden/fixtures/compound_single_line_events.txt")
+
+
+def _long_log(turns: int) -> str:
+    players = ("Kami-Yan", "SpicyTaco30")
+    lines: list[str] = []
+    for turn in range(turns):
+        player = players[turn % 2]
+        lines.append("Turno de [playerName]")
+        lines.append(f"{player} robó una carta.")
+        lines.extend(f"   - {player} barajó su mazo." for _ in range(6))
+        lines.append(f"{player} jugó Pueblo Altamía.")
+        lines.append(f"{player} jugó (me1_119) Determinación de Lillie.")
+        lines.append(f"{player} infligió 30 puntos de daño usando Golpe contra Latias ex.")
+    lines.append(f"{players[0]} infligió 210 puntos de daño usando Nocaut Total contra X. ¡X quedó Fuera de Combate!")
+    lines.append("El rival se rindió.")
+    return "\n".join(lines)
+
+
+def test_prompt_context_tags_key_lines_with_original_line_numbers() -> None:
+    log_text = FIXTURE.read_text(encoding="utf-8")
+
+    digest = build_prompt_context(log_text)
+
+    assert "Turn 1 (Kami-Yan, L1-L5):" in digest
+    assert "L2 [STADIUM] Kami-Yan jugó Pueblo Altamía." in digest
+    assert "L3 [SUPPORTER]" in digest
+    assert "L4 [" in digest and "KO" in digest
+    assert "L5 [CONCEDE] El rival se rindió." in digest
+    assert "omitted" not in digest
+
+
+def test_prompt_context_respects_budget_and_keeps_endgame() -> None:
+    log_text = _long_log(200)
+    total_lines = len(log_text.splitlines())
+
+    digest = build_prompt_context(log_text, token_budget=600)
+
+    assert estimate_tokens(digest) <= 600 + estimate_tokens(
+        "(9999 lower-priority lines omitted to fit the prompt budget.)"
+    )
+    assert estimate_tokens(digest) < estimate_tokens(log_text) // 10
+    assert f"L{total_lines} [CONCEDE]" in digest
+    assert f"L{total_lines - 1} [" in digest
+    assert "lower-priority lines omitted" in digest
+    # Stadium lines are the first to go under a tight budget.
+    assert "[STADIUM]" not in digest
+
+
+def test_prompt_context_mode_is_read_from_env() -> None:
+    compact = _runtime_config_from_values({"OPENROUTER_API_KEY": "k"})
+    raw = _runtime_config_from_values(
+        {"POKECOACH_LLM_PROMPT_CONTEXT": "RAW", "POKECOACH_LLM_PROMPT_TOKEN_BUDGET": "900"}
+    )
+    invalid = _runtime_config_from_values({"POKECOACH_LLM_PROMPT_CONTEXT": "tiny"})
+
+    assert compact.prompt_context == "compact"
+    assert raw.prompt_context == "raw"
+    assert raw.prompt_token_budget == 900
+    assert invalid.prompt_context == "compact"
+
+
+def test_select_prompt_log_keeps_short_logs_raw() -> None:
+    short_log = FIXTURE.read_text(encoding="utf-8")
+    long_log = _long_log(40)
+
+    assert select_prompt_log(short_log) == short_log
+    assert select_prompt_log(long_log).startswith("Battle log digest:")
+    assert select_prompt_log(long_log, mode="raw") == long_log
+
+
+def _capture_guidance_log(monkeypatch, config: PydanticAIRuntimeConfig, log_text: str) -> str:
+    captured: dict[str, str] = {}
+
+    def fake_guidance(**kwargs):
+        captured["log_text"] = kwargs["log_text"]
+        return None
+
+    monkeypatch.setattr(report_module, "load_runtime_config", lambda: config)
+    monkeypatch.setattr(report_module, "maybe_generate_guidance", fake_guidance)
+    generate_post_game_report(log_text)
+    return captured["log_text"]
+
+
+def test_report_sends_compact_digest_to_live_llm(monkeypatch) -> None:
+    config = PydanticAIRuntimeConfig(openrouter_api_key="k", openrouter_base_url="https://x", model="m")
+
+    log_text = _long_log(40)
+
+    prompt_log = _capture_guidance_log(monkeypatch, config, log_text)
+
+    assert prompt_log.startswith("Battle log digest:")
+    assert f"L{len(log_text.splitlines())} [CONCEDE]" in prompt_log
+
+
+def test_report_raw_prompt_context_passes_full_log(monkeypatch) -> None:
+    config = PydanticAIRuntimeConfig(
+        openrouter_api_key="k", openrouter_base_url="https://x", model="m", prompt_context="raw"
+    )
+
+    log_text = _long_log(40)
+
+    prompt_log = _capture_guidance_log(monkeypatch, config, log_text)
+
+    assert prompt_log == log_text
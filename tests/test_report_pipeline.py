@@ -1,11 +1,17 @@
+import asyncio
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
+from pokecoach import llm_provider as llm_provider_module
 from pokecoach import report as report_module
 from pokecoach.llm_provider import LLMReportGuidance, PydanticAIRuntimeConfig
-from pokecoach.report import generate_post_game_report
+from pokecoach.report import agenerate_post_game_report, generate_post_game_report
 from pokecoach.schemas import AuditResult, DraftReport, EvidenceSpan, Mistake, PlayBundle, PlayBundleEvent, TurningPoint
 from pokecoach.tools import extract_play_bundles, extract_turn_summary, index_turns
 
@@ -543,3 +549,394 @@ def test_agentic_uses_model_env_vars(monkeypatch) -> None:
     assert report.agentic_telemetry is not None
     assert report.agentic_telemetry["agent_a_model"] == "google/gemini-3-flash-preview"
     assert report.agentic_telemetry["agent_b_model"] == "mistralai/mistral-large-2512"
+
+
+def test_async_report_matches_sync_report_with_guidance(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    guidance = LLMReportGuidance(
+        summary=["B took the first turn.", "s2", "s3", "s4", "s5"],
+        next_actions=["a1", "a2", "a3"],
+    )
+
+    async def fake_async_guidance(**_kwargs) -> LLMReportGuidance:
+        return guidance
+
+    monkeypatch.setattr(report_module, "maybe_generate_guidance", lambda **_kwargs: guidance)
+    monkeypatch.setattr(report_module, "amaybe_generate_guidance", fake_async_guidance)
+
+    assert asyncio.run(agenerate_post_game_report(log_text)) == generate_post_game_report(log_text)
+
+
+def test_async_agentic_report_uses_async_provider_calls(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    monkeypatch.setenv("POKECOACH_AGENTIC_COACH_AUDITOR", "1")
+    monkeypatch.setenv("POKECOACH_INCLUDE_AGENTIC_TELEMETRY", "1")
+    monkeypatch.setattr(
+        report_module,
+        "load_runtime_config",
+        lambda: PydanticAIRuntimeConfig(
+            openrouter_api_key="k",
+            openrouter_base_url="https://openrouter.ai/api/v1",
+            model="baseline/model",
+        ),
+    )
+
+    async def fake_guidance(**_kwargs):
+        return (
+            LLMReportGuidance(summary=[f"s{i}" for i in range(1, 6)], next_actions=["a1", "a2", "a3"]),
+            "draft-raw",
+        )
+
+    async def fake_audit(**_kwargs):
+        return AuditResult(quality_minimum_pass=True, violations=[], patch_plan=[], audit_summary="ok"), "audit-raw"
+
+    monkeypatch.setattr(report_module, "amaybe_generate_guidance_with_raw", fake_guidance)
+    monkeypatch.setattr(report_module, "amaybe_generate_audit_result_with_raw", fake_audit)
+
+    report = asyncio.run(agenerate_post_game_report(log_text))
+
+    assert report.summary == [f"s{i}" for i in range(1, 6)]
+    assert report.agentic_telemetry is not None
+    assert report.agentic_telemetry["agent_a_raw_output"] == "draft-raw"
+    assert report.agentic_telemetry["agent_b_raw_output_first"] == "audit-raw"
+    assert report.agentic_telemetry["audit_status"] == "pass"
+    assert report.agentic_telemetry["llm_cache_hits"] == 0
+    assert report.agentic_telemetry["llm_cache_misses"] == 0
+    assert report.agentic_telemetry["llm_coalesced_requests"] == 0
+    assert report.agentic_telemetry["llm_short_circuited_requests"] == {}
+
+
+def test_agentic_telemetry_reports_llm_cache_hits_on_rerun(monkeypatch, tmp_path) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    monkeypatch.setenv("POKECOACH_AGENTIC_COACH_AUDITOR", "1")
+    monkeypatch.setattr(
+        report_module,
+        "load_runtime_config",
+        lambda: PydanticAIRuntimeConfig(
+            openrouter_api_key="k",
+            openrouter_base_url="https://openrouter.ai/api/v1",
+            model="baseline/model",
+            cache_dir=str(tmp_path),
+        ),
+    )
+    draft_output = '{"summary":["s1","s2","s3","s4","s5"],"next_actions":["a1","a2","a3"]}'
+    audit_output = '{"quality_minimum_pass":true,"violations":[],"patch_plan":[],"audit_summary":"ok"}'
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            return SimpleNamespace(output=audit_output if "Auditor Agent B" in prompt else draft_output)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+
+    first = generate_post_game_report(log_text)
+    second = generate_post_game_report(log_text)
+
+    assert calls["n"] == 2
+    assert first.agentic_telemetry["llm_cache_misses"] == 2
+    assert first.agentic_telemetry["llm_cache_hits"] == 0
+    assert second.agentic_telemetry["llm_cache_hits"] == 2
+    assert second.agentic_telemetry["llm_cache_misses"] == 0
+    assert second.summary == first.summary
+
+
+def test_agentic_shadow_audit_returns_draft_and_records_audit(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    monkeypatch.setenv("POKECOACH_AGENTIC_COACH_AUDITOR", "1")
+    monkeypatch.setenv("POKECOACH_AGENTIC_SHADOW_AUDIT", "1")
+    monkeypatch.setattr(
+        report_module,
+        "load_runtime_config",
+        lambda: PydanticAIRuntimeConfig(
+            openrouter_api_key="k",
+            openrouter_base_url="https://openrouter.ai/api/v1",
+            model="baseline/model",
+        ),
+    )
+    records: list[dict] = []
+    runner = report_module.ShadowAuditRunner([records.append])
+    monkeypatch.setattr(report_module, "_SHADOW_AUDIT_RUNNER", runner)
+
+    def fake_guidance_with_raw(**_kwargs):
+        return (
+            LLMReportGuidance(summary=[f"shadow s{i}" for i in range(1, 6)], next_actions=["a1", "a2", "a3"]),
+            "a-raw",
+        )
+
+    def fake_audit_with_raw(**_kwargs):
+        violation = {
+            "code": "EVIDENCE_MISSING",
+            "severity": "critical",
+            "field": "summary[0]",
+            "message": "m",
+            "suggested_fix": "f",
+        }
+        return AuditResult(quality_minimum_pass=False, violations=[violation], patch_plan=[], audit_summary="x"), "b"
+
+    monkeypatch.setattr(report_module, "maybe_generate_guidance_with_raw", fake_guidance_with_raw)
+    monkeypatch.setattr(report_module, "maybe_generate_audit_result_with_raw", fake_audit_with_raw)
+
+    report = generate_post_game_report(log_text)
+    assert report_module.drain_shadow_audits(timeout=5) is True
+
+    assert report.agentic_telemetry is not None
+    assert report.agentic_telemetry["audit_status"] == "shadow"
+    assert report.agentic_telemetry["rewrite_used"] is False
+    assert len(records) == 1
+    assert records[0]["event_name"] == "shadow_audit_completed"
+    assert records[0]["violations_count"] == 1
+    assert records[0]["agent_b_model"] == "baseline/model"
+    assert records[0]["shadow_audit_id"] == report.agentic_telemetry["shadow_audit_id"]
+
+
+def test_agentic_shadow_audit_records_failure_when_agent_b_gives_no_audit(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="baseline/model",
+    )
+    records: list[dict] = []
+    monkeypatch.setattr(report_module, "_SHADOW_AUDIT_RUNNER", report_module.ShadowAuditRunner([records.append]))
+    monkeypatch.setattr(
+        report_module,
+        "maybe_generate_guidance_with_raw",
+        lambda **_kwargs: (
+            LLMReportGuidance(summary=[f"shadow s{i}" for i in range(1, 6)], next_actions=["a1", "a2", "a3"]),
+            "a-raw",
+        ),
+    )
+    monkeypatch.setattr(report_module, "maybe_generate_audit_result_with_raw", lambda **_kwargs: (None, None))
+
+    options = report_module.ReportOptions(runtime=runtime, agentic_coach_auditor=True, shadow_audit=True)
+    report = generate_post_game_report(log_text, options)
+    assert report_module.drain_shadow_audits(timeout=5) is True
+
+    assert report.summary[0] == "shadow s1"
+    assert len(records) == 1
+    assert records[0]["event_name"] == "shadow_audit_failed"
+    assert records[0]["violations_count"] == 0
+    assert "baseline/model" in records[0]["error"]
+    assert records[0]["shadow_audit_id"] == report.agentic_telemetry["shadow_audit_id"]
+
+
+def test_agentic_deadline_falls_back_and_reports_expired_stages(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    monkeypatch.setenv("POKECOACH_AGENTIC_COACH_AUDITOR", "1")
+    monkeypatch.setattr(
+        report_module,
+        "load_runtime_config",
+        lambda: PydanticAIRuntimeConfig(
+            openrouter_api_key="k",
+            openrouter_base_url="https://openrouter.ai/api/v1",
+            model="slow/model",
+            report_deadline_seconds=0.05,
+        ),
+    )
+    seen_budgets: list[float] = []
+
+    def slow_guidance_with_raw(**kwargs):
+        seen_budgets.append(kwargs["deadline"].remaining())
+        while not kwargs["deadline"].expired:
+            time.sleep(0.01)
+        return None, None
+
+    def audit_with_raw(**kwargs):
+        seen_budgets.append(kwargs["deadline"].remaining())
+        return None, None
+
+    def rewrite(**kwargs):
+        seen_budgets.append(kwargs["deadline"].remaining())
+        return None, None
+
+    monkeypatch.setattr(report_module, "maybe_generate_guidance_with_raw", slow_guidance_with_raw)
+    monkeypatch.setattr(report_module, "maybe_generate_audit_result_with_raw", audit_with_raw)
+    monkeypatch.setattr(report_module, "run_openrouter_structured_json", rewrite)
+
+    report = generate_post_game_report(log_text)
+
+    assert 5 <= len(report.summary) <= 8
+    assert report.agentic_telemetry is not None
+    stages = report.agentic_telemetry["deadline_exceeded_stages"]
+    assert stages[:2] == ["agent_a_draft", "agent_b_audit"]
+    assert all(budget <= 0.05 for budget in seen_budgets)
+    assert seen_budgets[1:] == [0.0] * (len(seen_budgets) - 1)
+
+
+def test_report_without_deadline_miss_has_no_deadline_telemetry(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    monkeypatch.setattr(report_module, "maybe_generate_guidance", lambda **_kwargs: None)
+
+    report = generate_post_game_report(log_text)
+
+    assert report.agentic_telemetry is None
+
+
+def test_report_store_serves_repeat_reports_without_reparsing(monkeypatch, tmp_path) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key=None,
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="baseline/model",
+        report_store_dir=str(tmp_path),
+    )
+    monkeypatch.setattr(report_module, "load_runtime_config", lambda: runtime)
+    parse_calls = {"n": 0}
+    original_parse_log = report_module.parse_log
+
+    def counting_parse_log(log):
+        parse_calls["n"] += 1
+        return original_parse_log(log)
+
+    monkeypatch.setattr(report_module, "parse_log", counting_parse_log)
+
+    first = generate_post_game_report(log_text)
+    second = asyncio.run(agenerate_post_game_report(log_text))
+    assert parse_calls["n"] == 1
+    assert second == first
+
+    monkeypatch.setenv("POKECOACH_AGENTIC_COACH_AUDITOR", "1")
+    generate_post_game_report(log_text)
+    assert parse_calls["n"] == 2
+
+
+def test_report_store_skips_reports_that_fell_back_after_provider_failure(monkeypatch, tmp_path) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="store/flaky-model",
+        report_store_dir=str(tmp_path),
+        circuit_breaker=False,
+    )
+    monkeypatch.setattr(report_module, "load_runtime_config", lambda: runtime)
+    provider = {"up": False, "calls": 0}
+    payload = LLMReportGuidance(summary=[f"s{i}" for i in range(1, 6)], next_actions=["a1", "a2", "a3"])
+
+    class FakeAgent:
+        def __init__(self, _model, output_type, **_kwargs) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, _prompt: str, **_kwargs) -> SimpleNamespace:
+            provider["calls"] += 1
+            if not provider["up"]:
+                raise RuntimeError("503 provider unavailable")
+            return SimpleNamespace(output=payload)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+
+    degraded = generate_post_game_report(log_text)
+    assert degraded.summary != payload.summary
+    assert list(tmp_path.iterdir()) == []
+
+    provider["up"] = True
+    recovered = generate_post_game_report(log_text)
+    calls_after_recovery = provider["calls"]
+    assert recovered.summary[:5] == payload.summary
+    assert generate_post_game_report(log_text) == recovered
+    assert provider["calls"] == calls_after_recovery
+
+
+def test_report_store_does_not_replay_per_run_agentic_telemetry(monkeypatch, tmp_path) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="store/agentic-model",
+        report_store_dir=str(tmp_path),
+    )
+    draft_output = '{"summary":["s1","s2","s3","s4","s5"],"next_actions":["a1","a2","a3"]}'
+    audit_output = '{"quality_minimum_pass":true,"violations":[],"patch_plan":[],"audit_summary":"ok"}'
+    calls = {"n": 0}
+
+    class FakeAgent:
+        def __init__(self, _model, output_type, **_kwargs) -> None:
+            self.output_type = output_type
+
+        def run_sync(self, prompt: str, **_kwargs) -> SimpleNamespace:
+            calls["n"] += 1
+            return SimpleNamespace(output=audit_output if "Auditor Agent B" in prompt else draft_output)
+
+    monkeypatch.setattr(llm_provider_module, "Agent", FakeAgent)
+    agentic = report_module.ReportOptions(runtime=runtime, agentic_coach_auditor=True)
+
+    first = generate_post_game_report(log_text, agentic)
+    served = generate_post_game_report(log_text, agentic)
+    assert calls["n"] == 2
+    assert served.summary == first.summary
+    assert first.agentic_telemetry["llm_model_stats"]["store/agentic-model"]["responses"] == 2
+    assert served.agentic_telemetry["llm_model_stats"] == {}
+    assert served.agentic_telemetry["audit_status"] == first.agentic_telemetry["audit_status"]
+
+    other_endpoint = replace(runtime, openrouter_base_url="https://llm.internal.example/v1")
+    generate_post_game_report(log_text, replace(agentic, runtime=other_endpoint))
+    assert calls["n"] == 4
+
+    detailed = replace(agentic, include_agentic_telemetry=True)
+    generate_post_game_report(log_text, detailed)
+    generate_post_game_report(log_text, detailed)
+    assert calls["n"] == 8
+
+
+def test_report_options_run_mixed_modes_concurrently_without_env(monkeypatch) -> None:
+    log_text = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+    for name in ("POKECOACH_AGENTIC_COACH_AUDITOR", "POKECOACH_INCLUDE_AGENTIC_TELEMETRY", "POKECOACH_AGENT_A_MODEL"):
+        monkeypatch.delenv(name, raising=False)
+
+    def fail_load_runtime_config():
+        raise AssertionError("explicit options must not read the environment")
+
+    monkeypatch.setattr(report_module, "load_runtime_config", fail_load_runtime_config)
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key="k",
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="baseline/model",
+    )
+    agentic = report_module.ReportOptions(
+        runtime=runtime,
+        agentic_coach_auditor=True,
+        include_agentic_telemetry=True,
+        agent_a_model="coach/model",
+    )
+    deterministic = report_module.ReportOptions(runtime=runtime, deterministic_only=True)
+    guidance_keys: list[str | None] = []
+
+    def fake_guidance(**kwargs):
+        guidance_keys.append(kwargs["config"].openrouter_api_key)
+        return None
+
+    def fake_guidance_with_raw(**kwargs):
+        assert kwargs["config"].model == "coach/model"
+        time.sleep(0.01)
+        return (
+            LLMReportGuidance(summary=[f"s{i}" for i in range(1, 6)], next_actions=["a1", "a2", "a3"]),
+            "draft-raw",
+        )
+
+    def fake_audit_with_raw(**_kwargs):
+        return AuditResult(quality_minimum_pass=True, violations=[], patch_plan=[], audit_summary="ok"), "audit-raw"
+
+    monkeypatch.setattr(report_module, "maybe_generate_guidance", fake_guidance)
+    monkeypatch.setattr(report_module, "maybe_generate_guidance_with_raw", fake_guidance_with_raw)
+    monkeypatch.setattr(report_module, "maybe_generate_audit_result_with_raw", fake_audit_with_raw)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(generate_post_game_report, log_text, options)
+            for options in (agentic, deterministic, agentic, deterministic)
+        ]
+        reports = [future.result() for future in futures]
+
+    for report in reports[0::2]:
+        assert report.summary == [f"s{i}" for i in range(1, 6)]
+        assert report.agentic_telemetry is not None
+        assert report.agentic_telemetry["agent_a_model"] == "coach/model"
+        assert report.agentic_telemetry["agent_b_model"] == "baseline/model"
+    for report in reports[1::2]:
+        assert report.agentic_telemetry is None
+    assert reports[1] == reports[3]
+    assert guidance_keys == [None, None]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import os
+import socket
+import sys
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from pokecoach.llm_provider import PydanticAIRuntimeConfig
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+FIXTURE_PATH = REPO_ROOT / "tests" / "golden" / "fixtures" / "compound_single_line_events.txt"
+
+
+def _load_server_module():
+    spec = importlib.util.spec_from_file_location("report_server", REPO_ROOT / "report_server.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["report_server"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _deterministic_options(module):
+    runtime = PydanticAIRuntimeConfig(
+        openrouter_api_key=None,
+        openrouter_base_url="https://openrouter.ai/api/v1",
+        model="baseline/model",
+    )
+    return module.ReportOptions(runtime=runtime, deterministic_only=True)
+
+
+@contextmanager
+def _serving(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@pytest.fixture
+def server_url():
+    module = _load_server_module()
+    options = _deterministic_options(module)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        server = module.ReportServer(("127.0.0.1", 0), executor, workers=2, options=options, max_body_bytes=64 * 1024)
+        with _serving(server) as url:
+            yield url
+
+
+def _render_or_crash(log_text: str, output_format: str, options) -> str:
+    # Runs in a pool worker: a log asking for a crash kills the worker process outright.
+    if "CRASH" in log_text:
+        os._exit(1)
+    return sys.modules["report_server"]._serialize_report(
+        sys.modules["report_server"].generate_post_game_report(log_text, options), output_format
+    )
+
+
+def _request(url: str, body: bytes | None = None) -> tuple[int, str, str]:
+    request = urllib.request.Request(url, data=body, method="POST" if body is not None else "GET")
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, response.headers["Content-Type"], response.read().decode("utf-8")
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.headers["Content-Type"], exc.read().decode("utf-8")
+
+
+def test_server_renders_json_and_markdown_reports(server_url: str) -> None:
+    log_bytes = FIXTURE_PATH.read_bytes()
+
+    status, content_type, body = _request(f"{server_url}/report", log_bytes)
+    assert status == 200
+    assert content_type.startswith("application/json")
+    assert 5 <= len(json.loads(body)["summary"]) <= 8
+
+    status, content_type, body = _request(f"{server_url}/report?format=md", log_bytes)
+    assert status == 200
+    assert content_type.startswith("text/markdown")
+    assert body.startswith("# Post-Game Report")
+
+
+def test_server_rejects_bad_requests_and_reports_metrics(server_url: str) -> None:
+    assert _request(f"{server_url}/report?format=xml", b"log")[0] == 400
+    assert _request(f"{server_url}/report", b"  \n")[0] == 400
+    assert _request(f"{server_url}/report", b"x" * (64 * 1024 + 1))[0] == 413
+    assert _request(f"{server_url}/nope")[0] == 404
+
+    status, _, body = _request(f"{server_url}/healthz")
+    assert status == 200
+    assert json.loads(body) == {"status": "ok", "workers": 2}
+
+    _request(f"{server_url}/report", FIXTURE_PATH.read_bytes())
+    metrics = json.loads(_request(f"{server_url}/metrics")[2])
+    assert metrics["requests_total"] == 1
+    assert metrics["reports_ok"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["latency_ms"]["window"] == 1
+
+
+def test_server_rejects_negative_content_length(server_url: str) -> None:
+    host, port = server_url.removeprefix("http://").split(":")
+    with socket.create_connection((host, int(port)), timeout=5) as conn:
+        conn.sendall(b"POST /report HTTP/1.1\r\nHost: test\r\nContent-Length: -1\r\n\r\n")
+        status_line = conn.makefile("rb").readline()
+
+    assert status_line.split()[1] == b"400"
+
+
+def test_server_replaces_a_process_pool_whose_worker_died(monkeypatch) -> None:
+    module = _load_server_module()
+    monkeypatch.setattr(module, "_render_report", _render_or_crash)
+    server = module.ReportServer(
+        ("127.0.0.1", 0),
+        ProcessPoolExecutor(max_workers=1),
+        workers=1,
+        options=_deterministic_options(module),
+        executor_factory=lambda: ProcessPoolExecutor(max_workers=1),
+    )
+    try:
+        with _serving(server) as url:
+            assert _request(f"{url}/report", b"CRASH")[0] == 503
+            assert _request(f"{url}/healthz")[0] == 200
+
+            status, _, body = _request(f"{url}/report", FIXTURE_PATH.read_bytes())
+            assert status == 200
+            assert 5 <= len(json.loads(body)["summary"]) <= 8
+            metrics = json.loads(_request(f"{url}/metrics")[2])
+            assert metrics["executor_restarts"] == 1
+            assert metrics["reports_failed"] == 1
+    finally:
+        server.executor.shutdown()
+
+
+def test_server_without_executor_factory_reports_unhealthy_after_worker_died(monkeypatch) -> None:
+    module = _load_server_module()
+    monkeypatch.setattr(module, "_render_report", _render_or_crash)
+    executor = ProcessPoolExecutor(max_workers=1)
+    server = module.ReportServer(("127.0.0.1", 0), executor, workers=1, options=_deterministic_options(module))
+    try:
+        with _serving(server) as url:
+            assert _request(f"{url}/report", b"CRASH")[0] == 503
+            assert _request(f"{url}/report", FIXTURE_PATH.read_bytes())[0] == 503
+
+            status, _, body = _request(f"{url}/healthz")
+            assert status == 503
+            assert json.loads(body)["status"] == "broken"
+    finally:
+        executor.shutdown()
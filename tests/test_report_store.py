@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pokecoach.report import generate_post_game_report
+from pokecoach.report_store import ReportStore, log_digest, pipeline_fingerprint
+
+LOG_TEXT = Path("tests/golden/fixtures/compound_single_line_events.txt").read_text(encoding="utf-8")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_store_round_trips_report_by_log_hash_and_fingerprint(tmp_path) -> None:
+    store = ReportStore(tmp_path)
+    report = generate_post_game_report(LOG_TEXT)
+    log_hash = log_digest(LOG_TEXT)
+    fingerprint = pipeline_fingerprint({"live_mode": False})
+
+    assert store.get(log_hash=log_hash, fingerprint=fingerprint) is None
+    store.put(log_hash=log_hash, fingerprint=fingerprint, report=report)
+
+    assert store.get(log_hash=log_hash, fingerprint=fingerprint) == report
+    assert store.get(log_hash=log_digest(LOG_TEXT + "\n"), fingerprint=fingerprint) is None
+    assert store.get(log_hash=log_hash, fingerprint=pipeline_fingerprint({"live_mode": True})) is None
+
+
+def test_pipeline_fingerprint_is_stable_and_tracks_settings() -> None:
+    assert pipeline_fingerprint({"models": ["a"]}) == pipeline_fingerprint({"models": ["a"]})
+    assert pipeline_fingerprint({"models": ["a"]}) != pipeline_fingerprint({"models": ["b"]})
+
+
+def test_store_expires_entries_after_ttl(tmp_path) -> None:
+    clock = _Clock()
+    store = ReportStore(tmp_path, ttl_seconds=60, clock=clock)
+    store.put(log_hash="h", fingerprint="f", report=generate_post_game_report(LOG_TEXT))
+
+    clock.now += 59
+    assert store.get(log_hash="h", fingerprint="f") is not None
+    clock.now += 2
+    assert store.get(log_hash="h", fingerprint="f") is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_store_evicts_least_recently_used_entries_above_max_bytes(tmp_path) -> None:
+    clock = _Clock()
+    report = generate_post_game_report(LOG_TEXT)
+    store = ReportStore(tmp_path, clock=clock)
+    store.put(log_hash="old", fingerprint="f", report=report)
+    entry_size = next(tmp_path.iterdir()).stat().st_size
+
+    clock.now += 10
+    store.put(log_hash="recent", fingerprint="f", report=report)
+    clock.now += 10
+    assert store.get(log_hash="old", fingerprint="f") is not None
+
+    store.max_bytes = entry_size * 2
+    clock.now += 10
+    store.put(log_hash="new", fingerprint="f", report=report)
+
+    assert store.get(log_hash="old", fingerprint="f") is not None
+    assert store.get(log_hash="new", fingerprint="f") is not None
+    assert store.get(log_hash="recent", fingerprint="f") is None
+    assert len(list(tmp_path.iterdir())) == 2
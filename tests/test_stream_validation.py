@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pokecoach.llm_provider import LLMReportGuidance
+from pokecoach.schemas import AuditResult
+from pokecoach.stream_validation import IncrementalJSONValidator, StreamValidationError
+
+GUIDANCE = {"summary": ["s1", "s2", "s3", "s4", "s5"], "next_actions": ["n1", "n2", "n3"]}
+
+
+def _feed_chars(validator: IncrementalJSONValidator, text: str) -> int:
+    for index, char in enumerate(text):
+        try:
+            validator.feed(char)
+        except StreamValidationError:
+            return index
+    return len(text)
+
+
+@pytest.mark.parametrize("text", [json.dumps(GUIDANCE), f"```json\n{json.dumps(GUIDANCE, indent=2)}\n```"])
+def test_valid_guidance_streams_to_completion(text: str) -> None:
+    validator = IncrementalJSONValidator(LLMReportGuidance)
+
+    assert _feed_chars(validator, text) == len(text)
+    assert validator.complete
+
+
+@pytest.mark.parametrize(
+    ("text", "aborted_at"),
+    [
+        ("Sure! Here is the JSON: {", 0),
+        ('{"summary": [], "notes": []}', len('{"summary": [')),
+        ('{"next_actions": ["n1", "n2", "n3"], "notes": []}', len('{"next_actions": ["n1", "n2", "n3"], "notes')),
+        ('{"summary": "one line"', len('{"summary": ')),
+        (
+            json.dumps({"summary": [f"s{i}" for i in range(9)]}),
+            len('{"summary": ["s0", "s1", "s2", "s3", "s4", "s5", "s6", "s7", '),
+        ),
+    ],
+)
+def test_guidance_aborts_at_first_impossible_character(text: str, aborted_at: int) -> None:
+    assert _feed_chars(IncrementalJSONValidator(LLMReportGuidance), text) == aborted_at
+
+
+def test_audit_result_checks_nested_enums_and_required_keys() -> None:
+    bad_code = '{"quality_minimum_pass": false, "violations": [{"code": "MADE_UP", '
+    with pytest.raises(StreamValidationError, match="allowed values"):
+        IncrementalJSONValidator(AuditResult).feed(bad_code)
+
+    missing_summary = '{"quality_minimum_pass": true, "violations": [], "patch_plan": []}'
+    with pytest.raises(StreamValidationError, match="audit_summary"):
+        IncrementalJSONValidator(AuditResult).feed(missing_summary)
+
+    validator = IncrementalJSONValidator(AuditResult)
+    validator.feed('{"quality_minimum_pass": true, "patch_plan": [{"target": "summary[0]", "action": "replace", ')
+    validator.feed('"replacement_source": null, "reason": "r"}], "audit_summary": "ok"}\nDone.')
+    assert validator.complete
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from pokecoach.summary_integrity import apply_summary_claim_integrity, build_ko_claim_index
+
+LOG_LINES = [
+    "Turno de [playerName]",
+    "Alice jugó Mega-Lopunny ex en la Banca.",
+    "El Mega-Lopunny ex de Alice usó Spiky Hopper.",
+    "El Mega-Lopunny ex de Alice infligió 200 puntos de daño.",
+    "¡El (sv8_220) Latias ex de Bob quedó Fuera de Combate!",
+    "",
+    "Turno de [playerName]",
+    "Bob jugó Iono.",
+    "¡El Kirlia de Alice quedó Fuera de Combate!",
+]
+
+
+def test_ko_claim_index_verifies_claims_by_lookup() -> None:
+    index = build_ko_claim_index(LOG_LINES)
+
+    assert [entry.line_idx for entry in index.entries] == [4, 8]
+    assert index.verify_ko_claim(actor="Mega-Lopunny ex", target="Latias ex") == "verified"
+    assert index.verify_ko_claim(actor="Lopunny", target="Latias ex") == "verified"
+    assert index.verify_ko_claim(actor="Bob", target="Kirlia") == "verified"
+    assert index.verify_ko_claim(actor="Mega-Lopunny ex", target="Kirlia") == "target_only"
+    assert index.verify_ko_claim(actor="Mega-Lopunny ex", target="MissingTarget ex") == "missing_target_ko"
+
+
+def test_ko_claim_index_causal_window_stops_at_turn_header() -> None:
+    index = build_ko_claim_index(LOG_LINES)
+
+    kirlia = index.ko_entries_for_target("Kirlia")
+    assert len(kirlia) == 1
+    assert kirlia[0].causal_texts == ("bob jug iono",)
+
+
+def test_apply_summary_claim_integrity_reuses_supplied_index() -> None:
+    index = build_ko_claim_index(LOG_LINES)
+
+    summary, unknowns = apply_summary_claim_integrity(
+        summary=["Mega-Lopunny ex KO Latias ex.", "Mega-Lopunny ex KO MissingTarget ex."],
+        unknowns=[],
+        fallback_summary=["Fallback."],
+        log_text="",
+        spanish_mode=True,
+        claim_index=index,
+    )
+
+    assert summary[0] == "Mega-Lopunny ex KO Latias ex."
+    assert any("MissingTarget ex" in item for item in unknowns)
+    assert set(index._verdicts) == {("mega lopunny ex", "latias ex"), ("mega lopunny ex", "missingtarget ex")}
+
+
+def test_ko_claim_index_matches_long_names_on_whole_tokens() -> None:
+    index = build_ko_claim_index(LOG_LINES)
+
+    assert index.verify_ko_claim(actor="El Mega-Lopunny ex de Alice usó Spiky", target="Latias ex") == "verified"
+    assert index.verify_ko_claim(actor="ega-Lopunny ex de Alice usó Spiky", target="Latias ex") == "target_only"
+    assert index.ko_entries_for_target("El Kirlia de Alice quedó Fuera de Combate")
+    assert index.ko_entries_for_target("irlia de Alice quedó Fuera de Combate") == []